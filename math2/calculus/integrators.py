@@ -39,7 +39,18 @@ def integrate(
         steps: int,
         integrator: Integrator = SimpsonIntegrator(),
 ) -> _I:
-    return sum_(integrator.approx(f, a, b) for a, b in windowed(linspace(xlo, xhi, steps), 2))
+    approximations = (integrator.approx(f, a, b) for a, b in windowed(linspace(xlo, xhi, steps), 2))
+    approximation = next(approximations)
+
+    if isinstance(approximation, Tensor):
+        total = approximation.thaw()
+
+        for other_approximation in approximations:
+            total += other_approximation
+
+        return total.freeze()
+    else:
+        return sum_(approximations, approximation)
 
 
 def double_integrate(
@@ -1,14 +1,32 @@
-from math2.linear.exceptions import DimensionError
-from math2.linear.factories import (column, columns, diagonal_matrix, empty_column, empty_matrix, empty_row,
-                                    empty_vector, full_matrix, full_vector, identity_matrix, one_matrix, one_vector,
-                                    random_matrix, random_vector, row, rows, singleton_matrix, singleton_vector, vector,
-                                    zero_matrix, zero_vector)
+from math2.linear.batches import MatrixBatch, VectorBatch
+from math2.linear.decompositions import (CholeskyDecomposition, EigenDecomposition, LUDecomposition, QRDecomposition,
+                                         lstsq, power_iteration)
+from math2.linear.exceptions import ConvergenceError, DimensionError, SingularityError
+from math2.linear.expressions import LazyTensor
+from math2.linear.factories import (block, column, columns, diagonal_matrix, empty_column, empty_matrix, empty_row,
+                                    empty_vector, full_matrix, full_vector, hstack, identity_matrix, kron, one_matrix,
+                                    one_vector, outer, random_matrix, random_vector, row, rows, singleton_matrix,
+                                    singleton_vector, sparse_diagonal_matrix, sparse_identity_matrix, sparse_matrix,
+                                    sparse_zero_matrix, vector, vstack, zero_matrix, zero_vector)
+from math2.linear.kernels import get_parallelism, set_parallelism
 from math2.linear.matrices import Matrix
-from math2.linear.tensors import Tensor
-from math2.linear.utils import i, j, k, norm
-from math2.linear.vectors import Vector
+from math2.linear.mutables import MutableMatrix, MutableTensor, MutableVector
+from math2.linear.persistence import SharedTensor, load, save
+from math2.linear.solvers import (ILUPreconditioner, JacobiPreconditioner, LinearOperator, Preconditioner, SolverResult,
+                                  bicgstab, cg, gmres)
+from math2.linear.sparse import SparseMatrix
+from math2.linear.tensors import Tensor, broadcast_dimensions, tensordot
+from math2.linear.utils import chain_multiply, i, j, k, norm, normalized, norms
+from math2.linear.vectors import Vec2, Vec3, Vec4, Vector
 
-__all__ = ('DimensionError', 'column', 'columns', 'diagonal_matrix', 'empty_column', 'empty_matrix', 'empty_row',
-           'empty_vector', 'full_matrix', 'full_vector', 'identity_matrix', 'one_matrix', 'one_vector', 'random_matrix',
-           'random_vector', 'row', 'rows', 'singleton_matrix', 'singleton_vector', 'vector', 'zero_matrix',
-           'zero_vector', 'Matrix', 'Tensor', 'i', 'j', 'k', 'norm', 'Vector')
+__all__ = ('MatrixBatch', 'VectorBatch', 'CholeskyDecomposition', 'EigenDecomposition', 'LUDecomposition',
+           'QRDecomposition', 'lstsq', 'power_iteration', 'ConvergenceError', 'DimensionError', 'SingularityError',
+           'LazyTensor', 'block', 'column', 'columns', 'diagonal_matrix', 'empty_column', 'empty_matrix', 'empty_row',
+           'empty_vector', 'full_matrix', 'full_vector', 'hstack', 'identity_matrix', 'kron', 'one_matrix',
+           'one_vector', 'outer', 'random_matrix', 'random_vector', 'row', 'rows', 'singleton_matrix',
+           'singleton_vector', 'sparse_diagonal_matrix', 'sparse_identity_matrix', 'sparse_matrix',
+           'sparse_zero_matrix', 'vector', 'vstack', 'zero_matrix', 'zero_vector', 'get_parallelism', 'set_parallelism',
+           'Matrix', 'MutableMatrix', 'MutableTensor', 'MutableVector', 'SharedTensor', 'load', 'save',
+           'ILUPreconditioner', 'JacobiPreconditioner', 'LinearOperator', 'Preconditioner', 'SolverResult', 'bicgstab',
+           'cg', 'gmres', 'SparseMatrix', 'Tensor', 'broadcast_dimensions', 'tensordot', 'chain_multiply', 'i', 'j',
+           'k', 'norm', 'normalized', 'norms', 'Vec2', 'Vec3', 'Vec4', 'Vector')
@@ -0,0 +1,553 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Hashable, Iterable, Iterator, Sized
+from typing import Any, Final, Literal, Optional, Union, overload
+
+import numpy as np
+
+from math2.linear.exceptions import DimensionError, SingularityError
+from math2.linear.matrices import Matrix
+from math2.linear.vectors import Vector, vector_type
+
+
+class VectorBatch(Sized, Hashable):
+    __slots__ = '_values', '_hash'
+    __array_ufunc__ = None
+
+    def __init__(self, vectors: Iterable[Iterable[float]], dimension: Optional[int] = None):
+        try:
+            if isinstance(vectors, np.ndarray):
+                values = np.array(vectors, float)
+            else:
+                values = np.array([tuple(vector) for vector in vectors], float)
+        except ValueError:
+            raise DimensionError('The vectors of a batch should have identical dimensions')
+
+        if values.ndim != 2:
+            if values.size or dimension is None:
+                raise DimensionError('The vectors of a batch should have identical dimensions')
+
+            values = values.reshape(0, dimension)
+        elif dimension is not None and values.shape[1] != dimension:
+            raise DimensionError('The vectors do not fit the dimension')
+
+        self._values = np.ascontiguousarray(values.T)
+        self._values.flags.writeable = False
+        self._hash: Optional[int] = None
+
+    @classmethod
+    def _wrap(cls, values: np.ndarray[Any, Any]) -> VectorBatch:
+        batch = cls.__new__(cls)
+        batch._values = values
+        batch._values.flags.writeable = False
+        batch._hash = None
+
+        return batch
+
+    @property
+    def dimension(self) -> int:
+        return int(self._values.shape[0])
+
+    @property
+    def norms(self) -> Vector:
+        return _vector(np.sqrt(np.einsum('ij,ij->j', self._values, self._values)))
+
+    @property
+    def unit(self) -> VectorBatch:
+        return self._wrap(self._values / np.sqrt(np.einsum('ij,ij->j', self._values, self._values)))
+
+    @property
+    def x(self) -> Vector:
+        return self._component(0)
+
+    @property
+    def y(self) -> Vector:
+        return self._component(1)
+
+    @property
+    def z(self) -> Vector:
+        return self._component(2)
+
+    @property
+    def w(self) -> Vector:
+        return self._component(3)
+
+    def _component(self, i: int) -> Vector:
+        return _vector(self._values[i] if i < self.dimension else np.zeros(len(self)))
+
+    def _operand(self, other: Union[VectorBatch, Vector]) -> np.ndarray[Any, Any]:
+        if isinstance(other, VectorBatch):
+            if len(self) != len(other):
+                raise DimensionError('Pairwise operations require batches of identical lengths')
+
+            values = other._values
+        else:
+            values = np.asarray(other, float).reshape(-1, 1)
+
+        if self.dimension != values.shape[0]:
+            raise DimensionError('Vector operations require identical dimensions')
+
+        return values
+
+    def dot(self, other: Union[VectorBatch, Vector]) -> Vector:
+        return _vector(np.einsum('ij,ij->j', *np.broadcast_arrays(self._values, self._operand(other))))
+
+    def parallel_to(self, other: Union[VectorBatch, Vector]) -> tuple[bool, ...]:
+        values = self._operand(other)
+        products = np.sqrt(np.sum(self._values ** 2, 0) * np.sum(values ** 2, 0))
+
+        return tuple(np.isclose(np.abs(np.sum(self._values * values, 0)), products, 1e-9, 0).tolist())
+
+    def orthogonal_to(self, other: Union[VectorBatch, Vector]) -> tuple[bool, ...]:
+        return tuple((np.sum(self._values * self._operand(other), 0) == 0).tolist())
+
+    def cross(self, other: Union[VectorBatch, Vector]) -> VectorBatch:
+        values = self._operand(other)
+
+        if not 2 <= self.dimension <= 3:
+            raise DimensionError('Calculating the cross product requires all vectors to have a length of 2 or 3')
+
+        return self._wrap(np.cross(_extended(self._values), _extended(values), axis=0))
+
+    def angle_between(self, other: Union[VectorBatch, Vector]) -> Vector:
+        values = self._operand(other)
+        cosines = np.sum(self._values * values, 0) / np.sqrt(np.sum(self._values ** 2, 0) * np.sum(values ** 2, 0))
+
+        return _vector(np.arccos(cosines))
+
+    def projection_on(self, other: Union[VectorBatch, Vector]) -> VectorBatch:
+        values = self._operand(other)
+
+        return self._wrap(np.sum(self._values * values, 0) / np.sum(values ** 2, 0) * values)
+
+    def __pos__(self) -> VectorBatch:
+        return self
+
+    def __neg__(self) -> VectorBatch:
+        return self._wrap(-self._values)
+
+    def __add__(self, other: Union[VectorBatch, Vector]) -> VectorBatch:
+        if not isinstance(other, (VectorBatch, Vector)):
+            return NotImplemented
+
+        return self._wrap(self._values + self._operand(other))
+
+    def __radd__(self, other: Vector) -> VectorBatch:
+        return self + other
+
+    def __sub__(self, other: Union[VectorBatch, Vector]) -> VectorBatch:
+        if not isinstance(other, (VectorBatch, Vector)):
+            return NotImplemented
+
+        return self._wrap(self._values - self._operand(other))
+
+    def __rsub__(self, other: Vector) -> VectorBatch:
+        return -self + other
+
+    def __mul__(self, other: Union[float, Vector]) -> VectorBatch:
+        if isinstance(other, Vector):
+            if other.dimension != len(self):
+                raise DimensionError('Scaling a batch requires one scalar per vector')
+
+            return self._wrap(self._values * np.asarray(other, float))
+        elif isinstance(other, (int, float)):
+            return self._wrap(self._values * other)
+        else:
+            return NotImplemented
+
+    def __rmul__(self, other: Union[float, Vector]) -> VectorBatch:
+        return self * other
+
+    def __truediv__(self, other: Union[float, Vector]) -> VectorBatch:
+        if isinstance(other, Vector):
+            if other.dimension != len(self):
+                raise DimensionError('Scaling a batch requires one scalar per vector')
+
+            return self._wrap(self._values / np.asarray(other, float))
+        elif isinstance(other, (int, float)):
+            return self._wrap(self._values / other)
+        else:
+            return NotImplemented
+
+    def __matmul__(self, other: Union[VectorBatch, Vector]) -> Vector:
+        if not isinstance(other, (VectorBatch, Vector)):
+            return NotImplemented
+
+        return self.dot(other)
+
+    def __rmatmul__(self, other: Vector) -> Vector:
+        return self @ other
+
+    def __array__(self, dtype: Optional[Any] = None, copy: Optional[bool] = None) -> np.ndarray[Any, Any]:
+        if (dtype is None or np.dtype(dtype) == np.float64) and not copy:
+            return self._values
+        else:
+            return np.array(self._values, dtype)
+
+    @overload
+    def __getitem__(self, i: int) -> Vector:
+        ...
+
+    @overload
+    def __getitem__(self, s: slice) -> VectorBatch:
+        ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[Vector, VectorBatch]:
+        if isinstance(i, slice):
+            return self._wrap(self._values[:, i])
+
+        return _vector(self._values[:, i])
+
+    def __iter__(self) -> Iterator[Vector]:
+        for values in self._values.T:
+            yield _vector(values)
+
+    def __len__(self) -> int:
+        return int(self._values.shape[1])
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, VectorBatch):
+            return self._values.shape == other._values.shape and bool(np.array_equal(self._values, other._values))
+        else:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'VectorBatch({[tuple(vector) for vector in self]}, {self.dimension})'
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._values.shape) ^ hash(self._values.tobytes())
+
+        return self._hash
+
+
+class MatrixBatch(Sized, Hashable):
+    __slots__ = '_values', '_hash'
+    __array_ufunc__ = None
+
+    def __init__(self, matrices: Iterable[Iterable[float]], dimensions: Optional[Iterable[int]] = None):
+        dimensions = None if dimensions is None else tuple(dimensions)
+
+        try:
+            if isinstance(matrices, np.ndarray):
+                values = np.array(matrices, float)
+            else:
+                values = np.array([np.asarray(matrix, float) for matrix in matrices], float)
+        except ValueError:
+            raise DimensionError('The matrices of a batch should have identical dimensions')
+
+        if values.ndim != 3:
+            if values.size or dimensions is None:
+                raise DimensionError('The matrices of a batch should have identical dimensions')
+
+            values = values.reshape(0, *dimensions)
+        elif dimensions is not None and values.shape[1:] != dimensions:
+            raise DimensionError('The matrices do not fit the dimensions')
+
+        self._values = np.ascontiguousarray(values.transpose(1, 2, 0))
+        self._values.flags.writeable = False
+        self._hash: Optional[int] = None
+
+    @classmethod
+    def _wrap(cls, values: np.ndarray[Any, Any]) -> MatrixBatch:
+        batch = cls.__new__(cls)
+        batch._values = values
+        batch._values.flags.writeable = False
+        batch._hash = None
+
+        return batch
+
+    @property
+    def dimensions(self) -> tuple[int, int]:
+        return int(self._values.shape[0]), int(self._values.shape[1])
+
+    @property
+    def row_dimension(self) -> int:
+        return self.dimensions[0]
+
+    @property
+    def column_dimension(self) -> int:
+        return self.dimensions[1]
+
+    @property
+    def determinants(self) -> Vector:
+        if not self.is_square():
+            raise DimensionError('Only square matrices have determinants')
+
+        return _vector(_determinants(self._values))
+
+    @property
+    def inverse(self) -> MatrixBatch:
+        if not self.is_square():
+            raise DimensionError('Only square matrices can be inverted')
+
+        n = self.row_dimension
+
+        if n == 4:
+            return self._wrap(_inverse4(self._values))
+        elif 0 < n < 4:
+            determinants, adjugate = _adjugate(self._values)
+        else:
+            determinants = _determinants(self._values)
+
+        if not determinants.all():
+            raise SingularityError('The batch contains singular matrices')
+        elif 0 < n < 4:
+            return self._wrap(adjugate / determinants)
+        else:
+            return self._wrap(np.linalg.inv(self._values.transpose(2, 0, 1)).transpose(1, 2, 0).copy())
+
+    def is_square(self) -> bool:
+        return self.row_dimension == self.column_dimension
+
+    def __pow__(self, power: Literal['T']) -> MatrixBatch:
+        if power == 'T':
+            return self._wrap(np.ascontiguousarray(self._values.transpose(1, 0, 2)))
+
+        return NotImplemented
+
+    def __pos__(self) -> MatrixBatch:
+        return self
+
+    def __neg__(self) -> MatrixBatch:
+        return self._wrap(-self._values)
+
+    def __add__(self, other: Union[MatrixBatch, Matrix]) -> MatrixBatch:
+        if not isinstance(other, (MatrixBatch, Matrix)):
+            return NotImplemented
+
+        return self._wrap(self._values + self._operand(other, self.dimensions))
+
+    def __radd__(self, other: Matrix) -> MatrixBatch:
+        return self + other
+
+    def __sub__(self, other: Union[MatrixBatch, Matrix]) -> MatrixBatch:
+        if not isinstance(other, (MatrixBatch, Matrix)):
+            return NotImplemented
+
+        return self._wrap(self._values - self._operand(other, self.dimensions))
+
+    def __rsub__(self, other: Matrix) -> MatrixBatch:
+        return -self + other
+
+    @overload
+    def __mul__(self, other: Union[float, MatrixBatch, Matrix]) -> MatrixBatch:
+        ...
+
+    @overload
+    def __mul__(self, other: Union[VectorBatch, Vector]) -> VectorBatch:
+        ...
+
+    def __mul__(self, other: Any) -> Union[MatrixBatch, VectorBatch]:
+        if isinstance(other, (MatrixBatch, Matrix)):
+            values = self._operand(other, (self.column_dimension, other.dimensions[1]))
+
+            return self._wrap(_matmul(self._values, values))
+        elif isinstance(other, (VectorBatch, Vector)):
+            if isinstance(other, VectorBatch):
+                if len(self) != len(other):
+                    raise DimensionError('Pairwise operations require batches of identical lengths')
+
+                values = other._values[:, None]
+            else:
+                values = np.asarray(other, float).reshape(-1, 1, 1)
+
+            if self.column_dimension != values.shape[0]:
+                raise DimensionError('The matrices and the vectors do not have valid dimensions for multiplication')
+
+            return VectorBatch._wrap(np.ascontiguousarray(_matmul(self._values, values)[:, 0]))
+        elif isinstance(other, (int, float)):
+            return self._wrap(self._values * other)
+        else:
+            return NotImplemented
+
+    def __rmul__(self, other: Union[float, Matrix]) -> MatrixBatch:
+        if isinstance(other, Matrix):
+            return self._wrap(_matmul(self._operand(other, (other.row_dimension, self.row_dimension)), self._values))
+        elif isinstance(other, (int, float)):
+            return self * other
+        else:
+            return NotImplemented
+
+    def __truediv__(self, other: float) -> MatrixBatch:
+        if isinstance(other, (int, float)):
+            return self._wrap(self._values / other)
+        else:
+            return NotImplemented
+
+    def _operand(self, other: Union[MatrixBatch, Matrix], dimensions: tuple[int, int]) -> np.ndarray[Any, Any]:
+        if isinstance(other, MatrixBatch):
+            if len(self) != len(other):
+                raise DimensionError('Pairwise operations require batches of identical lengths')
+
+            values = other._values
+        else:
+            values = np.asarray(other, float)[..., None]
+
+        if values.shape[:2] != dimensions:
+            raise DimensionError('The matrices do not have valid dimensions for the operation')
+
+        return values
+
+    def __array__(self, dtype: Optional[Any] = None, copy: Optional[bool] = None) -> np.ndarray[Any, Any]:
+        values = self._values.transpose(2, 0, 1)
+
+        if (dtype is None or np.dtype(dtype) == np.float64) and not copy:
+            return values
+        else:
+            return np.array(values, dtype)
+
+    @overload
+    def __getitem__(self, i: int) -> Matrix:
+        ...
+
+    @overload
+    def __getitem__(self, s: slice) -> MatrixBatch:
+        ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[Matrix, MatrixBatch]:
+        if isinstance(i, slice):
+            return self._wrap(self._values[:, :, i])
+
+        return _matrix(self._values[:, :, i])
+
+    def __iter__(self) -> Iterator[Matrix]:
+        for i in range(len(self)):
+            yield _matrix(self._values[:, :, i])
+
+    def __len__(self) -> int:
+        return int(self._values.shape[2])
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, MatrixBatch):
+            return self._values.shape == other._values.shape and bool(np.array_equal(self._values, other._values))
+        else:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'MatrixBatch({[tuple(matrix) for matrix in self]}, {self.dimensions})'
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._values.shape) ^ hash(self._values.tobytes())
+
+        return self._hash
+
+
+_CLOSED_FORM_LIMIT: Final = 4
+
+
+def _vector(values: np.ndarray[Any, Any]) -> Vector:
+    result = array('d', bytes(8 * len(values)))
+    np.copyto(np.frombuffer(result), values)
+
+    return vector_type(len(values))._wrap(result, (len(values),))
+
+
+def _extended(values: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    return values if values.shape[0] == 3 else np.concatenate((values, np.zeros((1, values.shape[1]))))
+
+
+def _matrix(values: np.ndarray[Any, Any]) -> Matrix:
+    result = array('d', bytes(8 * values.size))
+    np.copyto(np.frombuffer(result).reshape(values.shape), values)
+
+    return Matrix._wrap(result, values.shape)
+
+
+def _matmul(a: np.ndarray[Any, Any], b: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    if not (a.shape[0] and a.shape[1] and b.shape[1]):
+        return np.zeros((a.shape[0], b.shape[1], max(a.shape[2], b.shape[2]) if min(a.shape[2], b.shape[2]) else 0))
+    elif a.shape[1] > _CLOSED_FORM_LIMIT:
+        a, b = np.broadcast_arrays(a[:, :, None], b[None])
+
+        return np.ascontiguousarray(np.einsum('ikjn,ikjn->ijn', a, b))
+
+    return np.array([[sum(a[i, k] * b[k, j] for k in range(a.shape[1])) for j in range(b.shape[1])]
+                     for i in range(a.shape[0])])
+
+
+def _determinants(a: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    n = len(a)
+    result: np.ndarray[Any, Any]
+
+    if n == 0:
+        result = np.ones(a.shape[2])
+    elif n == 1:
+        result = a[0, 0].copy()
+    elif n == 2:
+        result = a[0, 0] * a[1, 1] - a[0, 1] * a[1, 0]
+    elif n == 3:
+        result = _adjugate(a)[0]
+    elif n == 4:
+        result = _minors4(a)[0]
+    else:
+        result = np.linalg.det(a.transpose(2, 0, 1))
+
+    return result
+
+
+def _adjugate(a: np.ndarray[Any, Any]) -> tuple[np.ndarray[Any, Any], np.ndarray[Any, Any]]:
+    n = len(a)
+
+    if n == 1:
+        return a[0, 0].copy(), np.ones_like(a)
+    elif n == 2:
+        return _determinants(a), np.array([[a[1, 1], -a[0, 1]], [-a[1, 0], a[0, 0]]])
+
+    cofactors = list[list[np.ndarray[Any, Any]]]()
+
+    for i in range(3):
+        i1, i2 = (i + 1) % 3, (i + 2) % 3
+        cofactors.append([a[i1, j1] * a[i2, j2] - a[i1, j2] * a[i2, j1] for j1, j2 in ((1, 2), (2, 0), (0, 1))])
+
+    determinants = a[0, 0] * cofactors[0][0] + a[0, 1] * cofactors[0][1] + a[0, 2] * cofactors[0][2]
+
+    return determinants, np.array(cofactors).transpose(1, 0, 2)
+
+
+def _minors4(a: np.ndarray[Any, Any]) -> tuple[np.ndarray[Any, Any], list[Any], list[Any]]:
+    pairs = (0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)
+    s = [a[0, i] * a[1, j] - a[1, i] * a[0, j] for i, j in pairs]
+    c = [a[2, i] * a[3, j] - a[3, i] * a[2, j] for i, j in pairs]
+    determinants = s[0] * c[5] - s[1] * c[4] + s[2] * c[3] + s[3] * c[2] - s[4] * c[1] + s[5] * c[0]
+
+    return determinants, s, c
+
+
+def _inverse4(a: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    determinants, s, c = _minors4(a)
+
+    if not determinants.all():
+        raise SingularityError('The batch contains singular matrices')
+
+    adjugate = np.array([
+        [
+            a[1, 1] * c[5] - a[1, 2] * c[4] + a[1, 3] * c[3],
+            -a[0, 1] * c[5] + a[0, 2] * c[4] - a[0, 3] * c[3],
+            a[3, 1] * s[5] - a[3, 2] * s[4] + a[3, 3] * s[3],
+            -a[2, 1] * s[5] + a[2, 2] * s[4] - a[2, 3] * s[3],
+        ],
+        [
+            -a[1, 0] * c[5] + a[1, 2] * c[2] - a[1, 3] * c[1],
+            a[0, 0] * c[5] - a[0, 2] * c[2] + a[0, 3] * c[1],
+            -a[3, 0] * s[5] + a[3, 2] * s[2] - a[3, 3] * s[1],
+            a[2, 0] * s[5] - a[2, 2] * s[2] + a[2, 3] * s[1],
+        ],
+        [
+            a[1, 0] * c[4] - a[1, 1] * c[2] + a[1, 3] * c[0],
+            -a[0, 0] * c[4] + a[0, 1] * c[2] - a[0, 3] * c[0],
+            a[3, 0] * s[4] - a[3, 1] * s[2] + a[3, 3] * s[0],
+            -a[2, 0] * s[4] + a[2, 1] * s[2] - a[2, 3] * s[0],
+        ],
+        [
+            -a[1, 0] * c[3] + a[1, 1] * c[1] - a[1, 2] * c[0],
+            a[0, 0] * c[3] - a[0, 1] * c[1] + a[0, 2] * c[0],
+            -a[3, 0] * s[3] + a[3, 1] * s[1] - a[3, 2] * s[0],
+            a[2, 0] * s[3] - a[2, 1] * s[1] + a[2, 2] * s[0],
+        ],
+    ])
+    result: np.ndarray[Any, Any] = adjugate / determinants
+
+    return result
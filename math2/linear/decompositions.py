@@ -0,0 +1,587 @@
+from __future__ import annotations
+
+from array import array
+from cmath import sqrt as csqrt
+from collections.abc import Callable, Iterable, Iterator
+from math import copysign, hypot, prod, sqrt
+from operator import mul
+from random import Random
+from typing import Any, Final, Optional, Union, overload
+from warnings import catch_warnings, simplefilter
+
+import numpy as np
+from auxiliary import flattened, product
+from scipy.linalg import (LinAlgError, LinAlgWarning, cho_factor, cho_solve, lu_factor, lu_solve, qr,
+                          solve_triangular)
+
+from math2.linear.exceptions import ConvergenceError, DimensionError, SingularityError
+from math2.linear.factories import identity_matrix
+from math2.linear.matrices import Matrix
+from math2.linear.vectors import Vector, vector_type
+
+_EPSILON: Final = 2.220446049250313e-16
+_TOLERANCE: Final = 1e-10
+_INVERSE_ITERATION_COUNT: Final = 3
+_MAX_QR_ITERATIONS: Final = 1000
+_MAX_JACOBI_SWEEPS: Final = 100
+
+
+class LUDecomposition:
+    def __init__(self, matrix: Matrix):
+        if not matrix.is_square():
+            raise DimensionError('LU decomposition requires a square matrix')
+
+        self.dimension = matrix.row_dimension
+        self._packed = matrix.is_packed()
+
+        if self._packed:
+            with catch_warnings():
+                simplefilter('ignore', LinAlgWarning)
+
+                self._lu, self._pivots = lu_factor(np.asarray(matrix), check_finite=False)
+
+            self._diagonal = tuple(map(float, self._lu.diagonal()))
+            self._sign = (-1) ** int(np.count_nonzero(self._pivots != np.arange(self.dimension)))
+        else:
+            rows = [list(row) for row in matrix.rows]
+            permutation = list(range(self.dimension))
+            sign = 1
+
+            for k in range(self.dimension):
+                pivot_index = max(range(k, self.dimension), key=lambda i: abs(rows[i][k]))
+
+                if not rows[pivot_index][k]:
+                    continue
+                elif pivot_index != k:
+                    rows[k], rows[pivot_index] = rows[pivot_index], rows[k]
+                    permutation[k], permutation[pivot_index] = permutation[pivot_index], permutation[k]
+                    sign = -sign
+
+                pivot_row = rows[k]
+
+                for row in rows[k + 1:]:
+                    if row[k]:
+                        factor = row[k] = row[k] / pivot_row[k]
+                        row[k + 1:] = (x - factor * y for x, y in zip(row[k + 1:], pivot_row[k + 1:]))
+
+            self._rows = rows
+            self._permutation = permutation
+            self._diagonal = tuple(rows[k][k] for k in range(self.dimension))
+            self._sign = sign
+
+    @property
+    def determinant(self) -> float:
+        determinant: float = self._sign * prod(self._diagonal)
+
+        return determinant
+
+    @property
+    def inverse(self) -> Matrix:
+        identity = identity_matrix(self.dimension)
+
+        return self.solve(identity.packed if self._packed else identity)
+
+    def is_singular(self) -> bool:
+        return not all(self._diagonal)
+
+    @overload
+    def solve(self, b: Vector) -> Vector:
+        ...
+
+    @overload
+    def solve(self, b: Matrix) -> Matrix:
+        ...
+
+    def solve(self, b: Union[Vector, Matrix]) -> Union[Vector, Matrix]:
+        if b.dimensions[0] != self.dimension:
+            raise DimensionError('The right-hand side does not match the dimension of the system')
+        elif self.is_singular():
+            raise SingularityError('The system is singular')
+
+        if self._packed:
+            values = array('d', bytes(8 * len(b)))
+            np.frombuffer(values).reshape(b.dimensions)[...] = lu_solve(
+                (self._lu, self._pivots),
+                np.asarray(b, float),
+                check_finite=False,
+            )
+
+            return _wrap_solution(values, b.dimensions)
+        else:
+            return _solve_columns(self._substitute, b)
+
+    def _substitute(self, b: Any) -> list[Any]:
+        rows = self._rows
+        x = [b[i] for i in self._permutation]
+
+        for i in range(self.dimension):
+            x[i] -= sum(rows[i][j] * x[j] for j in range(i))
+
+        for i in reversed(range(self.dimension)):
+            x[i] = (x[i] - sum(rows[i][j] * x[j] for j in range(i + 1, self.dimension))) / rows[i][i]
+
+        return x
+
+
+class CholeskyDecomposition:
+    def __init__(self, matrix: Matrix):
+        if not matrix.is_square():
+            raise DimensionError('Cholesky decomposition requires a square matrix')
+
+        self.dimension = matrix.row_dimension
+        self._packed = matrix.is_packed()
+
+        if self._packed:
+            try:
+                self._factor, _ = cho_factor(np.asarray(matrix), True, check_finite=False)
+            except LinAlgError:
+                raise SingularityError('Cholesky decomposition requires a positive-definite matrix')
+        else:
+            rows = [list(row) for row in matrix.rows]
+            lower = [[0.0] * self.dimension for _ in range(self.dimension)]
+
+            for j in range(self.dimension):
+                pivot = rows[j][j] - sum(value * value for value in lower[j][:j])
+
+                if not pivot > 0:
+                    raise SingularityError('Cholesky decomposition requires a positive-definite matrix')
+
+                lower[j][j] = sqrt(pivot)
+
+                for i in range(j + 1, self.dimension):
+                    lower[i][j] = (rows[i][j] - sum(map(mul, lower[i][:j], lower[j][:j]))) / lower[j][j]
+
+            self._rows = lower
+
+    @property
+    def lower(self) -> Matrix:
+        if self._packed:
+            return Matrix._wrap(array('d', np.tril(self._factor).tobytes()), (self.dimension, self.dimension))
+        else:
+            return Matrix._wrap(tuple(flattened(self._rows)), (self.dimension, self.dimension))
+
+    @overload
+    def solve(self, b: Vector) -> Vector:
+        ...
+
+    @overload
+    def solve(self, b: Matrix) -> Matrix:
+        ...
+
+    def solve(self, b: Union[Vector, Matrix]) -> Union[Vector, Matrix]:
+        if b.dimensions[0] != self.dimension:
+            raise DimensionError('The right-hand side does not match the dimension of the system')
+
+        if self._packed:
+            values = array('d', bytes(8 * len(b)))
+            np.frombuffer(values).reshape(b.dimensions)[...] = cho_solve(
+                (self._factor, True),
+                np.asarray(b, float),
+                check_finite=False,
+            )
+
+            return _wrap_solution(values, b.dimensions)
+        else:
+            return _solve_columns(self._substitute, b)
+
+    def _substitute(self, b: Any) -> list[Any]:
+        rows = self._rows
+        x = list(b)
+
+        for i in range(self.dimension):
+            x[i] = (x[i] - sum(rows[i][j] * x[j] for j in range(i))) / rows[i][i]
+
+        for i in reversed(range(self.dimension)):
+            x[i] = (x[i] - sum(rows[j][i] * x[j] for j in range(i + 1, self.dimension))) / rows[i][i]
+
+        return x
+
+
+class QRDecomposition:
+    def __init__(self, matrix: Matrix):
+        self.dimensions = matrix.dimensions
+        m, n = matrix.dimensions
+        self._packed = matrix.is_packed()
+
+        if self._packed:
+            self._q, self._r = qr(np.asarray(matrix), mode='economic', check_finite=False)
+            self._diagonal = tuple(map(float, self._r.diagonal()))
+        else:
+            rows = [list(row) for row in matrix.rows]
+            reflectors = list[tuple[int, list[Any], Any]]()
+
+            for k in range(min(m, n)):
+                x = [rows[i][k] for i in range(k, m)]
+                v = x[:]
+                v[0] += copysign(hypot(*x), x[0])
+                scale = sum(value * value for value in v)
+
+                if not scale:
+                    continue
+
+                reflectors.append((k, v, scale))
+
+                for j in range(k, n):
+                    factor = 2 * sum(v[i - k] * rows[i][j] for i in range(k, m)) / scale
+
+                    for i in range(k, m):
+                        rows[i][j] -= factor * v[i - k]
+
+            self._rows = [[value if i <= j else 0 for j, value in enumerate(row)] for i, row in enumerate(rows[:n])]
+            self._reflectors = reflectors
+            self._diagonal = tuple(self._rows[k][k] for k in range(min(m, n)))
+
+    @property
+    def q(self) -> Matrix:
+        m, n = self.dimensions
+        k = min(m, n)
+
+        if self._packed:
+            return Matrix._wrap(array('d', np.ascontiguousarray(self._q).tobytes()), (m, k))
+
+        columns = [self._reflect([int(i == j) for i in range(m)], reversed(self._reflectors)) for j in range(k)]
+
+        return Matrix._wrap(tuple(column[i] for i in range(m) for column in columns), (m, k))
+
+    @property
+    def r(self) -> Matrix:
+        m, n = self.dimensions
+
+        if self._packed:
+            return Matrix._wrap(array('d', np.ascontiguousarray(self._r).tobytes()), (min(m, n), n))
+        else:
+            return Matrix._wrap(tuple(flattened(self._rows)), (min(m, n), n))
+
+    def is_rank_deficient(self) -> bool:
+        threshold = _EPSILON * max(self.dimensions) * max(map(abs, self._diagonal), default=0)
+
+        return self.dimensions[0] < self.dimensions[1] or any(abs(value) <= threshold for value in self._diagonal)
+
+    @overload
+    def solve(self, b: Vector) -> Vector:
+        ...
+
+    @overload
+    def solve(self, b: Matrix) -> Matrix:
+        ...
+
+    def solve(self, b: Union[Vector, Matrix]) -> Union[Vector, Matrix]:
+        m, n = self.dimensions
+
+        if b.dimensions[0] != m:
+            raise DimensionError('The right-hand side does not match the dimension of the system')
+        elif self.is_rank_deficient():
+            raise SingularityError('Least squares requires a matrix of full column rank')
+
+        dimensions = (n, *b.dimensions[1:])
+
+        if self._packed:
+            values = array('d', bytes(8 * product(dimensions, 1)))
+            np.frombuffer(values).reshape(dimensions)[...] = solve_triangular(
+                self._r,
+                self._q.T @ np.asarray(b, float),
+                check_finite=False,
+            )
+
+            return _wrap_solution(values, dimensions)
+        else:
+            return _solve_columns(self._substitute, b, n)
+
+    def _reflect(self, b: list[Any], reflectors: Iterable[tuple[int, list[Any], Any]]) -> list[Any]:
+        for k, v, scale in reflectors:
+            factor = 2 * sum(map(mul, v, b[k:])) / scale
+            b[k:] = (value - factor * v_value for value, v_value in zip(b[k:], v))
+
+        return b
+
+    def _substitute(self, b: Any) -> list[Any]:
+        n = self.dimensions[1]
+        rows = self._rows
+        x = self._reflect(list(b), self._reflectors)[:n]
+
+        for i in reversed(range(n)):
+            x[i] = (x[i] - sum(rows[i][j] * x[j] for j in range(i + 1, n))) / rows[i][i]
+
+        return x
+
+
+class EigenDecomposition:
+    def __init__(self, matrix: Matrix):
+        if not matrix.is_square():
+            raise DimensionError('Eigendecomposition requires a square matrix')
+
+        self.dimension = matrix.row_dimension
+        self._matrix = matrix
+        self._eigenvectors: list[Optional[Vector]] = [None] * self.dimension
+
+        if matrix == matrix ** 'T':
+            if matrix.is_packed():
+                values, vectors = np.linalg.eigh(np.asarray(matrix))
+                eigenvalues = list(map(float, values))
+                eigenvectors = [
+                    vector_type(self.dimension)._wrap(array('d', vector), (self.dimension,)) for vector in vectors.T
+                ]
+            else:
+                eigenvalues, eigenvectors = _jacobi([list(map(float, row)) for row in matrix.rows])
+
+            order = sorted(range(self.dimension), key=lambda i: (-abs(eigenvalues[i]), -eigenvalues[i]))
+            self.eigenvalues: tuple[complex, ...] = tuple(eigenvalues[i] for i in order)
+            self._eigenvectors = [eigenvectors[i] for i in order]
+        else:
+            if matrix.is_packed():
+                spectrum = list(map(complex, np.linalg.eigvals(np.asarray(matrix))))
+            else:
+                spectrum = _shifted_qr(_hessenberg([list(map(complex, row)) for row in matrix.rows]))
+
+            scale = max(map(abs, spectrum), default=0)
+            self.eigenvalues = tuple(sorted(
+                (value.real if abs(value.imag) <= _TOLERANCE * max(scale, 1) else value for value in spectrum),
+                key=lambda value: (-abs(value), -value.real, -value.imag),
+            ))
+
+    def eigenvector(self, i: int) -> Vector:
+        eigenvector = self._eigenvectors[i]
+
+        if eigenvector is None:
+            eigenvector = self._eigenvectors[i] = self._inverse_iteration(self.eigenvalues[i])
+
+        return eigenvector
+
+    def __iter__(self) -> Iterator[tuple[complex, Vector]]:
+        return ((eigenvalue, self.eigenvector(i)) for i, eigenvalue in enumerate(self.eigenvalues))
+
+    def _inverse_iteration(self, eigenvalue: complex) -> Vector:
+        scale = max(map(abs, self._matrix), default=0) or 1
+        shift = eigenvalue + scale * _TOLERANCE
+
+        if self._matrix.is_packed():
+            decomposition = lu_factor(np.asarray(self._matrix) - shift * np.eye(self.dimension), check_finite=False)
+            x = np.ones(self.dimension)
+
+            for _ in range(_INVERSE_ITERATION_COUNT):
+                x = lu_solve(decomposition, x, check_finite=False)
+                x /= np.linalg.norm(x)
+
+            if np.iscomplexobj(x):
+                return vector_type(self.dimension)._wrap(tuple(x.tolist()), (self.dimension,))
+            else:
+                return vector_type(self.dimension)._wrap(array('d', x), (self.dimension,))
+        else:
+            values: list[Any] = [
+                value - shift if i == j else value
+                for i, row in enumerate(self._matrix.rows) for j, value in enumerate(row)
+            ]
+            shifted = LUDecomposition(Matrix._wrap(tuple(values), self._matrix.dimensions))
+            y = vector_type(self.dimension)._wrap((1,) * self.dimension, (self.dimension,))
+
+            for _ in range(_INVERSE_ITERATION_COUNT):
+                y = shifted.solve(y)
+                y = y / sqrt(sum(abs(value) ** 2 for value in y))
+
+            return y
+
+
+def power_iteration(
+        matrix: Matrix,
+        count: int = 1,
+        *,
+        tolerance: float = _TOLERANCE,
+        max_iterations: int = 10000,
+) -> Iterator[tuple[float, Vector]]:
+    if not matrix.is_square():
+        raise DimensionError('Power iteration requires a square matrix')
+
+    pairs = list[tuple[float, Vector]]()
+    generator = Random(0)
+
+    for _ in range(min(count, matrix.row_dimension)):
+        x = vector_type(matrix.column_dimension)(
+            array('d', (generator.random() for _ in range(matrix.row_dimension))),
+            (matrix.column_dimension,),
+        )
+
+        for _, eigenvector in pairs:
+            x -= (x @ eigenvector) * eigenvector
+
+        x /= abs(x)
+        eigenvalue = 0.0
+
+        for _ in range(max_iterations):
+            y = matrix * x
+
+            for deflated_eigenvalue, eigenvector in pairs:
+                y -= (deflated_eigenvalue * (eigenvector @ x)) * eigenvector
+
+            eigenvalue = x @ y
+            norm = abs(y)
+
+            if not norm:
+                break
+
+            residual = abs(y - eigenvalue * x)
+            x = y / norm
+
+            if residual <= tolerance * max(abs(eigenvalue), 1):
+                break
+        else:
+            raise ConvergenceError('Power iteration did not converge')
+
+        pairs.append((eigenvalue, x))
+
+        yield eigenvalue, x
+
+
+@overload
+def lstsq(a: Matrix, b: Vector) -> Vector:
+    ...
+
+
+@overload
+def lstsq(a: Matrix, b: Matrix) -> Matrix:
+    ...
+
+
+def lstsq(a: Matrix, b: Union[Vector, Matrix]) -> Union[Vector, Matrix]:
+    return a.qr.solve(b)
+
+
+def _wrap_solution(values: array[float], dimensions: tuple[int, ...]) -> Union[Vector, Matrix]:
+    if len(dimensions) == 2:
+        return Matrix._wrap(values, dimensions)
+    else:
+        return vector_type(dimensions[0])._wrap(values, dimensions)
+
+
+def _solve_columns(
+        substitute: Callable[[Any], list[Any]],
+        b: Union[Vector, Matrix],
+        dimension: Optional[int] = None,
+) -> Union[Vector, Matrix]:
+    dimension = b.dimensions[0] if dimension is None else dimension
+
+    if isinstance(b, Matrix):
+        columns = tuple(map(substitute, b.columns))
+
+        return Matrix._wrap(
+            tuple(column[i] for i in range(dimension) for column in columns),
+            (dimension, b.column_dimension),
+        )
+    else:
+        return vector_type(dimension)._wrap(tuple(substitute(b)), (dimension,))
+
+
+def _hessenberg(a: list[list[complex]]) -> list[list[complex]]:
+    n = len(a)
+
+    for k in range(n - 2):
+        x = [a[i][k] for i in range(k + 1, n)]
+        alpha = sqrt(sum(abs(value) ** 2 for value in x))
+
+        if not alpha:
+            continue
+
+        phase = x[0] / abs(x[0]) if x[0] else 1
+        x[0] += phase * alpha
+        norm = sqrt(sum(abs(value) ** 2 for value in x))
+        v = [value / norm for value in x]
+
+        for j in range(n):
+            dot = sum(v[i].conjugate() * a[k + 1 + i][j] for i in range(n - k - 1))
+
+            for i in range(n - k - 1):
+                a[k + 1 + i][j] -= 2 * v[i] * dot
+
+        for row in a:
+            dot = sum(row[k + 1 + i] * v[i] for i in range(n - k - 1))
+
+            for i in range(n - k - 1):
+                row[k + 1 + i] -= 2 * dot * v[i].conjugate()
+
+    return a
+
+
+def _shifted_qr(h: list[list[complex]]) -> list[complex]:
+    eigenvalues = list[complex]()
+    m = len(h)
+    iteration_count = 0
+
+    while m:
+        if m == 1 or abs(h[m - 1][m - 2]) <= _EPSILON * (abs(h[m - 1][m - 1]) + abs(h[m - 2][m - 2])):
+            eigenvalues.append(h[m - 1][m - 1])
+            m -= 1
+            iteration_count = 0
+
+            continue
+        elif iteration_count > _MAX_QR_ITERATIONS:
+            raise ConvergenceError('The QR algorithm did not converge')
+
+        a, b, c, d = h[m - 2][m - 2], h[m - 2][m - 1], h[m - 1][m - 2], h[m - 1][m - 1]
+        discriminant = csqrt((a - d) ** 2 / 4 + b * c)
+        shift = min(((a + d) / 2 + discriminant, (a + d) / 2 - discriminant), key=lambda value: abs(value - d))
+        iteration_count += 1
+
+        if not iteration_count % 10:
+            shift += abs(c)
+
+        rotations = []
+
+        for i in range(m):
+            h[i][i] -= shift
+
+        for k in range(m - 1):
+            x, y = h[k][k], h[k + 1][k]
+            r = hypot(abs(x), abs(y))
+            cosine, sine = (x / r, y / r) if r else (1, 0)
+
+            for j in range(k, m):
+                upper, lower = h[k][j], h[k + 1][j]
+                h[k][j] = cosine.conjugate() * upper + sine.conjugate() * lower
+                h[k + 1][j] = cosine * lower - sine * upper
+
+            rotations.append((cosine, sine))
+
+        for k, (cosine, sine) in enumerate(rotations):
+            for i in range(min(k + 2, m - 1) + 1):
+                left, right = h[i][k], h[i][k + 1]
+                h[i][k] = left * cosine + right * sine
+                h[i][k + 1] = right * cosine.conjugate() - left * sine.conjugate()
+
+        for i in range(m):
+            h[i][i] += shift
+
+    return eigenvalues
+
+
+def _jacobi(a: list[list[float]]) -> tuple[list[float], list[Vector]]:
+    n = len(a)
+    v = [[float(i == j) for j in range(n)] for i in range(n)]
+
+    for _ in range(_MAX_JACOBI_SWEEPS):
+        off_diagonal = sum(a[p][q] ** 2 for p in range(n) for q in range(p + 1, n))
+
+        if off_diagonal <= _EPSILON ** 2 * sum(value ** 2 for row in a for value in row):
+            break
+
+        for p in range(n):
+            for q in range(p + 1, n):
+                if not a[p][q]:
+                    continue
+
+                theta = (a[q][q] - a[p][p]) / (2 * a[p][q])
+                t = copysign(1, theta) / (abs(theta) + sqrt(theta ** 2 + 1))
+                cosine = 1 / sqrt(t ** 2 + 1)
+                sine = t * cosine
+
+                for rows in (a, v):
+                    for row in rows:
+                        row[p], row[q] = cosine * row[p] - sine * row[q], sine * row[p] + cosine * row[q]
+
+                a[p], a[q] = (
+                    [cosine * x - sine * y for x, y in zip(a[p], a[q])],
+                    [sine * x + cosine * y for x, y in zip(a[p], a[q])],
+                )
+    else:
+        raise ConvergenceError('The Jacobi eigenvalue algorithm did not converge')
+
+    return [a[i][i] for i in range(n)], [vector_type(n)._wrap(tuple(row[j] for row in v), (n,)) for j in range(n)]
+
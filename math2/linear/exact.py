@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from fractions import Fraction
+from math import isqrt, lcm, prod
+from typing import Any, Final, Union
+
+import numpy as np
+
+_MODULUS_LIMIT: Final = 1 << 31
+_INT64_LIMIT: Final = 1 << 63
+_MODULAR_THRESHOLD: Final = 64
+
+
+def is_exact(values: Iterable[Any]) -> bool:
+    return all(isinstance(value, (int, Fraction)) for value in values)
+
+
+def determinant(rows: Sequence[Sequence[Union[int, Fraction]]]) -> Union[int, Fraction]:
+    integer_rows, scale = _integral(rows)
+    value = modular_determinant(integer_rows) if len(rows) >= _MODULAR_THRESHOLD else bareiss(integer_rows)[0]
+
+    return value if scale == 1 else Fraction(value, scale)
+
+
+def rank(rows: Sequence[Sequence[Union[int, Fraction]]]) -> int:
+    return bareiss(_integral(rows)[0])[1]
+
+
+def bareiss(rows: Sequence[Sequence[int]]) -> tuple[int, int]:
+    values = [list(row) for row in rows]
+    row_count = len(values)
+    column_count = len(values[0]) if values else 0
+    previous = sign = 1
+    r = 0
+
+    for c in range(column_count):
+        pivot_index = next((i for i in range(r, row_count) if values[i][c]), None)
+
+        if pivot_index is None:
+            continue
+        elif pivot_index != r:
+            values[r], values[pivot_index] = values[pivot_index], values[r]
+            sign = -sign
+
+        pivot_row = values[r]
+        pivot = pivot_row[c]
+
+        for row in values[r + 1:]:
+            factor = row[c]
+            row[c] = 0
+
+            for j in range(c + 1, column_count):
+                row[j] = (pivot * row[j] - factor * pivot_row[j]) // previous
+
+        previous = pivot
+        r += 1
+
+    return (sign * previous if r == row_count == column_count else 0), r
+
+
+def modular_determinant(rows: Sequence[Sequence[int]]) -> int:
+    bound = prod(isqrt(sum(value * value for value in row)) + 1 for row in rows)
+    values: Any = np.array(rows, object).reshape(len(rows), -1)
+
+    if all(abs(value) < _INT64_LIMIT for value in values.flat):
+        values = values.astype(np.int64)
+
+    value, modulus = 0, 1
+
+    for prime in _primes():
+        if modulus > 2 * bound:
+            break
+
+        residue = _determinant_modulo((values % prime).astype(np.int64), prime)
+        value += modulus * ((residue - value) * pow(modulus, -1, prime) % prime)
+        modulus *= prime
+
+    return value - modulus if 2 * value > modulus else value
+
+
+def _integral(rows: Sequence[Sequence[Union[int, Fraction]]]) -> tuple[list[list[int]], int]:
+    integer_rows = list[list[int]]()
+    scale = 1
+
+    for row in rows:
+        multiple = lcm(*(value.denominator for value in row))
+        integer_rows.append([int(value * multiple) for value in row])
+        scale *= multiple
+
+    return integer_rows, scale
+
+
+def _determinant_modulo(values: np.ndarray[Any, Any], prime: int) -> int:
+    n = len(values)
+    result = 1
+
+    for k in range(n):
+        nonzero = np.flatnonzero(values[k:, k])
+
+        if not nonzero.size:
+            return 0
+        elif nonzero[0]:
+            values[[k, k + nonzero[0]]] = values[[k + nonzero[0], k]]
+            result = -result
+
+        pivot = int(values[k, k])
+        result = result * pivot % prime
+        factors = values[k + 1:, k] * pow(pivot, -1, prime) % prime
+        values[k + 1:, k:] = (values[k + 1:, k:] - factors[:, None] * values[k, k:] % prime) % prime
+
+    return result % prime
+
+
+def _primes() -> Iterator[int]:
+    candidate = _MODULUS_LIMIT - 1
+
+    while True:
+        if _is_prime(candidate):
+            yield candidate
+
+        candidate -= 2
+
+
+def _is_prime(n: int) -> bool:
+    d, s = n - 1, 0
+
+    while not d & 1:
+        d >>= 1
+        s += 1
+
+    for base in (2, 7, 61):
+        x = pow(base, d, n)
+
+        if x in (1, n - 1):
+            continue
+
+        for _ in range(s - 1):
+            x = x * x % n
+
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    return True
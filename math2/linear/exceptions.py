@@ -3,3 +3,11 @@ from math2.exceptions import Math2Exception
 
 class DimensionError(Math2Exception, ValueError):
     pass
+
+
+class ConvergenceError(Math2Exception, ArithmeticError):
+    pass
+
+
+class SingularityError(Math2Exception, ValueError):
+    pass
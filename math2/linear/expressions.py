@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from functools import partial
+from operator import add, mul, neg, sub
+from typing import Any, ClassVar, Final, Optional, SupportsIndex, Union, overload
+
+import numpy as np
+from auxiliary import product
+
+from math2.linear.exceptions import DimensionError
+from math2.linear.mutables import MutableTensor
+from math2.linear.tensors import _PACKED_THRESHOLD, Storage, Tensor
+
+Node = Union[Tensor, tuple[Any, ...]]
+
+
+class LazyTensor(Tensor):
+    __slots__ = '_expression', '_storage', '_type'
+    _deferred: ClassVar[bool] = True
+
+    def __init__(self, tensor: Tensor):
+        self._expression: Optional[Node] = tensor._expression if isinstance(tensor, LazyTensor) else _leaf(tensor)
+        self._storage: Optional[Storage] = tensor._storage if isinstance(tensor, LazyTensor) else None
+        self._type: type[Tensor] = tensor._type if isinstance(tensor, LazyTensor) else type(tensor)
+        self._offset = 0
+        self._strides = None
+        self._hash = None
+        self.dimensions = tensor.dimensions  # type: ignore
+
+    @classmethod
+    def _build(cls, expression: Node, type_: type[Tensor], dimensions: tuple[int, ...]) -> LazyTensor:
+        tensor = cls.__new__(cls)
+        tensor._expression = expression
+        tensor._storage = None
+        tensor._type = type_
+        tensor._offset = 0
+        tensor._strides = None
+        tensor._hash = None
+        tensor.dimensions = dimensions  # type: ignore
+
+        return tensor
+
+    @property
+    def _values(self) -> Storage:
+        if self._storage is None:
+            assert self._expression is not None
+            self._storage = _evaluate(self._expression, self.dimensions)
+            self._expression = None
+
+        return self._storage
+
+    @_values.setter
+    def _values(self, values: Storage) -> None:
+        self._storage = values
+        self._expression = None
+
+    @property
+    def _node(self) -> Node:
+        return self if self._expression is None else self._expression
+
+    @property
+    def lazy(self) -> LazyTensor:
+        return self
+
+    @property
+    def packed(self) -> Tensor:  # type: ignore
+        return self.evaluate().packed
+
+    def evaluate(self) -> Tensor:
+        return self._type._wrap(self._values, self.dimensions)
+
+    def is_packed(self) -> bool:
+        if self._storage is None:
+            assert self._expression is not None
+
+            return _is_packed(self._expression)
+        else:
+            return isinstance(self._storage, array)
+
+    def is_view(self) -> bool:
+        return False
+
+    def _slice(self, keys: Any) -> Any:
+        return self.evaluate()._slice(keys)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.evaluate()[key]
+
+    def _operand(self, other: Tensor) -> Node:
+        if self.dimensions != other.dimensions:
+            raise DimensionError('Adding two tensors requires identical dimensions')
+
+        return other._node if isinstance(other, LazyTensor) else _leaf(other)
+
+    def __neg__(self) -> LazyTensor:
+        return self._build((neg, self._node), self._type, self.dimensions)
+
+    def __add__(self, other: Tensor) -> LazyTensor:
+        if not isinstance(other, Tensor):
+            return NotImplemented
+
+        return self._build((add, self._node, self._operand(other)), self._type, self.dimensions)
+
+    def __radd__(self, other: Tensor) -> LazyTensor:
+        if not isinstance(other, Tensor):
+            return NotImplemented
+
+        return self._build((add, self._operand(other), self._node), self._type, self.dimensions)
+
+    def __sub__(self, other: Tensor) -> LazyTensor:
+        if not isinstance(other, Tensor):
+            return NotImplemented
+
+        return self._build((sub, self._node, self._operand(other)), self._type, self.dimensions)
+
+    def __rsub__(self, other: Tensor) -> LazyTensor:
+        if not isinstance(other, Tensor):
+            return NotImplemented
+
+        return self._build((sub, self._operand(other), self._node), self._type, self.dimensions)
+
+    @overload  # type: ignore
+    def __mul__(self, other: float) -> LazyTensor:
+        ...
+
+    @overload
+    def __mul__(self, other: Tensor) -> Tensor:
+        ...
+
+    def __mul__(self, other: Union[float, Tensor]) -> Tensor:
+        if isinstance(other, LazyTensor):
+            return self.evaluate() * other.evaluate()
+        elif isinstance(other, Tensor):
+            return self.evaluate() * other
+
+        return self._build((mul, other, self._node), self._type, self.dimensions)
+
+    @overload
+    def __rmul__(self, other: float) -> LazyTensor:
+        ...
+
+    @overload
+    def __rmul__(self, other: Tensor) -> Tensor:
+        ...
+
+    def __rmul__(self, other: Union[float, Tensor]) -> Tensor:
+        if isinstance(other, Tensor):
+            return other * self.evaluate()
+
+        return self * other
+
+    def __pow__(self, power: Any, modulo: Optional[int] = None) -> Any:
+        tensor: Any = self.evaluate()
+
+        return pow(tensor, power, modulo)
+
+    def __truediv__(self, other: float) -> LazyTensor:
+        if isinstance(other, Tensor):
+            return NotImplemented
+
+        try:
+            return self * (1 / other)
+        except TypeError:
+            return NotImplemented
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        return LazyTensor, (self.evaluate(),)
+
+    def __repr__(self) -> str:
+        return f'LazyTensor({self.evaluate()!r})'
+
+
+_UFUNCS: Final[dict[Any, np.ufunc]] = {add: np.add, sub: np.subtract, mul: np.multiply}
+
+
+def _leaf(tensor: Tensor) -> Tensor:
+    return tensor.freeze() if isinstance(tensor, MutableTensor) else tensor
+
+
+def _is_packed(node: Node) -> bool:
+    if isinstance(node, Tensor):
+        return node.is_packed()
+    elif node[0] is neg:
+        return _is_packed(node[1])
+    elif node[0] is mul:
+        return isinstance(node[1], (int, float)) and _is_packed(node[2])
+    else:
+        return _is_packed(node[1]) and _is_packed(node[2])
+
+
+def _stream(node: Node) -> Iterator[Any]:
+    if isinstance(node, Tensor):
+        return iter(node._flat())
+    elif node[0] is neg:
+        return map(neg, _stream(node[1]))
+    elif node[0] is mul:
+        return map(partial(mul, node[1]), _stream(node[2]))
+    else:
+        return map(node[0], _stream(node[1]), _stream(node[2]))
+
+
+def _compute(node: Node, out: np.ndarray[Any, Any]) -> None:
+    if isinstance(node, Tensor):
+        np.copyto(out, node._array())
+    elif node[0] is neg:
+        _compute(node[1], out)
+        np.negative(out, out=out)
+    elif node[0] is mul:
+        _compute(node[2], out)
+        np.multiply(node[1], out, out=out)
+    else:
+        func, left, right = node
+        _compute(left, out)
+
+        if isinstance(right, Tensor):
+            _UFUNCS[func](out, right._array(), out=out)
+        else:
+            scratch = np.empty_like(out)
+            _compute(right, scratch)
+            _UFUNCS[func](out, scratch, out=out)
+
+
+def _evaluate(node: Node, dimensions: tuple[int, ...]) -> Storage:
+    if not _is_packed(node):
+        return tuple(_stream(node))
+    elif isinstance(node, Tensor) or product(dimensions, 1) < _PACKED_THRESHOLD:
+        return array('d', _stream(node))
+
+    values = array('d', bytes(8 * product(dimensions, 1)))
+    _compute(node, np.frombuffer(values).reshape(dimensions))
+
+    return values
@@ -1,11 +1,17 @@
-from collections.abc import Callable, Sequence
+from array import array
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from itertools import product, starmap
-from typing import Optional
+from typing import Literal, Optional, Union
 
+import numpy as np
 from auxiliary import default, flattened
 
+from math2.linear.exceptions import DimensionError
 from math2.linear.matrices import Matrix
-from math2.linear.vectors import Vector
+from math2.linear.sparse import SparseMatrix
+from math2.linear.vectors import Vector, vector_type
+
+Distribution = Literal['uniform', 'normal']
 
 
 def row(scalars: Sequence[float]) -> Matrix:
@@ -25,7 +31,7 @@ def columns(scalars: Sequence[Sequence[float]]) -> Matrix:
 
 
 def vector(scalars: Sequence[float]) -> Vector:
-    return Vector(scalars, (len(scalars),))
+    return vector_type(len(scalars))(scalars, (len(scalars),))
 
 
 def empty_matrix() -> Matrix:
@@ -64,40 +70,178 @@ def full_matrix(
 
 
 def full_vector(func: Callable[[int], float], dimension: int) -> Vector:
-    return Vector(map(func, range(dimension)), (dimension,))
+    return vector_type(dimension)(map(func, range(dimension)), (dimension,))
 
 
 def zero_matrix(row_dimension: int, column_dimension: Optional[int] = None) -> Matrix:
-    return full_matrix(lambda r, c: 0, row_dimension, column_dimension)
+    return _filled_matrix(0, row_dimension, column_dimension)
 
 
 def zero_vector(dimension: int) -> Vector:
-    return full_vector(lambda i: 0, dimension)
+    return vector_type(dimension)((0,) * dimension, (dimension,))
 
 
 def one_matrix(row_dimension: int, column_dimension: Optional[int] = None) -> Matrix:
-    return full_matrix(lambda r, c: 1, row_dimension, column_dimension)
+    return _filled_matrix(1, row_dimension, column_dimension)
 
 
 def one_vector(dimension: int) -> Vector:
-    return full_vector(lambda i: 1, dimension)
-
+    return vector_type(dimension)((1,) * dimension, (dimension,))
 
-def random_matrix(row_dimension: int, column_dimension: Optional[int] = None) -> Matrix:
-    from random import random
 
-    return full_matrix(lambda r, c: random(), row_dimension, column_dimension)
+def random_matrix(
+        row_dimension: int,
+        column_dimension: Optional[int] = None,
+        *,
+        seed: Optional[int] = None,
+        distribution: Distribution = 'uniform',
+) -> Matrix:
+    dimensions = row_dimension, default(column_dimension, row_dimension)
 
+    return Matrix(_random_values(dimensions[0] * dimensions[1], seed, distribution), dimensions)
 
-def random_vector(dimension: int) -> Vector:
-    from random import random
 
-    return full_vector(lambda i: random(), dimension)
+def random_vector(dimension: int, *, seed: Optional[int] = None, distribution: Distribution = 'uniform') -> Vector:
+    return vector_type(dimension)(_random_values(dimension, seed, distribution), (dimension,))
 
 
 def diagonal_matrix(scalars: Sequence[float]) -> Matrix:
-    return full_matrix(lambda r, c: scalars[r] if r == c else 0, len(scalars))
+    dimension = len(scalars)
+    values: list[float] = [0] * (dimension * dimension)
+    values[::dimension + 1] = scalars
+
+    return Matrix(values, (dimension, dimension))
 
 
 def identity_matrix(dimension: int) -> Matrix:
     return diagonal_matrix((1,) * dimension)
+
+
+def outer(u: Vector, v: Vector) -> Matrix:
+    dimensions = u.dimension, v.dimension
+
+    if u.is_packed() and v.is_packed():
+        values = array('d', bytes(8 * dimensions[0] * dimensions[1]))
+        np.multiply.outer(u._array(), v._array(), out=np.frombuffer(values).reshape(dimensions))
+
+        return Matrix._wrap(values, dimensions)
+
+    v_values = v._flat()
+
+    return Matrix._wrap(tuple(x * y for x in u._flat() for y in v_values), dimensions)
+
+
+def kron(a: Matrix, b: Matrix) -> Matrix:
+    (m, n), (p, q) = a.dimensions, b.dimensions
+    dimensions = m * p, n * q
+
+    if a.is_packed() and b.is_packed():
+        values = array('d', bytes(8 * dimensions[0] * dimensions[1]))
+        out = np.frombuffer(values).reshape(m, p, n, q)
+        np.multiply(a._array()[:, None, :, None], b._array()[None, :, None, :], out=out)
+
+        return Matrix._wrap(values, dimensions)
+
+    a_values, b_values = a._flat(), b._flat()
+    a_rows = tuple(a_values[i * n:(i + 1) * n] for i in range(m))
+    b_rows = tuple(b_values[k * q:(k + 1) * q] for k in range(p))
+
+    return Matrix._wrap(tuple(x * y for a_row in a_rows for b_row in b_rows for x in a_row for y in b_row), dimensions)
+
+
+def block(blocks: Sequence[Sequence[Matrix]]) -> Matrix:
+    heights = list[int]()
+    widths = set[int]()
+
+    for block_row in blocks:
+        row_dimensions = {matrix.row_dimension for matrix in block_row}
+
+        if len(row_dimensions) > 1:
+            raise DimensionError('The blocks in a block row should have identical row dimensions')
+
+        heights.append(row_dimensions.pop() if row_dimensions else 0)
+        widths.add(sum(matrix.column_dimension for matrix in block_row))
+
+    if len(widths) > 1:
+        raise DimensionError('The block rows should have identical column dimensions')
+
+    dimensions = sum(heights), widths.pop() if widths else 0
+    column_dimension = dimensions[1]
+    packed = all(matrix.is_packed() for block_row in blocks for matrix in block_row)
+    values: Union[array[float], list[float]]
+
+    if packed:
+        values = array('d', bytes(8 * dimensions[0] * column_dimension))
+        out = np.frombuffer(values).reshape(dimensions)
+    else:
+        values = [0] * (dimensions[0] * column_dimension)
+
+    r = 0
+
+    for block_row, height in zip(blocks, heights):
+        c = 0
+
+        for matrix in block_row:
+            width = matrix.column_dimension
+
+            if packed:
+                out[r:r + height, c:c + width] = matrix._array()
+            else:
+                matrix_values = matrix._flat()
+
+                for i in range(height):
+                    start = (r + i) * column_dimension + c
+                    values[start:start + width] = matrix_values[i * width:(i + 1) * width]  # type: ignore
+
+            c += width
+
+        r += height
+
+    return Matrix._wrap(values if packed else tuple(values), dimensions)
+
+
+def hstack(matrices: Sequence[Matrix]) -> Matrix:
+    return block((matrices,))
+
+
+def vstack(matrices: Sequence[Matrix]) -> Matrix:
+    return block(tuple((matrix,) for matrix in matrices))
+
+
+def sparse_matrix(
+        entries: Union[Mapping[tuple[int, int], float], Iterable[tuple[tuple[int, int], float]]],
+        row_dimension: int,
+        column_dimension: Optional[int] = None,
+) -> SparseMatrix:
+    return SparseMatrix(entries, (row_dimension, default(column_dimension, row_dimension)))
+
+
+def sparse_zero_matrix(row_dimension: int, column_dimension: Optional[int] = None) -> SparseMatrix:
+    return sparse_matrix((), row_dimension, column_dimension)
+
+
+def sparse_diagonal_matrix(scalars: Sequence[float]) -> SparseMatrix:
+    return sparse_matrix((((i, i), scalar) for i, scalar in enumerate(scalars)), len(scalars))
+
+
+def sparse_identity_matrix(dimension: int) -> SparseMatrix:
+    return sparse_diagonal_matrix((1,) * dimension)
+
+
+def _filled_matrix(scalar: float, row_dimension: int, column_dimension: Optional[int]) -> Matrix:
+    dimensions = row_dimension, default(column_dimension, row_dimension)
+
+    return Matrix((scalar,) * (dimensions[0] * dimensions[1]), dimensions)
+
+
+def _random_values(count: int, seed: Optional[int], distribution: Distribution) -> tuple[float, ...]:
+    generator = np.random.default_rng(seed)
+
+    if distribution == 'uniform':
+        values = generator.random(count)
+    elif distribution == 'normal':
+        values = generator.standard_normal(count)
+    else:
+        raise ValueError('The distribution must be either uniform or normal')
+
+    return tuple(values.tolist())
@@ -1,18 +1,28 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Iterator, Sequence
-from itertools import product, starmap
-from operator import matmul
-from typing import Any, Literal, Optional, Union, overload
+from math import gcd
+from operator import index
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union, overload
 
-from auxiliary import chunked, flattened
+import numpy as np
+from auxiliary import flattened
 
-from math2.linear.exceptions import DimensionError
+from math2.linear.exact import determinant, is_exact, rank
+from math2.linear.exceptions import DimensionError, SingularityError
+from math2.linear.kernels import matmul, matvec
 from math2.linear.tensors import Tensor
-from math2.linear.vectors import Vector
+from math2.linear.vectors import Vector, vector_type
+
+if TYPE_CHECKING:
+    from math2.linear.decompositions import (CholeskyDecomposition, EigenDecomposition, LUDecomposition,
+                                             QRDecomposition)
 
 
 class Matrix(Tensor):
+    __slots__ = '_lu', '_cholesky', '_qr', '_eigen'
+    _broadcasts = False
+
     def __init__(self, values: Iterable[float], dimensions: Iterable[int]):
         super().__init__(values, dimensions)
 
@@ -29,24 +39,92 @@ class Matrix(Tensor):
 
     @property
     def rows(self) -> Iterator[Matrix]:
-        return (Matrix(row, (1, self.column_dimension)) for row in chunked(self, self.column_dimension))
+        return (
+            Matrix._view(self._values, (1, self.column_dimension), self._offset + i * self.strides[0], self.strides)
+            for i in range(self.row_dimension)
+        )
 
     @property
     def columns(self) -> Iterator[Matrix]:
-        for j in range(self.column_dimension):
-            yield Matrix((self[i, j] for i in range(self.row_dimension)), (self.row_dimension, 1))
+        return (
+            Matrix._view(self._values, (self.row_dimension, 1), self._offset + j * self.strides[1], self.strides)
+            for j in range(self.column_dimension)
+        )
+
+    @property
+    def lu(self) -> LUDecomposition:
+        try:
+            return self._lu
+        except AttributeError:
+            from math2.linear.decompositions import LUDecomposition
+
+            self._lu: LUDecomposition = LUDecomposition(self)
+
+            return self._lu
+
+    @property
+    def cholesky(self) -> CholeskyDecomposition:
+        try:
+            return self._cholesky
+        except AttributeError:
+            from math2.linear.decompositions import CholeskyDecomposition
+
+            self._cholesky: CholeskyDecomposition = CholeskyDecomposition(self)
+
+            return self._cholesky
+
+    @property
+    def qr(self) -> QRDecomposition:
+        try:
+            return self._qr
+        except AttributeError:
+            from math2.linear.decompositions import QRDecomposition
+
+            self._qr: QRDecomposition = QRDecomposition(self)
+
+            return self._qr
 
     @property
     def determinant(self) -> float:
-        raise NotImplementedError  # TODO
+        if not self.is_packed() and is_exact(self._flat()):
+            if not self.is_square():
+                raise DimensionError('Only square matrices have determinants')
+
+            return determinant(self._row_lists())  # type: ignore
+
+        return self.lu.determinant
+
+    @property
+    def rank(self) -> int:
+        if not self.is_packed() and is_exact(self._flat()):
+            return rank(self._row_lists())
+        elif not len(self):
+            return 0
+
+        return int(np.linalg.matrix_rank(np.asarray(self, float)))
+
+    @property
+    def inverse(self) -> Matrix:
+        return self.lu.inverse
+
+    @property
+    def eigen(self) -> EigenDecomposition:
+        try:
+            return self._eigen
+        except AttributeError:
+            from math2.linear.decompositions import EigenDecomposition
+
+            self._eigen: EigenDecomposition = EigenDecomposition(self)
+
+            return self._eigen
 
     @property
-    def eigenpairs(self) -> Iterator[tuple[float, Vector]]:
-        raise NotImplementedError  # TODO
+    def eigenpairs(self) -> Iterator[tuple[complex, Vector]]:
+        return iter(self.eigen)
 
     @property
-    def eigenvalues(self) -> Iterator[float]:
-        return (pair[0] for pair in self.eigenpairs)
+    def eigenvalues(self) -> Iterator[complex]:
+        return iter(self.eigen.eigenvalues)
 
     @property
     def eigenvectors(self) -> Iterator[Vector]:
@@ -55,6 +133,25 @@ class Matrix(Tensor):
     def is_square(self) -> bool:
         return self.row_dimension == self.column_dimension
 
+    def _row_lists(self) -> list[list[Any]]:
+        return [list(row) for row in self.rows]
+
+    @overload
+    def solve(self, b: Vector) -> Vector:
+        ...
+
+    @overload
+    def solve(self, b: Matrix) -> Matrix:
+        ...
+
+    def solve(self, b: Union[Vector, Matrix]) -> Union[Vector, Matrix]:
+        return self.lu.solve(b)
+
+    def power_iteration(self, count: int = 1) -> Iterator[tuple[float, Vector]]:
+        from math2.linear.decompositions import power_iteration
+
+        return power_iteration(self, count)
+
     @overload  # type: ignore
     def __mul__(self, other: float) -> Matrix:
         ...
@@ -70,29 +167,33 @@ class Matrix(Tensor):
     def __mul__(self, other: Union[float, Matrix, Vector]) -> Tensor:
         if isinstance(other, Matrix):
             if self.column_dimension == other.row_dimension:
-                return Matrix(
-                    starmap(matmul, product(self.rows, (other ** 'T').rows)),
-                    (self.row_dimension, other.column_dimension),
-                )
+                return Matrix._wrap(matmul(self, other), (self.row_dimension, other.column_dimension))
             else:
                 raise DimensionError('The matrices do not have valid dimensions for multiplication')
         elif isinstance(other, Vector):
             if self.column_dimension == other.dimension:
-                return Vector(
-                    (Vector(row, (self.column_dimension,)) @ other for row in self.rows),
-                    (self.row_dimension,),
-                )
+                return vector_type(self.row_dimension)._wrap(matvec(self, other), (self.row_dimension,))
             else:
                 raise DimensionError('The matrix and the vector do not have valid dimensions for multiplication')
         else:
             return super().__mul__(other)
 
-    def __pow__(self, power: Union[int, Literal['T']], modulo: Optional[Any] = None) -> Matrix:
-        if modulo is None:
-            if power == 'T':
-                return Matrix(flattened(self.columns), reversed(self.dimensions))
-            elif isinstance(power, int):
-                raise NotImplementedError
+    def __pow__(self, power: Union[int, Literal['T']], modulo: Optional[int] = None) -> Matrix:
+        if power == 'T':
+            if modulo is None:
+                return Matrix._view(self._values, self.dimensions[::-1], self._offset, self.strides[::-1])
+        elif isinstance(power, int):
+            if not self.is_square():
+                raise DimensionError('Only square matrices can be raised to integer powers')
+            elif modulo is None:
+                base = self if power >= 0 else self.inverse
+            else:
+                base = Matrix._wrap(tuple(index(value) % modulo for value in self), self.dimensions)  # type: ignore
+
+                if power < 0:
+                    base = _modular_inverse(base, modulo)
+
+            return _power(base, abs(power), modulo)
 
         return NotImplemented
 
@@ -130,20 +231,63 @@ class Matrix(Tensor):
                 raise ValueError('Matrices only support two indices, one each for row and column')
 
             if isinstance(i, int) and isinstance(j, int):
-                return self[i * self.column_dimension + j]
-            elif isinstance(i, int) and isinstance(j, slice):
-                row = tuple(self.rows)[i][j]
-
-                return Matrix(row, (1, len(row)))
-            elif isinstance(i, slice) and isinstance(j, int):
-                column = tuple(self.columns)[j][i]
-
-                return Matrix(column, (len(column), 1))
-            elif isinstance(i, slice) and isinstance(j, slice):
-                rows = tuple(row[j] for row in tuple(self.rows)[i])
-
-                return Matrix(flattened(rows), (len(rows), len(rows[0]) if rows else 0))
+                return self._values[self._position((i, j))]
             else:
-                raise ValueError('Indices must be of instance int or slice')
+                return self._slice((i, j))
         else:
             return super().__getitem__(i)
+
+
+def _reduce(matrix: Matrix, modulo: Optional[int]) -> Matrix:
+    return matrix if modulo is None else Matrix._wrap(tuple(value % modulo for value in matrix), matrix.dimensions)
+
+
+def _power(base: Matrix, exponent: int, modulo: Optional[int]) -> Matrix:
+    from math2.linear.factories import identity_matrix
+
+    result: Optional[Matrix] = None
+
+    while exponent:
+        if exponent & 1:
+            result = base if result is None else _reduce(result * base, modulo)
+
+        exponent >>= 1
+
+        if exponent:
+            base = _reduce(base * base, modulo)
+
+    if result is None:
+        result = identity_matrix(base.row_dimension)
+        result = _reduce(result.packed if base.is_packed() else result, modulo)
+    elif result is base:
+        values = base._flat()
+        result = Matrix._wrap(tuple(values) if isinstance(values, list) else values[:], base.dimensions)
+
+    return result
+
+
+def _modular_inverse(matrix: Matrix, modulo: int) -> Matrix:
+    n = matrix.row_dimension
+    rows = [
+        [index(value) for value in row] + [int(i == j) for j in range(n)]  # type: ignore
+        for i, row in enumerate(matrix.rows)
+    ]
+
+    for k in range(n):
+        for i in range(k + 1, n):
+            while rows[i][k]:
+                quotient = rows[k][k] // rows[i][k]
+                rows[k], rows[i] = rows[i], [(x - quotient * y) % modulo for x, y in zip(rows[k], rows[i])]
+
+        if gcd(rows[k][k], modulo) != 1:
+            raise SingularityError('The matrix is not invertible modulo the given modulus')
+
+        inverse = pow(rows[k][k], -1, modulo)
+        rows[k] = [value * inverse % modulo for value in rows[k]]
+
+        for i in range(n):
+            if i != k and rows[i][k]:
+                factor = rows[i][k]
+                rows[i] = [(x - factor * y) % modulo for x, y in zip(rows[i], rows[k])]
+
+    return Matrix._wrap(tuple(flattened(row[n:] for row in rows)), matrix.dimensions)
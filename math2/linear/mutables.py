@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import partial
+from itertools import product as cartesian_product
+from operator import add, mul, sub
+from typing import Any, ClassVar, Final, Literal, Optional, SupportsIndex, Union
+
+import numpy as np
+
+from math2.linear.exceptions import DimensionError
+from math2.linear.matrices import Matrix
+from math2.linear.tensors import _PACKED_THRESHOLD, Storage, Tensor
+from math2.linear.vectors import Vector, vector_type
+
+
+class MutableTensor(Tensor):
+    _frozen_type: ClassVar[type[Tensor]] = Tensor
+    __hash__ = None  # type: ignore
+
+    def __init__(self, values: Iterable[float], dimensions: Iterable[int]):
+        super().__init__(values, dimensions)
+
+        if isinstance(self._values, tuple):
+            self._values = list(self._values)
+
+        self._shared = False
+
+    @classmethod
+    def _wrap(cls, values: Storage, dimensions: tuple[int, ...]) -> Any:
+        tensor = super()._wrap(list(values) if isinstance(values, tuple) else values, dimensions)
+        tensor._shared = False
+
+        return tensor
+
+    @classmethod
+    def _share(cls, values: Storage, dimensions: tuple[int, ...]) -> Any:
+        tensor = super()._wrap(values, dimensions)
+        tensor._shared = True
+
+        return tensor
+
+    def freeze(self) -> Tensor:
+        self._shared = True
+
+        return self._frozen_type._wrap(self._values, self.dimensions)
+
+    def thaw(self) -> MutableTensor:
+        self._shared = True
+        tensor: MutableTensor = self._share(self._values, self.dimensions)
+
+        return tensor
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        self._shared = True
+
+        return super().__reduce_ex__(protocol)
+
+    def _slice(self, keys: Iterable[Union[int, slice]]) -> Any:
+        return self._copy(self._peek()._slice(keys))
+
+    def reshape(self, dimensions: Iterable[int]) -> Tensor:
+        return self._copy(self._peek().reshape(dimensions))  # type: ignore
+
+    def _peek(self) -> Tensor:
+        return self._frozen_type._view(self._values, self.dimensions, self._offset, self.strides)
+
+    def _copy(self, tensor: Tensor) -> Any:
+        values = tensor._flat()
+
+        if values is self._values:
+            values = tuple(values) if isinstance(values, list) else array('d', values)
+
+        return type(tensor)._wrap(values, tensor.dimensions)
+
+    def _detach(self) -> None:
+        if self._shared:
+            if isinstance(self._values, memoryview):
+                self._values = array('d', self._values.tobytes())
+            elif isinstance(self._values, array):
+                self._values = self._values[:]
+            else:
+                self._values = list(self._values)
+
+            self._shared = False
+
+    def _update(self, func: Callable[..., float], other: Union[Tensor, float]) -> None:
+        self._detach()
+
+        if isinstance(self._values, array) and len(self) >= _PACKED_THRESHOLD and (
+                other.is_packed() if isinstance(other, Tensor) else isinstance(other, (int, float))
+        ):
+            values = self._array()
+            _UFUNCS[func](values, other._array() if isinstance(other, Tensor) else other, out=values)
+
+            return
+
+        if isinstance(other, Tensor):
+            updated_values = map(func, self._values, other)
+        else:
+            updated_values = map(partial(func, other), self._values)
+
+        if isinstance(self._values, array):
+            self._values[:] = array('d', updated_values)
+        else:
+            self._values[:] = updated_values  # type: ignore
+
+    def __iadd__(self, other: Tensor) -> MutableTensor:
+        if not isinstance(other, Tensor):
+            return NotImplemented
+        elif self.dimensions != other.dimensions:
+            raise DimensionError('Adding two tensors requires identical dimensions')
+
+        self._update(add, other)
+
+        return self
+
+    def __isub__(self, other: Tensor) -> MutableTensor:
+        if not isinstance(other, Tensor):
+            return NotImplemented
+        elif self.dimensions != other.dimensions:
+            raise DimensionError('Adding two tensors requires identical dimensions')
+
+        self._update(sub, other)
+
+        return self
+
+    def __imul__(self, other: Union[float, Tensor]) -> MutableTensor:
+        if isinstance(other, Tensor):
+            return NotImplemented
+
+        self._update(mul, other)
+
+        return self
+
+    def __itruediv__(self, other: float) -> MutableTensor:
+        if isinstance(other, Tensor):
+            return NotImplemented
+
+        self._update(mul, 1 / other)
+
+        return self
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if isinstance(key, int):
+            if key < 0:
+                key += len(self)
+
+            if not 0 <= key < len(self):
+                raise IndexError('Tensor index out of range')
+
+            positions: Sequence[int] = (key,)
+        elif isinstance(key, slice):
+            positions = range(len(self))[key]
+        elif isinstance(key, tuple) and len(key) == len(self.dimensions):
+            positions = tuple(_positions(self, key))
+        else:
+            raise ValueError('Tensors require either a flat index or one index per dimension')
+
+        if isinstance(key, int) or isinstance(key, tuple) and all(isinstance(subkey, int) for subkey in key):
+            values: Sequence[Any] = (value,)
+        elif isinstance(value, Iterable):
+            values = tuple(value)
+        else:
+            values = (value,) * len(positions)
+
+        if len(values) != len(positions):
+            raise DimensionError('The values do not fit the indexed positions')
+
+        self._detach()
+
+        for position, value in zip(positions, values):
+            self._values[position] = value  # type: ignore
+
+
+class MutableVector(MutableTensor, Vector):
+    _frozen_type = Vector
+
+    def freeze(self) -> Tensor:
+        self._shared = True
+
+        return vector_type(self.dimension)._wrap(self._values, self.dimensions)
+
+
+class MutableMatrix(MutableTensor, Matrix):
+    _frozen_type = Matrix
+
+    @property
+    def rows(self) -> Iterator[Matrix]:
+        return (self._slice((i, slice(None))) for i in range(self.row_dimension))
+
+    @property
+    def columns(self) -> Iterator[Matrix]:
+        return (self._slice((slice(None), j)) for j in range(self.column_dimension))
+
+    def __pow__(self, power: Union[int, Literal['T']], modulo: Optional[int] = None) -> Matrix:
+        if power == 'T':
+            return self.freeze() ** 'T'  # type: ignore
+        else:
+            return super().__pow__(power, modulo)
+
+    def _detach(self) -> None:
+        super()._detach()
+
+        for name in ('_lu', '_cholesky', '_qr', '_eigen'):
+            if hasattr(self, name):
+                delattr(self, name)
+
+
+_MUTABLE_TYPES: Final[dict[type[Tensor], type[MutableTensor]]] = {
+    Tensor: MutableTensor,
+    Vector: MutableVector,
+    Matrix: MutableMatrix,
+}
+_UFUNCS: Final[dict[Callable[..., float], np.ufunc]] = {add: np.add, sub: np.subtract, mul: np.multiply}
+
+
+def _positions(tensor: Tensor, keys: tuple[Union[int, slice], ...]) -> Iterator[int]:
+    ranges = list[Iterable[int]]()
+
+    for key, dimension in zip(keys, tensor.dimensions):
+        if isinstance(key, int):
+            ranges.append((key,))
+        elif isinstance(key, slice):
+            ranges.append(range(*key.indices(dimension)))
+        else:
+            raise ValueError('Indices must be of instance int or slice')
+
+    return map(tensor._position, cartesian_product(*ranges))
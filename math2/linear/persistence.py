@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+from os import PathLike
+from types import TracebackType
+from typing import Any, BinaryIO, Optional, Union
+
+import numpy as np
+from auxiliary import product
+
+from math2.linear.tensors import Tensor, _restore, _typed_view, dense_strides
+
+File = Union[str, PathLike[str], BinaryIO]
+
+
+class _SharedMemory(SharedMemory):
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except BufferError:
+            pass
+
+
+_attached_memories = dict[str, _SharedMemory]()
+
+
+class SharedTensor:
+    def __init__(self, tensor: Tensor):
+        values = np.asarray(tensor, float)
+        self.dimensions = tensor.dimensions
+        self._type = type(tensor)
+        self._memory = _SharedMemory(create=True, size=max(values.nbytes, 1))
+        self._owner = True
+        np.ndarray(values.shape, float, self._memory.buf)[...] = values
+
+    @classmethod
+    def _attach(cls, name: str, type_: type[Tensor], dimensions: tuple[int, ...]) -> SharedTensor:
+        shared_tensor = cls.__new__(cls)
+        shared_tensor.dimensions = dimensions
+        shared_tensor._type = type_
+
+        if name not in _attached_memories:
+            _attached_memories[name] = _SharedMemory(name)
+
+        shared_tensor._memory = _attached_memories[name]
+        shared_tensor._owner = False
+
+        return shared_tensor
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def tensor(self) -> Tensor:
+        buffer = self._memory.buf
+        assert buffer is not None
+
+        return _restore(self._type, buffer[:8 * product(self.dimensions, 1)], self.dimensions)
+
+    def close(self) -> None:
+        if self._owner:
+            self._memory.unlink()
+        else:
+            _attached_memories.pop(self.name, None)
+
+        try:
+            self._memory.close()
+        except BufferError:
+            pass  # tensors still view the segment, so the mapping is released once they and this handle are gone
+
+    def __enter__(self) -> SharedTensor:
+        return self
+
+    def __exit__(
+            self,
+            exc_type: Optional[type[BaseException]],
+            exc_value: Optional[BaseException],
+            traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return SharedTensor._attach, (self.name, self._type, self.dimensions)
+
+
+def save(tensor: Tensor, file: File) -> None:
+    np.save(file, np.asarray(tensor, float), allow_pickle=False)
+
+
+def load(file: File, mmap: bool = False) -> Tensor:
+    values = np.load(file, 'r' if mmap else None, allow_pickle=False)
+    dimensions = tuple(map(int, values.shape))
+    strides = dense_strides(dimensions)
+
+    if not mmap:
+        return _typed_view(array('d', np.ascontiguousarray(values, float).tobytes()), dimensions, 0, strides)
+    elif values.dtype != np.dtype(float):
+        raise ValueError('Memory-mapped tensors require native float64 values')
+    elif not values.flags.c_contiguous:
+        strides = dense_strides(dimensions[::-1])[::-1]
+        values = values.T
+
+    return _typed_view(memoryview(values).cast('B').cast('d') if values.size else array('d'), dimensions, 0, strides)
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Callable, Iterable
+from typing import Any, Final, Optional, Union
+
+import numpy as np
+from scipy.sparse import csr_matrix, identity, tril, triu
+from scipy.sparse.linalg import spsolve_triangular
+
+from math2.linear.exceptions import ConvergenceError, DimensionError, SingularityError
+from math2.linear.matrices import Matrix
+from math2.linear.sparse import SparseMatrix
+from math2.linear.vectors import Vector, vector_type
+
+_TOLERANCE: Final = 1e-8
+_RESTART: Final = 30
+
+
+class LinearOperator:
+    def __init__(self, matvec: Callable[[Vector], Vector], dimensions: Iterable[int]):
+        self.matvec = matvec
+        self.dimensions = tuple(dimensions)
+
+        if len(self.dimensions) != 2:
+            raise DimensionError('Linear operators should have two dimensions')
+
+    @property
+    def row_dimension(self) -> int:
+        return self.dimensions[0]
+
+    @property
+    def column_dimension(self) -> int:
+        return self.dimensions[1]
+
+    def is_square(self) -> bool:
+        return self.row_dimension == self.column_dimension
+
+    def __mul__(self, other: Vector) -> Vector:
+        if not isinstance(other, Vector):
+            return NotImplemented
+        elif self.column_dimension != other.dimension:
+            raise DimensionError('The operator and the vector do not have valid dimensions for multiplication')
+
+        return self.matvec(other)
+
+
+class Preconditioner(ABC):
+    def solve(self, r: Vector) -> Vector:
+        return _vector(self._apply(np.asarray(r, float)))
+
+    @abstractmethod
+    def _apply(self, r: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+        pass
+
+
+class JacobiPreconditioner(Preconditioner):
+    def __init__(self, diagonal: Union[Matrix, Iterable[float]]):
+        if isinstance(diagonal, Matrix):
+            values = _compressed(diagonal).diagonal()
+        else:
+            values = np.array(tuple(diagonal), float)
+
+        if not values.all():
+            raise SingularityError('Jacobi preconditioning requires a nonzero diagonal')
+
+        self._inverse = 1 / values
+
+    def _apply(self, r: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+        result: np.ndarray[Any, Any] = self._inverse * r
+
+        return result
+
+
+class ILUPreconditioner(Preconditioner):
+    def __init__(self, matrix: Matrix):
+        if not matrix.is_square():
+            raise DimensionError('Incomplete LU factorization requires a square matrix')
+
+        compressed = _compressed(matrix)
+        compressed.sort_indices()
+        data, indices, indptr = compressed.data.tolist(), compressed.indices.tolist(), compressed.indptr.tolist()
+        n = matrix.row_dimension
+        diagonal_positions = [-1] * n
+
+        for i in range(n):
+            positions = {indices[k]: k for k in range(indptr[i], indptr[i + 1])}
+
+            for k in range(indptr[i], indptr[i + 1]):
+                column = indices[k]
+
+                if column >= i:
+                    break
+
+                pivot = diagonal_positions[column]
+                data[k] /= data[pivot]
+
+                for m in range(pivot + 1, indptr[column + 1]):
+                    position = positions.get(indices[m])
+
+                    if position is not None:
+                        data[position] -= data[k] * data[m]
+
+            diagonal_positions[i] = positions.get(i, -1)
+
+            if diagonal_positions[i] < 0 or not data[diagonal_positions[i]]:
+                raise SingularityError('Incomplete LU factorization encountered a zero pivot')
+
+        factors = csr_matrix((data, indices, indptr), (n, n))
+        self._lower = (tril(factors, -1) + identity(n)).tocsr()
+        self._upper = triu(factors, 0, 'csr')
+
+    def _apply(self, r: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+        y = spsolve_triangular(self._lower, r, lower=True)
+        result: np.ndarray[Any, Any] = spsolve_triangular(self._upper, y, lower=False)
+
+        return result
+
+
+class SolverResult:
+    def __init__(self, solution: Vector, residuals: Iterable[float]):
+        self.solution = solution
+        self.residuals = tuple(residuals)
+
+    @property
+    def iteration_count(self) -> int:
+        return len(self.residuals) - 1
+
+    @property
+    def residual(self) -> float:
+        return self.residuals[-1]
+
+
+def cg(
+        a: Union[Matrix, LinearOperator],
+        b: Vector,
+        *,
+        x0: Optional[Vector] = None,
+        tolerance: float = _TOLERANCE,
+        max_iterations: Optional[int] = None,
+        preconditioner: Optional[Preconditioner] = None,
+) -> SolverResult:
+    matvec, b_values, x, r, threshold, max_iterations = _setup(a, b, x0, tolerance, max_iterations)
+    precondition = _preconditioning(preconditioner)
+    residuals = [float(np.linalg.norm(r))]
+    z = precondition(r)
+    p = z.copy()
+    rz = r @ z
+
+    while residuals[-1] > threshold:
+        if len(residuals) > max_iterations:
+            raise ConvergenceError('The conjugate gradient method did not converge')
+
+        ap = matvec(p)
+        curvature = p @ ap
+
+        if not curvature:
+            raise ConvergenceError('The conjugate gradient method broke down')
+
+        alpha = rz / curvature
+        x += alpha * p
+        r -= alpha * ap
+        residuals.append(float(np.linalg.norm(r)))
+        z = precondition(r)
+        rz, previous_rz = r @ z, rz
+        p *= rz / previous_rz
+        p += z
+
+    return SolverResult(_vector(x), residuals)
+
+
+def bicgstab(
+        a: Union[Matrix, LinearOperator],
+        b: Vector,
+        *,
+        x0: Optional[Vector] = None,
+        tolerance: float = _TOLERANCE,
+        max_iterations: Optional[int] = None,
+        preconditioner: Optional[Preconditioner] = None,
+) -> SolverResult:
+    matvec, b_values, x, r, threshold, max_iterations = _setup(a, b, x0, tolerance, max_iterations)
+    precondition = _preconditioning(preconditioner)
+    residuals = [float(np.linalg.norm(r))]
+    shadow = r.copy()
+    rho = alpha = omega = 1.0
+    v = np.zeros_like(r)
+    p = np.zeros_like(r)
+
+    while residuals[-1] > threshold:
+        if len(residuals) > max_iterations:
+            raise ConvergenceError('The BiCGSTAB method did not converge')
+
+        rho, previous_rho = shadow @ r, rho
+
+        if not rho or not omega:
+            raise ConvergenceError('The BiCGSTAB method broke down')
+
+        p = r + rho / previous_rho * alpha / omega * (p - omega * v)
+        p_hat = precondition(p)
+        v = matvec(p_hat)
+        alpha = rho / (shadow @ v)
+        s = r - alpha * v
+
+        if np.linalg.norm(s) <= threshold:
+            x += alpha * p_hat
+            r = s
+        else:
+            s_hat = precondition(s)
+            t = matvec(s_hat)
+            omega = (t @ s) / (t @ t)
+            x += alpha * p_hat + omega * s_hat
+            r = s - omega * t
+
+        residuals.append(float(np.linalg.norm(r)))
+
+    return SolverResult(_vector(x), residuals)
+
+
+def gmres(
+        a: Union[Matrix, LinearOperator],
+        b: Vector,
+        *,
+        x0: Optional[Vector] = None,
+        tolerance: float = _TOLERANCE,
+        max_iterations: Optional[int] = None,
+        preconditioner: Optional[Preconditioner] = None,
+        restart: int = _RESTART,
+) -> SolverResult:
+    if restart < 1:
+        raise ValueError('The restart length must be positive')
+
+    matvec, b_values, x, r, threshold, max_iterations = _setup(a, b, x0, tolerance, max_iterations)
+    precondition = _preconditioning(preconditioner)
+    residuals = [float(np.linalg.norm(r))]
+    restart = min(restart, len(r))
+
+    while residuals[-1] > threshold:
+        basis = np.zeros((restart + 1, len(r)))
+        hessenberg = np.zeros((restart + 1, restart))
+        cosines, sines = np.zeros(restart), np.zeros(restart)
+        g = np.zeros(restart + 1)
+        g[0] = residuals[-1]
+        basis[0] = r / residuals[-1]
+        size = 0
+
+        while size < restart and residuals[-1] > threshold:
+            if len(residuals) > max_iterations:
+                raise ConvergenceError('The GMRES method did not converge')
+
+            j = size
+            w = matvec(precondition(basis[j]))
+
+            for i in range(j + 1):
+                hessenberg[i, j] = w @ basis[i]
+                w -= hessenberg[i, j] * basis[i]
+
+            hessenberg[j + 1, j] = np.linalg.norm(w)
+
+            if hessenberg[j + 1, j]:
+                basis[j + 1] = w / hessenberg[j + 1, j]
+
+            for i in range(j):
+                hessenberg[i, j], hessenberg[i + 1, j] = (
+                    cosines[i] * hessenberg[i, j] + sines[i] * hessenberg[i + 1, j],
+                    -sines[i] * hessenberg[i, j] + cosines[i] * hessenberg[i + 1, j],
+                )
+
+            radius = np.hypot(hessenberg[j, j], hessenberg[j + 1, j])
+            cosines[j], sines[j] = hessenberg[j, j] / radius, hessenberg[j + 1, j] / radius
+            hessenberg[j, j], hessenberg[j + 1, j] = radius, 0
+            g[j], g[j + 1] = cosines[j] * g[j], -sines[j] * g[j]
+            size += 1
+            residuals.append(abs(float(g[j + 1])))
+
+            if not basis[j + 1].any():
+                break
+
+        y = np.zeros(size)
+
+        for i in range(size - 1, -1, -1):
+            y[i] = (g[i] - hessenberg[i, i + 1:size] @ y[i + 1:]) / hessenberg[i, i]
+
+        x += precondition(basis[:size].T @ y)
+        r = b_values - matvec(x)
+        residuals[-1] = float(np.linalg.norm(r))
+
+        if size < restart and residuals[-1] > threshold and not basis[size].any():
+            raise ConvergenceError('The GMRES method stagnated')
+
+    return SolverResult(_vector(x), residuals)
+
+
+def _setup(
+        a: Union[Matrix, LinearOperator],
+        b: Vector,
+        x0: Optional[Vector],
+        tolerance: float,
+        max_iterations: Optional[int],
+) -> tuple[Callable[[np.ndarray[Any, Any]], np.ndarray[Any, Any]], Any, Any, Any, float, int]:
+    if not a.is_square():
+        raise DimensionError('Iterative solvers require a square operator')
+    elif a.column_dimension != b.dimension or x0 is not None and x0.dimension != b.dimension:
+        raise DimensionError('The operator and the vectors do not have valid dimensions')
+
+    matvec = _matvec(a)
+    b_values = np.asarray(b, float)
+    x = np.zeros(b.dimension) if x0 is None else np.array(x0, float)
+    r = b_values - matvec(x)
+    threshold = tolerance * float(np.linalg.norm(b_values))
+
+    return matvec, b_values, x, r, threshold, 10 * b.dimension if max_iterations is None else max_iterations
+
+
+def _matvec(a: Union[Matrix, LinearOperator]) -> Callable[[np.ndarray[Any, Any]], np.ndarray[Any, Any]]:
+    if isinstance(a, SparseMatrix):
+        return _compressed(a).__matmul__  # type: ignore
+    elif isinstance(a, Matrix):
+        return np.asarray(a, float).__matmul__
+    else:
+        return lambda x: np.array(a.matvec(_vector(x)), float)
+
+
+def _preconditioning(
+        preconditioner: Optional[Preconditioner],
+) -> Callable[[np.ndarray[Any, Any]], np.ndarray[Any, Any]]:
+    return (lambda r: r) if preconditioner is None else preconditioner._apply
+
+
+def _compressed(matrix: Matrix) -> Any:
+    if isinstance(matrix, SparseMatrix):
+        return csr_matrix((np.array(matrix._data, float), matrix._indices, matrix._indptr), matrix.dimensions)
+    else:
+        return csr_matrix(np.asarray(matrix, float))
+
+
+def _vector(values: np.ndarray[Any, Any]) -> Vector:
+    result = array('d', bytes(8 * len(values)))
+    np.copyto(np.frombuffer(result), values)
+
+    return vector_type(len(values))._wrap(result, (len(values),))
@@ -0,0 +1,420 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import partial
+from itertools import accumulate
+from operator import add, mul, neg
+from typing import Any, Literal, Optional, SupportsIndex, Union, overload
+
+from math2.linear.exceptions import DimensionError
+from math2.linear.matrices import Matrix
+from math2.linear.tensors import Storage, Tensor, dense_strides
+from math2.linear.vectors import Vector, vector_type
+
+
+class SparseMatrix(Matrix):
+    __slots__ = '_data', '_indices', '_indptr'
+
+    def __init__(
+            self,
+            entries: Union[Mapping[tuple[int, int], float], Iterable[tuple[tuple[int, int], float]]],
+            dimensions: Iterable[int],
+    ):
+        self._hash = None
+        self.dimensions = tuple(dimensions)  # type: ignore
+
+        if len(self.dimensions) != 2:
+            raise DimensionError('Matrices should have two dimensions')
+
+        rows = [dict[int, float]() for _ in range(self.row_dimension)]
+
+        for (i, j), value in entries.items() if isinstance(entries, Mapping) else entries:
+            if not (0 <= i < self.row_dimension and 0 <= j < self.column_dimension):
+                raise IndexError('The entry lies outside the dimensions of the matrix')
+
+            rows[i][j] = rows[i].get(j, 0) + value
+
+        self._data, self._indices, self._indptr = _compress(rows)
+
+    @classmethod
+    def _wrap_compressed(
+            cls,
+            data: Sequence[float],
+            indices: Sequence[int],
+            indptr: Sequence[int],
+            dimensions: tuple[int, ...],
+    ) -> SparseMatrix:
+        matrix = cls.__new__(cls)
+        matrix._hash = None
+        matrix.dimensions = dimensions  # type: ignore
+        matrix._data, matrix._indices, matrix._indptr = tuple(data), tuple(indices), tuple(indptr)
+
+        return matrix
+
+    @classmethod
+    def _wrap(cls, values: Storage, dimensions: tuple[int, ...]) -> Any:
+        return Matrix._wrap(values, dimensions)
+
+    @classmethod
+    def _view(cls, values: Storage, dimensions: tuple[int, ...], offset: int, strides: tuple[int, ...]) -> Any:
+        return Matrix._view(values, dimensions, offset, strides)
+
+    @property
+    def strides(self) -> tuple[int, ...]:
+        return dense_strides(self.dimensions)
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._data)
+
+    @property
+    def entries(self) -> Iterator[tuple[tuple[int, int], float]]:
+        for i in range(self.row_dimension):
+            for k in range(self._indptr[i], self._indptr[i + 1]):
+                yield (i, self._indices[k]), self._data[k]
+
+    @property
+    def dense(self) -> Matrix:
+        return Matrix._wrap(self._flat(), self.dimensions)
+
+    @property
+    def packed(self) -> Matrix:  # type: ignore
+        return self.dense.packed
+
+    @property
+    def rows(self) -> Iterator[Matrix]:
+        for i in range(self.row_dimension):
+            start, stop = self._indptr[i], self._indptr[i + 1]
+
+            yield self._wrap_compressed(
+                self._data[start:stop],
+                self._indices[start:stop],
+                (0, stop - start),
+                (1, self.column_dimension),
+            )
+
+    @property
+    def columns(self) -> Iterator[Matrix]:
+        return (row ** 'T' for row in (self ** 'T').rows)
+
+    def is_packed(self) -> bool:
+        return False
+
+    def is_view(self) -> bool:
+        return False
+
+    def _flat(self) -> Storage:
+        values: list[float] = [0] * len(self)
+
+        for (i, j), value in self.entries:
+            values[i * self.column_dimension + j] = value
+
+        return tuple(values)
+
+    def _row(self, i: int) -> Iterator[tuple[int, float]]:
+        start, stop = self._indptr[i], self._indptr[i + 1]
+
+        return zip(self._indices[start:stop], self._data[start:stop])
+
+    def _slice(self, keys: Iterable[Union[int, slice]]) -> SparseMatrix:
+        ranges = list[range]()
+
+        for key, dimension in zip(keys, self.dimensions):
+            if isinstance(key, int):
+                if key < 0:
+                    key += dimension
+
+                if not 0 <= key < dimension:
+                    raise IndexError('Tensor index out of range')
+
+                ranges.append(range(key, key + 1))
+            elif isinstance(key, slice):
+                ranges.append(range(*key.indices(dimension)))
+            else:
+                raise ValueError('Indices must be of instance int or slice')
+
+        row_range, column_range = ranges
+        column_map = dict(zip(column_range, range(len(column_range))))
+
+        return SparseMatrix(
+            (
+                ((new_i, column_map[j]), value)
+                for new_i, i in enumerate(row_range) for j, value in self._row(i) if j in column_map
+            ),
+            (len(row_range), len(column_range)),
+        )
+
+    def __neg__(self) -> SparseMatrix:
+        return self._wrap_compressed(tuple(map(neg, self._data)), self._indices, self._indptr, self.dimensions)
+
+    @overload  # type: ignore
+    def __add__(self, other: SparseMatrix) -> SparseMatrix:
+        ...
+
+    @overload
+    def __add__(self, other: Tensor) -> Matrix:
+        ...
+
+    def __add__(self, other: Tensor) -> Matrix:
+        if not isinstance(other, Tensor):
+            return NotImplemented
+        elif self.dimensions != other.dimensions:
+            raise DimensionError('Adding two tensors requires identical dimensions')
+        elif isinstance(other, SparseMatrix):
+            rows = [dict(self._row(i)) for i in range(self.row_dimension)]
+
+            for i, row in enumerate(rows):
+                for j, value in other._row(i):
+                    row[j] = row.get(j, 0) + value
+
+            return self._wrap_compressed(*_compress(rows), self.dimensions)
+        else:
+            values = list(other)
+
+            for (i, j), value in self.entries:
+                values[i * self.column_dimension + j] += value
+
+            return Matrix._wrap(tuple(values), self.dimensions)
+
+    def __radd__(self, other: Tensor) -> Matrix:
+        return self + other
+
+    @overload  # type: ignore
+    def __mul__(self, other: float) -> SparseMatrix:
+        ...
+
+    @overload
+    def __mul__(self, other: Matrix) -> Matrix:
+        ...
+
+    @overload
+    def __mul__(self, other: Vector) -> Vector:
+        ...
+
+    def __mul__(self, other: Union[float, Matrix, Vector]) -> Tensor:
+        if isinstance(other, SparseMatrix):
+            if self.column_dimension != other.row_dimension:
+                raise DimensionError('The matrices do not have valid dimensions for multiplication')
+
+            rows = list[dict[int, float]]()
+
+            for i in range(self.row_dimension):
+                row = dict[int, float]()
+
+                for k, value in self._row(i):
+                    for j, other_value in other._row(k):
+                        row[j] = row.get(j, 0) + value * other_value
+
+                rows.append(row)
+
+            return self._wrap_compressed(*_compress(rows), (self.row_dimension, other.column_dimension))
+        elif isinstance(other, Matrix):
+            if self.column_dimension != other.row_dimension:
+                raise DimensionError('The matrices do not have valid dimensions for multiplication')
+
+            p = other.column_dimension
+            other_values = other._flat()
+            values = list[float]()
+
+            for i in range(self.row_dimension):
+                accumulator: list[float] = [0] * p
+
+                for k, value in self._row(i):
+                    accumulator = list(map(add, accumulator, map(partial(mul, value), other_values[k * p:(k + 1) * p])))
+
+                values.extend(accumulator)
+
+            return Matrix._wrap(tuple(values), (self.row_dimension, p))
+        elif isinstance(other, Vector):
+            if self.column_dimension != other.dimension:
+                raise DimensionError('The matrix and the vector do not have valid dimensions for multiplication')
+
+            x = other._flat()
+            values = [
+                sum(map(mul, self._data[start:stop], map(x.__getitem__, self._indices[start:stop])))
+                for start, stop in zip(self._indptr, self._indptr[1:])
+            ]
+
+            return vector_type(self.row_dimension)._wrap(
+                array('d', values) if other.is_packed() else tuple(values),
+                (self.row_dimension,),
+            )
+        elif isinstance(other, Tensor):
+            return NotImplemented
+
+        try:
+            return self._wrap_compressed(*_compress(
+                {j: value * other for j, value in self._row(i)} for i in range(self.row_dimension)
+            ), self.dimensions)
+        except TypeError:
+            return NotImplemented
+
+    def __rmul__(self, other: Union[float, Matrix]) -> Matrix:  # type: ignore
+        if isinstance(other, Matrix):
+            if other.column_dimension != self.row_dimension:
+                raise DimensionError('The matrices do not have valid dimensions for multiplication')
+
+            p = self.column_dimension
+            values = list[float]()
+
+            for row in other.rows:
+                accumulator: list[float] = [0] * p
+
+                for k, scalar in enumerate(row):
+                    if scalar:
+                        for j, value in self._row(k):
+                            accumulator[j] += scalar * value
+
+                values.extend(accumulator)
+
+            return Matrix._wrap(tuple(values), (other.row_dimension, p))
+        elif isinstance(other, Tensor):
+            return NotImplemented
+        else:
+            return self * other
+
+    def __pow__(self, power: Union[int, Literal['T']], modulo: Optional[int] = None) -> Matrix:
+        if power == 'T' and modulo is None:
+            m, n = self.dimensions
+            counts = [0] * (n + 1)
+
+            for j in self._indices:
+                counts[j + 1] += 1
+
+            indptr = list(accumulate(counts))
+            positions = indptr[:-1]
+            data: list[Any] = [0] * len(self._data)
+            indices = [0] * len(self._data)
+
+            for i in range(m):
+                for j, value in self._row(i):
+                    data[positions[j]], indices[positions[j]] = value, i
+                    positions[j] += 1
+
+            return self._wrap_compressed(data, indices, indptr, (n, m))
+        elif isinstance(power, int) and power >= 0 and modulo is None:
+            if not self.is_square():
+                raise DimensionError('Only square matrices can be raised to integer powers')
+
+            result: Matrix = SparseMatrix((((i, i), 1) for i in range(self.row_dimension)), self.dimensions)
+            base: Matrix = self
+
+            while power:
+                if power & 1:
+                    result *= base
+
+                power >>= 1
+
+                if power:
+                    base *= base
+
+            return result
+        else:
+            return self.dense.__pow__(power, modulo)
+
+    @overload
+    def __getitem__(self, i: int) -> float:
+        ...
+
+    @overload
+    def __getitem__(self, s: slice) -> Sequence[float]:
+        ...
+
+    @overload
+    def __getitem__(self, i: tuple[int, int]) -> float:
+        ...
+
+    @overload
+    def __getitem__(self, i: tuple[int, slice]) -> Matrix:
+        ...
+
+    @overload
+    def __getitem__(self, i: tuple[slice, int]) -> Matrix:
+        ...
+
+    @overload
+    def __getitem__(self, i: tuple[slice, slice]) -> Matrix:
+        ...
+
+    def __getitem__(
+            self, i: Union[int, slice, tuple[int, int], tuple[int, slice], tuple[slice, int], tuple[slice, slice]],
+    ) -> Union[float, Sequence[float], float, Matrix]:
+        if isinstance(i, slice):
+            return self._flat()[i]
+        elif isinstance(i, int):
+            if i < 0:
+                i += len(self)
+
+            if not 0 <= i < len(self):
+                raise IndexError('Tensor index out of range')
+
+            i = divmod(i, self.column_dimension)
+
+        try:
+            i, j = i
+        except ValueError:
+            raise ValueError('Matrices only support two indices, one each for row and column')
+
+        if isinstance(i, int) and isinstance(j, int):
+            if i < 0:
+                i += self.row_dimension
+
+            if j < 0:
+                j += self.column_dimension
+
+            if not (0 <= i < self.row_dimension and 0 <= j < self.column_dimension):
+                raise IndexError('Tensor index out of range')
+
+            start, stop = self._indptr[i], self._indptr[i + 1]
+            k = bisect_left(self._indices, j, start, stop)
+
+            return self._data[k] if k < stop and self._indices[k] == j else 0
+        else:
+            return self._slice((i, j))
+
+    def __iter__(self) -> Iterator[float]:
+        for i in range(self.row_dimension):
+            row: list[float] = [0] * self.column_dimension
+
+            for j, value in self._row(i):
+                row[j] = value
+
+            yield from row
+
+    def __len__(self) -> int:
+        return self.row_dimension * self.column_dimension
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SparseMatrix):
+            return self.dimensions == other.dimensions and (self._data, self._indices, self._indptr) == (
+                other._data, other._indices, other._indptr,
+            )
+        else:
+            return super().__eq__(other)
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        return type(self)._wrap_compressed, (self._data, self._indices, self._indptr, self.dimensions)
+
+    def __repr__(self) -> str:
+        return f'SparseMatrix({dict(self.entries)}, {self.dimensions})'
+
+    def __hash__(self) -> int:
+        return super().__hash__()
+
+
+def _compress(rows: Iterable[Mapping[int, float]]) -> tuple[tuple[float, ...], tuple[int, ...], tuple[int, ...]]:
+    data = list[float]()
+    indices = list[int]()
+    indptr = [0]
+
+    for row in rows:
+        for j in sorted(row):
+            if row[j]:
+                indices.append(j)
+                data.append(row[j])
+
+        indptr.append(len(data))
+
+    return tuple(data), tuple(indices), tuple(indptr)
@@ -1,36 +1,288 @@
 from __future__ import annotations
 
-from collections.abc import Hashable, Iterable, Sequence
+from array import array
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
 from functools import partial
-from itertools import starmap
+from itertools import product as cartesian_product
 from math import sqrt
-from operator import add, mul, neg
-from typing import Any, Final, TypeVar, Union, overload
+from operator import add, index, mul, neg
+from pickle import PickleBuffer
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Optional, SupportsIndex, TypeVar, Union, overload
 
-from auxiliary import product
+import numpy as np
+from auxiliary import flattened, product
 
 from math2.linear.exceptions import DimensionError
 
+if TYPE_CHECKING:
+    from math2.linear.expressions import LazyTensor
+    from math2.linear.mutables import MutableTensor
+
 
 class Tensor(Sequence[float], Hashable):
+    __slots__ = '_values', '_offset', '_strides', '_hash', 'dimensions'
+    __array_ufunc__ = None
+    _broadcasts: ClassVar[bool] = True
+    _deferred: ClassVar[bool] = False
+
     def __init__(self, values: Iterable[float], dimensions: Iterable[int]):
-        self._values = tuple(values)
+        self._values: Storage
+        self._offset = 0
+        self._strides: Optional[tuple[int, ...]] = None
+        self._hash: Optional[int] = None
+
+        if isinstance(values, array) and values.typecode == 'd':
+            self._values = values[:]
+        else:
+            self._values = tuple(values)
+
         self.dimensions: Final = tuple(dimensions)
 
         if len(self) != product(self.dimensions, 1):
             raise DimensionError('The dimensions do not fit the values')
 
+    @classmethod
+    def _wrap(cls: type[_T], values: Storage, dimensions: tuple[int, ...]) -> _T:
+        tensor = cls.__new__(cls)
+        tensor._values = values
+        tensor._offset = 0
+        tensor._strides = None
+        tensor._hash = None
+        tensor.dimensions = dimensions  # type: ignore
+
+        return tensor
+
+    @classmethod
+    def _view(cls: type[_T], values: Storage, dimensions: tuple[int, ...], offset: int, strides: tuple[int, ...]) -> _T:
+        tensor = cls._wrap(values, dimensions)
+
+        if offset or strides != dense_strides(dimensions) or len(values) != product(dimensions, 1):
+            tensor._offset = offset
+            tensor._strides = strides
+
+        return tensor
+
+    @property
+    def strides(self) -> tuple[int, ...]:
+        return dense_strides(self.dimensions) if self._strides is None else self._strides
+
+    @property
+    def packed(self: _T) -> _T:
+        return self if self.is_packed() else self._wrap(array('d', self), self.dimensions)
+
+    @property
+    def lazy(self) -> LazyTensor:
+        from math2.linear.expressions import LazyTensor
+
+        return LazyTensor(self)
+
+    @property
+    def buffer(self) -> memoryview:
+        values = self.packed._flat()
+        assert isinstance(values, _PACKED_TYPES)
+        view = memoryview(values).toreadonly()
+
+        return view.cast('B').cast('d', self.dimensions) if len(values) else view  # type: ignore
+
+    def thaw(self) -> MutableTensor:
+        from math2.linear.mutables import _MUTABLE_TYPES
+
+        mutable_type = next(_MUTABLE_TYPES[type_] for type_ in type(self).__mro__ if type_ in _MUTABLE_TYPES)
+
+        return mutable_type._share(self._flat(), self.dimensions)  # type: ignore
+
+    def is_packed(self) -> bool:
+        return isinstance(self._values, _PACKED_TYPES)
+
+    def reshape(self, dimensions: Iterable[int]) -> Tensor:
+        dimensions = _resolved(tuple(dimensions), len(self))
+
+        if self.is_view():
+            strides = _reshaped_strides(self.dimensions, self.strides, dimensions)
+
+            if strides is not None:
+                return _typed_view(self._values, dimensions, self._offset, strides)
+
+        return _typed_view(self._flat(), dimensions, 0, dense_strides(dimensions))
+
+    @overload
+    def sum(self, axis: None = None) -> float:
+        ...
+
+    @overload
+    def sum(self, axis: int) -> Tensor:
+        ...
+
+    def sum(self, axis: Optional[int] = None) -> Union[float, Tensor]:
+        return self._reduce(sum, np.sum, axis)
+
+    @overload
+    def max(self, axis: None = None) -> float:
+        ...
+
+    @overload
+    def max(self, axis: int) -> Tensor:
+        ...
+
+    def max(self, axis: Optional[int] = None) -> Union[float, Tensor]:
+        return self._reduce(max, np.max, axis)
+
+    @overload
+    def mean(self, axis: None = None) -> float:
+        ...
+
+    @overload
+    def mean(self, axis: int) -> Tensor:
+        ...
+
+    def mean(self, axis: Optional[int] = None) -> Union[float, Tensor]:
+        count = len(self) if axis is None else self.dimensions[axis]
+
+        if not count:
+            raise ValueError('The mean of an empty axis is undefined')
+
+        return self.sum(axis) / count
+
+    def _layout(self) -> tuple[Storage, int, tuple[int, ...]]:
+        if self.is_view():
+            return self._values, self._offset, self.strides
+        else:
+            return self._flat(), 0, dense_strides(self.dimensions)
+
+    def _permuted(self, axes: Sequence[int]) -> Tensor:
+        values, offset, strides = self._layout()
+
+        return Tensor._view(
+            values,
+            tuple(self.dimensions[axis] for axis in axes),
+            offset,
+            tuple(strides[axis] for axis in axes),
+        )
+
+    def _expand(self, dimensions: tuple[int, ...]) -> Tensor:
+        values, offset, strides = self._layout()
+        padding = len(dimensions) - len(self.dimensions)
+        strides = tuple(
+            0 if i < padding or self.dimensions[i - padding] != dimension else strides[i - padding]
+            for i, dimension in enumerate(dimensions)
+        )
+
+        return Tensor._view(values, dimensions, offset, strides)
+
+    def _reduce(
+            self,
+            func: Callable[[Iterable[float]], float],
+            ufunc: Callable[..., Any],
+            axis: Optional[int],
+    ) -> Union[float, Tensor]:
+        if axis is None:
+            return float(ufunc(self._array())) if self.is_packed() and len(self) >= _PACKED_THRESHOLD else func(self)
+
+        axis, = _normalized((axis,), len(self.dimensions))
+        dimensions = self.dimensions[:axis] + self.dimensions[axis + 1:]
+
+        values: Storage
+
+        if self.is_packed():
+            values = array('d', bytes(8 * product(dimensions, 1)))
+            ufunc(self._array(), axis, out=np.frombuffer(values).reshape(dimensions))
+
+            return _typed_view(values, dimensions, 0, dense_strides(dimensions))
+
+        axes = tuple(i for i in range(len(self.dimensions)) if i != axis) + (axis,)
+        count = self.dimensions[axis]
+        flat_values = self._permuted(axes)._flat()
+        values = tuple(func(flat_values[i:i + count]) for i in range(0, len(flat_values), count or 1))
+
+        return _typed_view(values or (func(()),) * product(dimensions, 1), dimensions, 0, dense_strides(dimensions))
+
+    def is_view(self) -> bool:
+        return self._strides is not None
+
+    def _flat(self) -> Storage:
+        if self._strides is None:
+            return self._values
+        elif isinstance(self._values, _PACKED_TYPES):
+            values = array('d', bytes(self._values.itemsize * len(self)))
+            np.copyto(np.frombuffer(values).reshape(self.dimensions), self._array())
+
+            return values
+        else:
+            return gather(self._values, self.dimensions, self._offset, self._strides)
+
+    def _array(self) -> np.ndarray[Any, Any]:
+        assert isinstance(self._values, _PACKED_TYPES)
+        itemsize = self._values.itemsize
+
+        return np.ndarray(
+            self.dimensions,
+            float,
+            self._values,  # type: ignore
+            self._offset * itemsize,
+            tuple(stride * itemsize for stride in self.strides),
+        )
+
+    def _position(self, indices: Iterable[int]) -> int:
+        position = self._offset
+
+        for index, dimension, stride in zip(indices, self.dimensions, self.strides):
+            if index < 0:
+                index += dimension
+
+            if not 0 <= index < dimension:
+                raise IndexError('Tensor index out of range')
+
+            position += index * stride
+
+        return position
+
+    def _slice(self: _T, keys: Iterable[Union[int, slice]]) -> _T:
+        offset = self._offset
+        dimensions = list[int]()
+        strides = list[int]()
+
+        for key, dimension, stride in zip(keys, self.dimensions, self.strides):
+            if isinstance(key, int):
+                if key < 0:
+                    key += dimension
+
+                if not 0 <= key < dimension:
+                    raise IndexError('Tensor index out of range')
+
+                start, count, step = key, 1, 1
+            elif isinstance(key, slice):
+                start, stop, step = key.indices(dimension)
+                count = len(range(start, stop, step))
+            else:
+                raise ValueError('Indices must be of instance int or slice')
+
+            offset += start * stride if count else 0
+            dimensions.append(count)
+            strides.append(stride * step)
+
+        return self._view(self._values, tuple(dimensions), offset, tuple(strides))
+
     def __pos__(self: _T) -> _T:
         return self
 
     def __neg__(self: _T) -> _T:
-        return type(self)(map(neg, self), self.dimensions)
+        if self.is_packed():
+            return self._wrap(_packed_map(neg, self), self.dimensions)
+        else:
+            return self._wrap(tuple(map(neg, self)), self.dimensions)
 
     def __add__(self: _T, other: Tensor) -> _T:
         if not isinstance(other, Tensor):
             return NotImplemented
         elif self.dimensions == other.dimensions:
-            return type(self)(starmap(add, zip(self, other)), self.dimensions)  # type: ignore
+            if self.is_packed() and other.is_packed():
+                return self._wrap(_packed_map(add, self, other), self.dimensions)
+            else:
+                return self._wrap(tuple(map(add, self, other)), self.dimensions)
+        elif self._broadcasts or other._broadcasts:
+            dimensions = broadcast_dimensions(self.dimensions, other.dimensions)
+
+            return self._expand(dimensions) + other._expand(dimensions)  # type: ignore
         else:
             raise DimensionError('Adding two tensors requires identical dimensions')
 
@@ -40,9 +292,28 @@ class Tensor(Sequence[float], Hashable):
         except TypeError:
             return NotImplemented
 
-    def __mul__(self: _T, other: float) -> _T:
+    def __mul__(self: _T, other: Union[float, Tensor]) -> _T:
+        if isinstance(other, Tensor):
+            if other._deferred:
+                return NotImplemented
+            elif self.dimensions == other.dimensions:
+                if self.is_packed() and other.is_packed():
+                    return self._wrap(_packed_map(mul, self, other), self.dimensions)
+                else:
+                    return self._wrap(tuple(map(mul, self, other)), self.dimensions)
+            elif self._broadcasts or other._broadcasts:
+                dimensions = broadcast_dimensions(self.dimensions, other.dimensions)
+
+                return self._expand(dimensions) * other._expand(dimensions)  # type: ignore
+            else:
+                raise DimensionError('Multiplying two tensors elementwise requires identical dimensions')
+        elif self.is_packed() and isinstance(other, (int, float)):
+            return self._wrap(_packed_map(mul, self, other), self.dimensions)
+        elif isinstance(other, Iterable):
+            return NotImplemented
+
         try:
-            return type(self)(map(partial(mul, other), self), self.dimensions)
+            return self._wrap(tuple(map(partial(mul, other), self)), self.dimensions)
         except TypeError:
             return NotImplemented
 
@@ -59,13 +330,38 @@ class Tensor(Sequence[float], Hashable):
         if not isinstance(other, Tensor):
             return NotImplemented
         elif self.dimensions == other.dimensions:
-            return sum(x * y for x, y in zip(self, other))
+            if self.is_packed() and other.is_packed() and len(self) >= _PACKED_THRESHOLD:
+                return float(np.vdot(self._array(), other._array()))
+            else:
+                return sum(x * y for x, y in zip(self, other))
         else:
             raise DimensionError('Calculating the dot product of two tensors requires identical dimensions')
 
     def __abs__(self) -> float:
         return sqrt(self @ self)
 
+    def __array__(self, dtype: Optional[Any] = None, copy: Optional[bool] = None) -> np.ndarray[Any, Any]:
+        if self.is_packed() and (dtype is None or np.dtype(dtype) == np.float64) and not copy:
+            values = self._array()
+            values.flags.writeable = False
+
+            return values
+        else:
+            return np.array(tuple(self), dtype).reshape(self.dimensions)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.buffer
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        values = self._flat()
+
+        if not isinstance(values, _PACKED_TYPES):
+            return _restore, (type(self), tuple(values), self.dimensions)
+
+        data = PickleBuffer(values) if index(protocol) >= 5 else values.tobytes()
+
+        return _restore, (type(self), data, self.dimensions)
+
     @overload
     def __getitem__(self, i: int) -> float:
         ...
@@ -75,22 +371,260 @@ class Tensor(Sequence[float], Hashable):
         ...
 
     def __getitem__(self, i: Union[int, slice]) -> Union[float, Sequence[float]]:
-        return self._values[i]
+        if self._strides is None:
+            return self._values[i]
+        elif isinstance(i, slice):
+            return self._flat()[i]
+
+        if i < 0:
+            i += len(self)
+
+        if not 0 <= i < len(self):
+            raise IndexError('Tensor index out of range')
+
+        indices = []
+
+        for dimension in reversed(self.dimensions):
+            i, index = divmod(i, dimension)
+            indices.append(index)
+
+        return self._values[self._position(reversed(indices))]
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._flat())
 
     def __len__(self) -> int:
-        return len(self._values)
+        return len(self._values) if self._strides is None else product(self.dimensions, 1)
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, Tensor):
-            return self.dimensions == other.dimensions and self._values == other._values
+            if self.dimensions != other.dimensions:
+                return False
+
+            values, other_values = self._flat(), other._flat()
+
+            if type(values) is type(other_values):
+                return values == other_values
+            else:
+                return tuple(values) == tuple(other_values)
         else:
             return NotImplemented
 
     def __repr__(self) -> str:
-        return f'Tensor({self._values}, {self.dimensions})'
+        values = self._flat()
+
+        return f'Tensor({array("d", values) if isinstance(values, memoryview) else values}, {self.dimensions})'
 
     def __hash__(self) -> int:
-        return hash(self.dimensions) ^ hash(self._values)
+        if self._hash is None:
+            self._hash = hash(self.dimensions) ^ hash(tuple(self._flat()))
+
+        return self._hash
 
 
 _T = TypeVar('_T', bound=Tensor)
+Storage = Union[tuple[float, ...], list[float], 'array[float]', 'memoryview[float]']
+_PACKED_TYPES: Final = array, memoryview
+_PACKED_THRESHOLD: Final = 16
+_UFUNCS: Final[dict[Callable[..., float], np.ufunc]] = {add: np.add, mul: np.multiply, neg: np.negative}
+
+
+def dense_strides(dimensions: tuple[int, ...]) -> tuple[int, ...]:
+    strides = [1] * len(dimensions)
+
+    for i in range(len(dimensions) - 1, 0, -1):
+        strides[i - 1] = strides[i] * dimensions[i]
+
+    return tuple(strides)
+
+
+def segment(values: Storage, start: int, count: int, stride: int) -> Storage:
+    if not stride:
+        values = values[start:start + 1]
+
+        return (array('d', values) if isinstance(values, memoryview) else values) * count
+
+    stop = start + count * stride
+
+    return values[start:stop if stop >= 0 else None:stride]
+
+
+def gather(values: Storage, dimensions: tuple[int, ...], offset: int, strides: tuple[int, ...]) -> Storage:
+    if not dimensions:
+        return values[offset:offset + 1]
+    elif not product(dimensions, 1):
+        return values[:0]
+
+    *outer_dimensions, count = dimensions
+    *outer_strides, stride = strides
+    segments = (
+        segment(values, offset + sum(map(mul, indices, outer_strides)), count, stride)
+        for indices in cartesian_product(*map(range, outer_dimensions))
+    )
+
+    if isinstance(values, _PACKED_TYPES):
+        result = array('d')
+
+        for segment_ in segments:
+            result.extend(segment_)
+
+        return result
+    else:
+        return tuple(flattened(segments))
+
+
+def broadcast_dimensions(*dimensions: tuple[int, ...]) -> tuple[int, ...]:
+    rank = max(map(len, dimensions))
+    broadcast_dimensions_ = list[int]()
+
+    for sizes in zip(*((1,) * (rank - len(dimensions_)) + dimensions_ for dimensions_ in dimensions)):
+        sizes_ = set(sizes) - {1}
+
+        if len(sizes_) > 1:
+            raise DimensionError('The dimensions cannot be broadcast together')
+
+        broadcast_dimensions_.append(sizes_.pop() if sizes_ else 1)
+
+    return tuple(broadcast_dimensions_)
+
+
+def tensordot(a: Tensor, b: Tensor, axes: Union[int, tuple[Sequence[int], Sequence[int]]] = 2) -> Union[float, Tensor]:
+    if isinstance(axes, int):
+        a_axes, b_axes = tuple(range(len(a.dimensions) - axes, len(a.dimensions))), tuple(range(axes))
+    else:
+        a_axes, b_axes = tuple(axes[0]), tuple(axes[1])
+
+    a_axes, b_axes = _normalized(a_axes, len(a.dimensions)), _normalized(b_axes, len(b.dimensions))
+    contracted_dimensions = tuple(a.dimensions[axis] for axis in a_axes)
+
+    if len(a_axes) != len(b_axes) or contracted_dimensions != tuple(b.dimensions[axis] for axis in b_axes):
+        raise DimensionError('The contracted axes must have identical dimensions')
+
+    a_free = tuple(axis for axis in range(len(a.dimensions)) if axis not in a_axes)
+    b_free = tuple(axis for axis in range(len(b.dimensions)) if axis not in b_axes)
+    dimensions = tuple(a.dimensions[axis] for axis in a_free) + tuple(b.dimensions[axis] for axis in b_free)
+    values: Storage
+
+    if a.is_packed() and b.is_packed():
+        values = array('d', bytes(8 * product(dimensions, 1)))
+        np.frombuffer(values).reshape(dimensions)[...] = np.tensordot(
+            np.asarray(a),
+            np.asarray(b),
+            (a_axes, b_axes),
+        )
+    else:
+        count = product(contracted_dimensions, 1)
+        a_values, b_values = a._permuted(a_free + a_axes)._flat(), b._permuted(b_free + b_axes)._flat()
+        a_rows = tuple(a_values[i:i + count] for i in range(0, product(a.dimensions, 1) if count else 0, count or 1))
+        b_rows = tuple(b_values[i:i + count] for i in range(0, product(b.dimensions, 1) if count else 0, count or 1))
+
+        if not count:
+            values = (0,) * product(dimensions, 1)
+        else:
+            values = tuple(sum(map(mul, a_row, b_row)) for a_row in a_rows for b_row in b_rows)
+
+    return _typed_view(values, dimensions, 0, dense_strides(dimensions)) if dimensions else values[0]
+
+
+def _normalized(axes: Iterable[int], rank: int) -> tuple[int, ...]:
+    axes = tuple(axes)
+
+    if not all(-rank <= axis < rank for axis in axes):
+        raise IndexError('Tensor axis out of range')
+
+    return tuple(axis % rank for axis in axes)
+
+
+def _resolved(dimensions: tuple[int, ...], count: int) -> tuple[int, ...]:
+    if dimensions.count(-1) == 1:
+        known_count = -product(dimensions, 1)
+
+        if not known_count or count % known_count:
+            raise DimensionError('The dimensions do not fit the values')
+
+        dimensions = tuple(count // known_count if dimension == -1 else dimension for dimension in dimensions)
+
+    if product(dimensions, 1) != count or any(dimension < 0 for dimension in dimensions):
+        raise DimensionError('The dimensions do not fit the values')
+
+    return dimensions
+
+
+def _reshaped_strides(
+        dimensions: tuple[int, ...],
+        strides: tuple[int, ...],
+        new_dimensions: tuple[int, ...],
+) -> Optional[tuple[int, ...]]:
+    if not product(dimensions, 1):
+        return dense_strides(new_dimensions)
+
+    old = [(dimension, stride) for dimension, stride in zip(dimensions, strides) if dimension != 1]
+    new_strides = [1] * len(new_dimensions)
+    oi = ni = 0
+
+    while oi < len(old) and ni < len(new_dimensions):
+        oj, nj = oi + 1, ni + 1
+        old_count, new_count = old[oi][0], new_dimensions[ni]
+
+        while old_count != new_count:
+            if new_count < old_count:
+                new_count *= new_dimensions[nj]
+                nj += 1
+            else:
+                old_count *= old[oj][0]
+                oj += 1
+
+        for ok in range(oi, oj - 1):
+            if old[ok][1] != old[ok + 1][0] * old[ok + 1][1]:
+                return None
+
+        new_strides[nj - 1] = old[oj - 1][1]
+
+        for nk in range(nj - 1, ni, -1):
+            new_strides[nk - 1] = new_strides[nk] * new_dimensions[nk]
+
+        oi, ni = oj, nj
+
+    return tuple(new_strides)
+
+
+def _typed_view(values: Storage, dimensions: tuple[int, ...], offset: int, strides: tuple[int, ...]) -> Tensor:
+    from math2.linear.matrices import Matrix
+    from math2.linear.vectors import vector_type
+
+    if len(dimensions) == 1:
+        return vector_type(dimensions[0])._view(values, dimensions, offset, strides)
+    elif len(dimensions) == 2:
+        return Matrix._view(values, dimensions, offset, strides)
+    else:
+        return Tensor._view(values, dimensions, offset, strides)
+
+
+def _restore(type_: type[Tensor], data: Any, dimensions: tuple[int, ...]) -> Tensor:
+    from math2.linear.mutables import MutableTensor
+
+    if not isinstance(data, tuple):
+        view = memoryview(data).cast('B')
+        data = view.cast('d') if len(view) else array('d')
+
+    return type_._share(data, dimensions) if issubclass(type_, MutableTensor) else type_._wrap(data, dimensions)
+
+
+def _packed_map(func: Callable[..., float], tensor: Tensor, other: Union[Tensor, float, None] = None) -> array[float]:
+    if len(tensor) < _PACKED_THRESHOLD:
+        if other is None:
+            return array('d', map(func, tensor))
+        elif isinstance(other, Tensor):
+            return array('d', map(func, tensor, other))
+        else:
+            return array('d', map(partial(func, other), tensor))
+
+    result = array('d', bytes(8 * len(tensor)))
+    operands: list[Any] = [tensor._array()]
+
+    if other is not None:
+        operands.append(other._array() if isinstance(other, Tensor) else other)
+
+    _UFUNCS[func](*operands, out=np.frombuffer(result).reshape(tensor.dimensions))
+
+    return result
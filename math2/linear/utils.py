@@ -1,5 +1,19 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from functools import lru_cache, partial
+from math import hypot, inf, isinf
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from math2.linear.batches import VectorBatch
+from math2.linear.exceptions import DimensionError
 from math2.linear.factories import vector
-from math2.linear.tensors import Tensor
+from math2.linear.matrices import Matrix
+from math2.linear.tensors import _PACKED_THRESHOLD, Tensor, _typed_view, dense_strides
+from math2.linear.vectors import Vector, vector_type
 
 i = vector((1, 0, 0))
 j = vector((0, 1, 0))
@@ -7,4 +21,149 @@ k = vector((0, 0, 1))
 
 
 def norm(t: Tensor, p: float = 2) -> float:
-    return sum(s ** p for s in t) ** (1 / p)
+    _check_order(p)
+
+    if t.is_packed() and len(t) >= _PACKED_THRESHOLD:
+        return float(_array_norm(t._array(), p=p))
+    else:
+        return _norm(t._flat(), p)
+
+
+def norms(t: Union[Tensor, VectorBatch], p: float = 2, axis: int = -1) -> Tensor:
+    _check_order(p)
+
+    if isinstance(t, VectorBatch):
+        values = array('d', bytes(8 * len(t)))
+        _array_norm(np.asarray(t), 0, np.frombuffer(values), p=p)
+
+        return vector_type(len(t))._wrap(values, (len(t),))
+    elif len(t.dimensions) < 2:
+        raise DimensionError('Norms along an axis require at least two dimensions, use norm for vectors')
+
+    result = t._reduce(partial(_norm, p=p), partial(_array_norm, p=p), axis)
+    assert isinstance(result, Tensor)
+
+    return result
+
+
+def normalized(t: Tensor, p: float = 2, axis: int = -1) -> Tensor:
+    lengths = norms(t, p, axis) if len(t.dimensions) > 1 else (norm(t, p),)
+    axis %= len(t.dimensions)
+    dimensions = t.dimensions[:axis] + (1,) + t.dimensions[axis + 1:]
+    values = tuple(1 / length if length else 0 for length in lengths)
+    scales = Tensor._wrap(array('d', values) if t.is_packed() else values, dimensions)
+    result = Tensor._wrap(t._flat(), t.dimensions) * scales
+
+    return _typed_view(result._flat(), t.dimensions, 0, dense_strides(t.dimensions))
+
+
+def chain_multiply(*operands: Union[Matrix, Vector]) -> Union[float, Matrix, Vector]:
+    if not operands:
+        raise ValueError('Chain products require at least one operand')
+    elif len(operands) == 1:
+        return operands[0]
+
+    matrices = list[Matrix]()
+
+    for i, operand in enumerate(operands):
+        if isinstance(operand, Matrix):
+            matrices.append(operand)
+        elif isinstance(operand, Vector):
+            dimensions = (1, operand.dimension) if i == 0 else (operand.dimension, 1)
+            matrices.append(Matrix._wrap(operand._flat(), dimensions))
+        else:
+            raise ValueError('Chain products only support matrices and vectors')
+
+    if any(a.column_dimension != b.row_dimension for a, b in zip(matrices, matrices[1:])):
+        raise DimensionError('The operands do not have valid dimensions for multiplication')
+
+    plan = _chain_plan((matrices[0].row_dimension, *(matrix.column_dimension for matrix in matrices)))
+    result = _chain_product(plan, matrices)
+
+    if isinstance(operands[0], Vector) and isinstance(operands[-1], Vector):
+        return result[0]
+    elif isinstance(operands[0], Vector) or isinstance(operands[-1], Vector):
+        return vector_type(len(result))._wrap(result._flat(), (len(result),))
+    else:
+        return result
+
+
+def _check_order(p: float) -> None:
+    if not p > 0:
+        raise ValueError('The order of a norm must be positive')
+
+
+def _norm(values: Sequence[float], p: float) -> float:
+    if p == 2:
+        return hypot(*map(abs, values))
+    elif p == 1:
+        return sum(map(abs, values))
+    elif p == inf:
+        return max(map(abs, values), default=0)
+
+    scale = max(map(abs, values), default=0)
+
+    if not scale or isinf(scale):
+        return scale
+
+    return scale * float(sum((abs(value) / scale) ** p for value in values) ** (1 / p))
+
+
+def _array_norm(
+        values: np.ndarray[Any, Any],
+        axis: Optional[int] = None,
+        out: Optional[np.ndarray[Any, Any]] = None,
+        *,
+        p: float,
+) -> np.ndarray[Any, Any]:
+    values = np.abs(values)
+
+    if p == 1:
+        result = values.sum(axis)
+    elif p == inf:
+        result = values.max(axis, initial=0)
+    else:
+        scale = values.max(axis, keepdims=True, initial=0)
+        degenerate = (scale == 0) | np.isinf(scale)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scaled = values / np.where(degenerate, 1, scale)
+            result = np.where(
+                degenerate,
+                scale,
+                scale * np.sum(scaled * scaled if p == 2 else scaled ** p, axis, keepdims=True) ** (1 / p),
+            ).squeeze(axis)
+
+    if out is not None:
+        out[...] = result
+
+    return np.asarray(result)
+
+
+@lru_cache(maxsize=256)
+def _chain_plan(dimensions: tuple[int, ...]) -> Any:
+    count = len(dimensions) - 1
+    costs = [[0] * count for _ in range(count)]
+    splits = [[0] * count for _ in range(count)]
+
+    for length in range(1, count):
+        for i in range(count - length):
+            j = i + length
+            costs[i][j], splits[i][j] = min(
+                (costs[i][k] + costs[k + 1][j] + dimensions[i] * dimensions[k + 1] * dimensions[j + 1], k)
+                for k in range(i, j)
+            )
+
+    def plan(i: int, j: int) -> Any:
+        return i if i == j else (plan(i, splits[i][j]), plan(splits[i][j] + 1, j))
+
+    return plan(0, count - 1)
+
+
+def _chain_product(plan: Any, matrices: list[Matrix]) -> Matrix:
+    if isinstance(plan, int):
+        return matrices[plan]
+
+    left, right = plan
+
+    return _chain_product(left, matrices) * _chain_product(right, matrices)
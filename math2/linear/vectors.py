@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+from array import array
 from collections.abc import Iterable
-from math import acos, isclose
+from functools import partial
+from math import acos, isclose, sqrt
+from operator import add, mul, sub
+from typing import Any, ClassVar, Final, Optional, Union
 
 from math2.linear.exceptions import DimensionError
-from math2.linear.tensors import Tensor
+from math2.linear.tensors import _PACKED_TYPES, _T, Storage, Tensor
 
 
 class Vector(Tensor):
+    __slots__ = ()
+    _broadcasts = False
+
     def __init__(self, values: Iterable[float], dimensions: Iterable[int]):
         super().__init__(values, dimensions)
 
@@ -48,14 +55,155 @@ class Vector(Tensor):
         if not (2 <= len(self) <= 3 and 2 <= len(other) <= 3):
             raise DimensionError('Calculating the cross product requires all vectors to have a length of 2 or 3')
 
-        return Vector((
+        values = (
             self.y * other.z - other.y * self.z,
             self.z * other.x - other.z * self.x,
             self.x * other.y - other.x * self.y,
-        ), (3,))
+        )
+
+        return Vec3._wrap(array('d', values) if self.is_packed() and other.is_packed() else values, (3,))
 
     def angle_between(self, other: Vector) -> float:
         return acos(self @ other / (abs(self) * abs(other)))
 
     def projection_on(self, other: Vector) -> Vector:
         return self @ other * other.unit
+
+
+class _FixedVector(Vector):
+    __slots__ = ()
+    _dimension: ClassVar[int]
+
+    def __init__(self, values: Iterable[float], dimensions: Optional[Iterable[int]] = None):
+        super().__init__(values, (self._dimension,) if dimensions is None else dimensions)
+
+        if self.dimensions != (self._dimension,):
+            raise DimensionError(f'{type(self).__name__} should have a dimension of {self._dimension}')
+
+    @classmethod
+    def _view(cls, values: Storage, dimensions: tuple[int, ...], offset: int, strides: tuple[int, ...]) -> Any:
+        if dimensions == (cls._dimension,) and not offset and strides == (1,) and len(values) == cls._dimension:
+            return cls._wrap(values, dimensions)
+        else:
+            return Vector._view(values, dimensions, offset, strides)
+
+    @property
+    def unit(self) -> Vector:
+        return self * (1 / abs(self))
+
+    def _result(self: _T, values: tuple[float, ...], other: Tensor) -> _T:
+        if isinstance(self._values, _PACKED_TYPES) and isinstance(other._values, _PACKED_TYPES):
+            return self._wrap(array('d', values), self.dimensions)
+        else:
+            return self._wrap(values, self.dimensions)
+
+    def __add__(self: _T, other: Tensor) -> _T:
+        if type(other) is type(self):
+            return self._result(tuple(map(add, self._values, other._values)), other)  # type: ignore
+        else:
+            return super().__add__(other)
+
+    def __sub__(self: _T, other: Tensor) -> _T:
+        if type(other) is type(self):
+            return self._result(tuple(map(sub, self._values, other._values)), other)  # type: ignore
+        else:
+            return super().__sub__(other)
+
+    def __mul__(self: _T, other: Union[float, Tensor]) -> _T:
+        if type(other) is type(self):
+            return self._result(tuple(map(mul, self._values, other._values)), other)  # type: ignore
+        elif type(other) is float or type(other) is int:
+            return self._result(tuple(map(partial(mul, other), self._values)), self)  # type: ignore
+        else:
+            return super().__mul__(other)
+
+    def __matmul__(self, other: Tensor) -> float:
+        if type(other) is type(self):
+            result: float = sum(map(mul, self._values, other._values))
+
+            return result
+        else:
+            return super().__matmul__(other)
+
+    def __abs__(self) -> float:
+        return sqrt(sum(map(mul, self._values, self._values)))
+
+
+class Vec2(_FixedVector):
+    __slots__ = ()
+    _dimension = 2
+
+    @property
+    def x(self) -> float:
+        return self._values[0]
+
+    @property
+    def y(self) -> float:
+        return self._values[1]
+
+    @property
+    def z(self) -> float:
+        return 0
+
+    @property
+    def w(self) -> float:
+        return 0
+
+
+class Vec3(_FixedVector):
+    __slots__ = ()
+    _dimension = 3
+
+    @property
+    def x(self) -> float:
+        return self._values[0]
+
+    @property
+    def y(self) -> float:
+        return self._values[1]
+
+    @property
+    def z(self) -> float:
+        return self._values[2]
+
+    @property
+    def w(self) -> float:
+        return 0
+
+    def cross(self, other: Vector) -> Vector:
+        if type(other) is not Vec3:
+            return super().cross(other)
+
+        ax, ay, az = self._values
+        bx, by, bz = other._values
+        values = ay * bz - by * az, az * bx - bz * ax, ax * by - bx * ay
+
+        return Vec3._wrap(array('d', values) if self.is_packed() and other.is_packed() else values, (3,))
+
+
+class Vec4(_FixedVector):
+    __slots__ = ()
+    _dimension = 4
+
+    @property
+    def x(self) -> float:
+        return self._values[0]
+
+    @property
+    def y(self) -> float:
+        return self._values[1]
+
+    @property
+    def z(self) -> float:
+        return self._values[2]
+
+    @property
+    def w(self) -> float:
+        return self._values[3]
+
+
+_FIXED_TYPES: Final[dict[int, type[Vector]]] = {2: Vec2, 3: Vec3, 4: Vec4}
+
+
+def vector_type(dimension: int) -> type[Vector]:
+    return _FIXED_TYPES.get(dimension, Vector)
@@ -3,11 +3,10 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from math import pi
-
-from auxiliary import sum_
+from typing import cast
 
 from math2.calculus import Region
-from math2.linear import Vector
+from math2.linear import Vector, zero_vector
 from math2.physics.consts import e0
 
 
@@ -16,7 +15,12 @@ class ElectrostaticField:
         self.charges = list[Charge]()
 
     def intensity(self, location: Vector) -> Vector:
-        return sum_((charge.intensity(location) for charge in self.charges))
+        intensity = zero_vector(location.dimension).thaw()
+
+        for charge in self.charges:
+            intensity += charge.intensity(location)
+
+        return cast(Vector, intensity.freeze())
 
     def force(self, charge: DiscreteCharge) -> Vector:
         return self.intensity(charge.location) * charge.value
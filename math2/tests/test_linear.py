@@ -1,17 +1,30 @@
+import gc
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
 from functools import partial
-from math import pi, sin, sqrt
-from operator import add, matmul, mul
+from io import BytesIO
+from math import inf, pi, prod, sin, sqrt
+from operator import add, attrgetter, matmul, mul
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
 from unittest import main
+from unittest.mock import patch
 
+import numpy as np
 from auxiliary import ExtendedTestCase
 
-from math2.linear import (DimensionError, Matrix, column, columns, diagonal_matrix, empty_column, empty_matrix,
-                          empty_row,
-                          empty_vector,
-                          full_matrix, full_vector, i,
-                          identity_matrix, j, k, norm, one_matrix, one_vector, random_matrix, random_vector, row, rows,
-                          singleton_matrix, singleton_vector, vector,
-                          zero_matrix, zero_vector)
+from math2.linear import (ConvergenceError, DimensionError, ILUPreconditioner, JacobiPreconditioner, LazyTensor,
+                          LinearOperator, Matrix, MatrixBatch, MutableMatrix, MutableTensor, MutableVector,
+                          SharedTensor, SingularityError, SparseMatrix, Tensor, Vec2, Vec3, Vec4, Vector, VectorBatch,
+                          bicgstab, block, cg, chain_multiply, column, columns, diagonal_matrix, empty_column,
+                          empty_matrix, empty_row, empty_vector, full_matrix, full_vector, get_parallelism, gmres,
+                          hstack, i, identity_matrix, j, k, kernels, kron, load, lstsq, norm, normalized, norms,
+                          one_matrix, one_vector, outer, random_matrix, random_vector, row, rows, save, set_parallelism,
+                          singleton_matrix, singleton_vector, sparse_diagonal_matrix, sparse_identity_matrix,
+                          sparse_matrix, sparse_zero_matrix, tensordot, vector, vstack, zero_matrix, zero_vector)
+from math2.linear.utils import _chain_plan
 
 
 class TensorTestCase(ExtendedTestCase):
@@ -87,6 +100,198 @@ class TensorTestCase(ExtendedTestCase):
         self.assertIterableEqual(column(range(6))[2:5], range(2, 5))
         self.assertIterableEqual(vector(range(6))[2:5], range(2, 5))
 
+    def test_packed(self) -> None:
+        self.assertFalse(rows((range(3), range(3, 6))).is_packed())
+        self.assertTrue(rows((range(3), range(3, 6))).packed.is_packed())
+        self.assertEqual(rows((range(3), range(3, 6))).packed, rows((range(3), range(3, 6))))
+        self.assertEqual(hash(vector(range(6)).packed), hash(vector(range(6))))
+
+        for dimension in (3, 100):
+            u, v = vector(range(dimension)).packed, vector(range(dimension, 0, -1)).packed
+
+            self.assertTrue((u + v).is_packed())
+            self.assertTrue((u - v).is_packed())
+            self.assertTrue((u * 2).is_packed())
+            self.assertTrue((u / 2).is_packed())
+            self.assertEqual(u + v, vector((dimension,) * dimension))
+            self.assertEqual(-u, -vector(range(dimension)))
+            self.assertEqual(u * 3, vector(range(0, 3 * dimension, 3)))
+            self.assertEqual(u @ v, vector(range(dimension)) @ vector(range(dimension, 0, -1)))
+
+        self.assertTrue(i.packed.cross(j.packed).is_packed())
+        self.assertEqual(i.packed.cross(j.packed), k)
+
+    def test_buffer(self) -> None:
+        self.assertEqual(rows((range(3), range(3, 6))).buffer.shape, (2, 3))
+        self.assertEqual(rows((range(3), range(3, 6))).buffer.tolist(), [[0, 1, 2], [3, 4, 5]])
+        self.assertTrue(vector(range(6)).packed.buffer.readonly)
+
+    def test_is_view(self) -> None:
+        m = Matrix(range(12), (3, 4))
+
+        self.assertFalse(m.is_view())
+        self.assertFalse(m[:, :].is_view())
+        self.assertTrue(next(m.rows).is_view())
+        self.assertTrue((m ** 'T').is_view())
+        self.assertTrue(m[1, :].is_view())
+        self.assertTrue(m[:, 1].is_view())
+        self.assertTrue(m[1:, 1:3].is_view())
+        self.assertTrue(tuple(m.columns)[2].is_view())
+        self.assertEqual(m[::-1, ::2], rows(((8, 10), (4, 6), (0, 2))))
+        self.assertEqual(m[1:1, :], Matrix((), (0, 4)))
+        self.assertEqual((m ** 'T') ** 'T', m)
+        self.assertEqual(hash((m ** 'T') ** 'T'), hash(m))
+        self.assertEqual((m ** 'T')[5], 9)
+        self.assertEqual((m ** 'T')[1, 2], 9)
+        self.assertRaises(IndexError, (m ** 'T').__getitem__, 12)
+        self.assertRaises(IndexError, m.__getitem__, (0, 4))
+
+        p = m.packed
+
+        self.assertTrue(np.shares_memory(np.asarray(p ** 'T'), np.asarray(p)))
+        self.assertTrue(np.shares_memory(np.asarray(p[1:, 1:3]), np.asarray(p)))
+        self.assertEqual(np.asarray(p[1:, 1:3]).tolist(), [[5, 6], [9, 10]])
+        self.assertEqual((p ** 'T') * p, (m ** 'T') * m)
+        self.assertEqual(p[::-1, 1] + p[::-1, 2], m[::-1, 1] + m[::-1, 2])
+
+    def test_array(self) -> None:
+        m = rows((range(3), range(3, 6))).packed
+        a = np.asarray(m)
+
+        self.assertEqual(a.shape, (2, 3))
+        self.assertEqual(a.tolist(), [[0, 1, 2], [3, 4, 5]])
+        self.assertTrue(np.shares_memory(a, np.asarray(m)))
+        self.assertFalse(a.flags.writeable)
+        self.assertEqual(np.asarray(rows((range(3), range(3, 6)))).tolist(), [[0, 1, 2], [3, 4, 5]])
+
+    def test_reshape(self) -> None:
+        t = Tensor(range(24), (2, 3, 4))
+
+        for u in (t, t.packed):
+            self.assertEqual(u.reshape((6, 4)), Matrix(range(24), (6, 4)))
+            self.assertIsInstance(u.reshape((6, 4)), Matrix)
+            self.assertIsInstance(u.reshape((-1,)), Vector)
+            self.assertEqual(u.reshape((4, -1, 2)).dimensions, (4, 3, 2))
+            self.assertIterableEqual(u.reshape((4, -1, 2)), range(24))
+            self.assertRaises(DimensionError, u.reshape, (5, -1))
+            self.assertRaises(DimensionError, u.reshape, (5, 5))
+
+        m = Matrix(range(12), (3, 4)).packed
+
+        self.assertTrue(np.shares_memory(np.asarray(m.reshape((2, 6))), np.asarray(m)))
+        self.assertTrue(np.shares_memory(np.asarray(m[:, 1:3].reshape((3, 1, 2))), np.asarray(m)))
+        self.assertFalse(np.shares_memory(np.asarray(m[::2, :].reshape((8,))), np.asarray(m)))
+        self.assertTrue(np.shares_memory(np.asarray(m[::2, :].reshape((2, 2, 2))), np.asarray(m)))
+        self.assertEqual(m[::2, :].reshape((8,)), vector((0, 1, 2, 3, 8, 9, 10, 11)))
+        self.assertEqual((m ** 'T').reshape((12,)), vector((0, 4, 8, 1, 5, 9, 2, 6, 10, 3, 7, 11)))
+        self.assertEqual(m[:, 1:3].reshape((6,)), vector((1, 2, 5, 6, 9, 10)))
+        self.assertEqual(sparse_identity_matrix(2).reshape((4,)), vector((1, 0, 0, 1)))
+
+    def test_broadcast(self) -> None:
+        t = Tensor(range(6), (2, 3))
+        r = Tensor((10, 20, 30), (3,))
+        c = Tensor((100, 200), (2, 1))
+
+        for x, y, z in ((t, r, c), (t.packed, r.packed, c.packed), (t, r.packed, c)):
+            self.assertEqual(x + y, Tensor((10, 21, 32, 13, 24, 35), (2, 3)))
+            self.assertEqual(y + x, x + y)
+            self.assertEqual(x - z, Tensor((-100, -99, -98, -197, -196, -195), (2, 3)))
+            self.assertEqual(y * z, Tensor((1000, 2000, 3000, 2000, 4000, 6000), (2, 3)))
+            self.assertEqual(x * x, Tensor((0, 1, 4, 9, 16, 25), (2, 3)))
+            self.assertEqual(y + z + x, Tensor((110, 121, 132, 213, 224, 235), (2, 3)))
+            self.assertEqual(rows(((0, 1, 2), (3, 4, 5))) + y, x + y)
+            self.assertRaises(DimensionError, add, x, Tensor(range(2), (2,)))
+
+        self.assertEqual(vector((1, 2)) * vector((3, 4)), vector((3, 8)))
+        self.assertRaises(DimensionError, add, row(range(3)), vector(range(3)))
+        self.assertRaises(DimensionError, mul, vector(range(3)), vector(range(2)))
+
+    def test_reductions(self) -> None:
+        t = Tensor(range(24), (2, 3, 4))
+
+        for u in (t, t.packed, Matrix(range(24), (2, 12))[:, ::-1].reshape((2, 3, 4))):
+            a = np.asarray(u)
+
+            self.assertEqual(u.sum(), 276)
+            self.assertEqual(u.max(), 23)
+            self.assertEqual(u.mean(), 11.5)
+
+            for axis in range(-3, 3):
+                self.assertEqual(u.sum(axis).dimensions, a.sum(axis).shape)
+                self.assertIterableEqual(u.sum(axis), a.sum(axis).flatten())
+                self.assertIterableEqual(u.max(axis), a.max(axis).flatten())
+                self.assertIterableAlmostEqual(u.mean(axis), a.mean(axis).flatten())
+
+            self.assertRaises(IndexError, u.sum, 3)
+
+        self.assertIsInstance(rows(((1, 2), (3, 4))).sum(0), Vector)
+        self.assertEqual(rows(((1, 2), (3, 4))).sum(1), vector((3, 7)))
+        self.assertEqual(Tensor((), (2, 0)).sum(1), vector((0, 0)))
+        self.assertRaises(ValueError, Tensor((), (2, 0)).max, 1)
+        self.assertRaises(ValueError, Tensor((), (2, 0)).mean, 1)
+
+    def test_tensordot(self) -> None:
+        a = Tensor(range(24), (2, 3, 4))
+        b = Tensor(range(12, 0, -1), (4, 3))
+
+        for x, y in ((a, b), (a.packed, b.packed), (a, b.packed)):
+            for axes in (1, ((2,), (0,)), ((1, 2), (1, 0)), ((-2,), (1,)), ((), ())):
+                expected = np.tensordot(np.asarray(a), np.asarray(b), axes)
+                result = tensordot(x, y, axes)
+
+                self.assertIsInstance(result, Tensor)
+                assert isinstance(result, Tensor)
+                self.assertEqual(result.dimensions, expected.shape)
+                self.assertIterableEqual(result, expected.flatten())
+
+        self.assertEqual(tensordot(vector((1, 2, 3)), vector((4, 5, 6)), 1), 32)
+        self.assertEqual(tensordot(rows(((1, 2), (3, 4))), rows(((1, 0), (0, 1))), 1), rows(((1, 2), (3, 4))))
+        self.assertEqual(tensordot(Tensor((), (2, 0)), Tensor((), (0, 3)), 1), zero_matrix(2, 3))
+        self.assertRaises(DimensionError, tensordot, a, b, 2)
+        self.assertRaises(IndexError, tensordot, a, b, ((3,), (0,)))
+
+    def test_hash(self) -> None:
+        u = vector(range(5))
+
+        self.assertEqual(hash(u), hash(u))
+        self.assertEqual(hash(u), hash(vector(range(5)).packed))
+        self.assertEqual(hash(rows(((1, 2), (3, 4))) ** 'T'), hash(rows(((1, 3), (2, 4)))))
+        self.assertEqual(len({u, vector(range(5)), u.packed, -u}), 2)
+
+    def test_slots(self) -> None:
+        tensors = vector(range(3)), rows(((1, 2), (3, 4))), Tensor(range(8), (2, 2, 2)), sparse_identity_matrix(2)
+
+        for tensor in tensors:
+            self.assertFalse(hasattr(tensor, '__dict__'))
+            self.assertFalse(hasattr(tensor.packed, '__dict__'))
+            self.assertFalse(hasattr(tensor.lazy, '__dict__'))
+
+    def test_lazy(self) -> None:
+        a, b, c = vector(range(20)), vector(range(20, 40)), vector(range(40, 60))
+
+        small = vector(range(3)), vector(range(3, 6)), vector(range(6, 9))
+
+        for x, y, z in ((a, b, c), (a.packed, b.packed, c.packed), (a, b.packed, c), small):
+            expression = x.lazy + y * 3 - z
+
+            self.assertIsInstance(expression, LazyTensor)
+            self.assertEqual(expression, x + y * 3 - z)
+            self.assertEqual(expression.is_packed(), (x + y * 3 - z).is_packed())
+            self.assertEqual(expression.evaluate(), x + y * 3 - z)
+            self.assertIsInstance(expression.evaluate(), Vector)
+            self.assertEqual(-(x.lazy - y.lazy) / 2 + z, -(x - y) / 2 + z)
+            self.assertEqual(x - (y.lazy - z * 2), x - (y - z * 2))
+            self.assertEqual(x.lazy @ y, x @ y)
+            self.assertEqual(list(x.lazy * 2), list(x * 2))
+            self.assertEqual(x.lazy[1], x[1])
+
+        expression = a.packed.lazy * 2
+
+        self.assertFalse(expression.is_view())
+        self.assertIterableEqual(expression[1:3], (2, 4))
+        self.assertEqual(expression + expression, a * 4)
+        self.assertRaises(DimensionError, add, a.lazy, vector(range(3)))
+
 
 class MatrixTestCase(ExtendedTestCase):
     def test_row_dimension(self) -> None:
@@ -109,23 +314,213 @@ class MatrixTestCase(ExtendedTestCase):
         self.assert2DIterableEqual(column(range(5)).columns, (range(5),))
         self.assert2DIterableEqual(Matrix(range(6), (2, 3)).columns, ((0, 3), (1, 4), (2, 5)))
 
+    def test_lu(self) -> None:
+        m = rows(((2, 1, 1), (4, -6, 0), (-2, 7, 2)))
+
+        self.assertIs(m.lu, m.lu)
+        self.assertFalse(m.lu.is_singular())
+        self.assertTrue(rows(((1, 2), (2, 4))).lu.is_singular())
+        self.assertTrue(rows(((1, 2), (2, 4))).packed.lu.is_singular())
+        self.assertRaises(DimensionError, lambda: row(range(3)).lu)
+
+    def test_cholesky(self) -> None:
+        a = random_matrix(6, 4)
+        m = a ** 'T' * a + identity_matrix(4)
+        b, c = random_vector(4), random_matrix(4, 3)
+
+        for n in (m, m.packed):
+            lower = n.cholesky.lower
+
+            self.assertIs(n.cholesky, n.cholesky)
+            self.assertEqual(lower.is_packed(), n.is_packed())
+            self.assertIterableAlmostEqual(lower * lower ** 'T', m)
+            self.assertTrue(all(not lower[i_, j_] for i_ in range(4) for j_ in range(i_ + 1, 4)))
+            self.assertIterableAlmostEqual(n.cholesky.solve(b), m.solve(b))
+            self.assertIterableAlmostEqual(n.cholesky.solve(c), m.solve(c))
+            self.assertRaises(DimensionError, n.cholesky.solve, random_vector(3))
+
+        for n in (rows(((1, 2), (2, 1))), rows(((1, 2), (2, 1))).packed):
+            self.assertRaises(SingularityError, lambda: n.cholesky)
+
+        self.assertRaises(DimensionError, lambda: row(range(3)).cholesky)
+
+    def test_qr(self) -> None:
+        for m in (random_matrix(7, 4), random_matrix(4, 7), random_matrix(5), rows(((0, 1), (0, 2), (0, 0)))):
+            for n in (m, m.packed):
+                q, r = n.qr.q, n.qr.r
+                k = min(m.dimensions)
+
+                self.assertIs(n.qr, n.qr)
+                self.assertEqual(q.dimensions, (m.row_dimension, k))
+                self.assertEqual(r.dimensions, (k, m.column_dimension))
+                self.assertIterableAlmostEqual(q * r, m)
+                self.assertIterableAlmostEqual(q ** 'T' * q, identity_matrix(k))
+                self.assertTrue(all(not r[i_, j_] for i_ in range(k) for j_ in range(i_)))
+
+        self.assertTrue(rows(((0, 1), (0, 2), (0, 0))).qr.is_rank_deficient())
+        self.assertTrue(random_matrix(2, 3).qr.is_rank_deficient())
+        self.assertFalse(random_matrix(3, 2).packed.qr.is_rank_deficient())
+
+    def test_lstsq(self) -> None:
+        a, b, c = random_matrix(40, 3), random_vector(40), random_matrix(40, 2)
+        expected_b = np.linalg.lstsq(np.asarray(a), np.asarray(b), None)[0]
+        expected_c = np.linalg.lstsq(np.asarray(a), np.asarray(c), None)[0].flatten()
+
+        for n in (a, a.packed):
+            self.assertIterableAlmostEqual(lstsq(n, b), expected_b)
+            self.assertIterableAlmostEqual(lstsq(n, b.packed), expected_b)
+            self.assertIterableAlmostEqual(lstsq(n, c), expected_c)
+            self.assertIsInstance(lstsq(n, b), Vector)
+            self.assertEqual(lstsq(n, c).dimensions, (3, 2))
+            self.assertRaises(DimensionError, lstsq, n, random_vector(3))
+
+        m = rows(((1, 2), (3, 4)))
+
+        self.assertIterableAlmostEqual(lstsq(m, vector((5, 6))), m.solve(vector((5, 6))))
+        self.assertRaises(SingularityError, lstsq, rows(((1, 2), (2, 4), (3, 6))), vector((1, 2, 3)))
+        self.assertRaises(SingularityError, lstsq, random_matrix(2, 3), random_vector(2))
+
     def test_determinant(self) -> None:
-        pass  # TODO
+        self.assertEqual(empty_matrix().determinant, 1)
+        self.assertEqual(singleton_matrix(5).determinant, 5)
+        self.assertAlmostEqual(rows(((1, 2), (3, 4))).determinant, -2)
+        self.assertAlmostEqual(rows(((2, 1, 1), (4, -6, 0), (-2, 7, 2))).determinant, -16)
+        self.assertAlmostEqual(rows(((0, 1), (1, 0))).determinant, -1)
+        self.assertAlmostEqual(rows(((1, 2), (2, 4))).determinant, 0)
+        self.assertAlmostEqual(identity_matrix(5).determinant, 1)
+        self.assertAlmostEqual(diagonal_matrix(range(1, 6)).determinant, 120)
+        self.assertAlmostEqual(diagonal_matrix(range(1, 6)).packed.determinant, 120)
+        self.assertAlmostEqual(rows(((0, 1), (1, 0))).packed.determinant, -1)
+        self.assertAlmostEqual(rows(((2, 1, 1), (4, -6, 0), (-2, 7, 2))).packed.determinant, -16)
+
+        for _ in range(10):
+            m = random_matrix(6)
+
+            self.assertAlmostEqual(m.determinant, m.packed.determinant)
+            self.assertAlmostEqual((m * m).determinant, m.determinant ** 2)
+
+        hilbert = rows(tuple(tuple(Fraction(1, i_ + j_ + 1) for j_ in range(6)) for i_ in range(6)))  # type: ignore
+
+        self.assertEqual(hilbert.determinant, Fraction(1, 186313420339200000))
+        self.assertEqual(rows(((10 ** 20, 1), (1, 10 ** 20))).determinant, 10 ** 40 - 1)
+        self.assertIsInstance(rows(((1, 2), (3, 4))).determinant, int)
+        self.assertRaises(DimensionError, lambda: rows(((1, 2, 3), (4, 5, 6))).determinant)
+
+        for dimension in (20, 70):
+            generator = Random(dimension)
+            lower = [[int(i_ == j_) if i_ <= j_ else generator.randint(-9, 9) for j_ in range(dimension)]
+                     for i_ in range(dimension)]
+            upper = [[generator.randint(-9, 9) or 1 if i_ <= j_ else 0 for j_ in range(dimension)]
+                     for i_ in range(dimension)]
+            m = rows(tuple(
+                tuple(sum(lower[i_][k_] * upper[k_][j_] for k_ in range(dimension)) for j_ in range(dimension))
+                for i_ in range(dimension)
+            ))
+
+            self.assertEqual(m.determinant, prod(upper[i_][i_] for i_ in range(dimension)))
+
+    def test_rank(self) -> None:
+        self.assertEqual(empty_matrix().rank, 0)
+        self.assertEqual(zero_matrix(3, 4).rank, 0)
+        self.assertEqual(identity_matrix(4).rank, 4)
+        self.assertEqual(rows((range(3), range(3, 6), range(6, 9))).rank, 2)
+        self.assertEqual(rows((range(3), range(3, 6), range(6, 9))).packed.rank, 2)
+        self.assertEqual(rows(((0, 0, 1), (0, 0, 2), (1, 0, 0))).rank, 2)
+        self.assertEqual(Matrix(range(12), (3, 4)).rank, 2)
+        self.assertEqual(Matrix(range(12), (4, 3)).rank, 2)
+        self.assertEqual(rows(((Fraction(1, 3), Fraction(2, 3)), (1, 2))).rank, 1)  # type: ignore
+        self.assertEqual(rows(((10 ** 30, 1), (10 ** 30 + 1, 1))).rank, 2)
+        self.assertEqual(rows(((1.5, 3), (1, 2))).rank, 1)
+
+    def test_inverse(self) -> None:
+        self.assertIterableAlmostEqual(rows(((1, 2), (3, 4))).inverse, rows(((-2, 1), (1.5, -0.5))))
+        self.assertIterableAlmostEqual(rows(((1, 2), (3, 4))).packed.inverse, rows(((-2, 1), (1.5, -0.5))))
+        self.assertRaises(SingularityError, lambda: rows(((1, 2), (2, 4))).inverse)
+        self.assertRaises(SingularityError, lambda: rows(((1, 2), (2, 4))).packed.inverse)
+
+        for _ in range(10):
+            m = random_matrix(6)
+
+            self.assertIterableAlmostEqual(m * m.inverse, identity_matrix(6))
+            self.assertIterableAlmostEqual(m.packed.inverse * m.packed, identity_matrix(6))
 
     def test_eigenpairs(self) -> None:
-        pass  # TODO
+        for m in (
+                rows(((2, 1), (1, 3))),
+                rows(((0, -1), (1, 0))),
+                rows(((4, 1, 2), (0, 3, 1), (1, 0, 2))),
+                random_matrix(6),
+                random_matrix(6) + random_matrix(6) ** 'T',
+        ):
+            for matrix in (m, m.packed):
+                pairs = tuple(matrix.eigenpairs)
+
+                self.assertEqual(len(pairs), matrix.row_dimension)
+
+                for eigenvalue, eigenvector in pairs:
+                    self.assertAlmostEqual(sum(abs(value) ** 2 for value in eigenvector), 1)
+
+                    for i in range(matrix.row_dimension):
+                        self.assertAlmostEqual(
+                            sum(matrix[i, j] * eigenvector[j] for j in range(matrix.column_dimension)),
+                            eigenvalue * eigenvector[i],
+                        )
+
+        self.assertRaises(DimensionError, lambda: row(range(3)).eigenpairs)
 
     def test_eigenvalues(self) -> None:
-        pass  # TODO
+        self.assertIterableAlmostEqual(rows(((2, 1), (1, 3))).eigenvalues, ((5 + sqrt(5)) / 2, (5 - sqrt(5)) / 2))
+        self.assertIterableAlmostEqual(diagonal_matrix((1, -3, 2)).eigenvalues, (-3, 2, 1))
+        self.assertIterableAlmostEqual(diagonal_matrix((1, -3, 2)).packed.eigenvalues, (-3, 2, 1))
+        self.assertIterableAlmostEqual(rows(((4, 1, 2), (0, 3, 1), (1, 0, 2))).eigenvalues, (
+            4.879385241571817, 2.6527036446661394, 1.4679111137620442,
+        ))
+        self.assertIterableAlmostEqual(sorted(rows(((0, -1), (1, 0))).eigenvalues, key=lambda value: value.imag), (
+            -1j, 1j,
+        ))
 
     def test_eigenvectors(self) -> None:
-        pass  # TODO
+        self.assertTrue(next(diagonal_matrix((1, -3, 2)).eigenvectors).parallel_to(j))
+        self.assertTrue(next(rows(((2, 0), (1, 1))).eigenvectors).parallel_to(vector((1, 1))))
+        self.assertTrue(next(rows(((2, 0), (1, 1))).packed.eigenvectors).parallel_to(vector((1, 1))))
+
+    def test_power_iteration(self) -> None:
+        m = rows(((2, 1, 0), (1, 3, 1), (0, 1, 4)))
+
+        for matrix in (m, m.packed):
+            pairs = tuple(matrix.power_iteration(2))
+
+            self.assertEqual(len(pairs), 2)
+            self.assertIterableAlmostEqual((pair[0] for pair in pairs), tuple(m.eigenvalues)[:2])
+
+            for eigenvalue, eigenvector in pairs:
+                self.assertIterableAlmostEqual(matrix * eigenvector, eigenvalue * eigenvector)
 
     def test_is_square(self) -> None:
         self.assertTrue(zero_matrix(3))
         self.assertTrue(zero_matrix(3, 4))
         self.assertTrue(zero_matrix(4, 3))
 
+    def test_solve(self) -> None:
+        m = rows(((2, 1, 1), (4, -6, 0), (-2, 7, 2)))
+
+        self.assertIterableAlmostEqual(m.solve(vector((5, -2, 9))), (1, 1, 2))
+        self.assertIterableAlmostEqual(m.packed.solve(vector((5, -2, 9))), (1, 1, 2))
+        self.assertIterableAlmostEqual(m.solve(columns(((5, -2, 9), (4, 4, 2)))), columns(((1, 1, 2), (1, 0, 2))))
+        self.assertIterableAlmostEqual(
+            m.packed.solve(columns(((5, -2, 9), (4, 4, 2)))), columns(((1, 1, 2), (1, 0, 2))))
+        self.assertIsInstance(m.solve(vector((5, -2, 9))), Vector)
+        self.assertIsInstance(m.packed.solve(vector((5, -2, 9))), Vector)
+        self.assertIsInstance(m.solve(column((5, -2, 9))), Matrix)
+        self.assertRaises(DimensionError, m.solve, vector((1, 2)))
+        self.assertRaises(SingularityError, rows(((1, 2), (2, 4))).solve, vector((1, 2)))
+
+        for _ in range(10):
+            a, b = random_matrix(8), random_vector(8)
+
+            self.assertIterableAlmostEqual(a * a.solve(b), b)
+            self.assertIterableAlmostEqual(a.packed * a.packed.solve(b.packed), b)
+
     def test_mul(self) -> None:
         self.assertEqual(
             rows((range(3), range(3, 6))) * rows((range(2), range(2, 4), range(4, 6))), rows(((10, 13), (28, 40))))
@@ -137,12 +532,98 @@ class MatrixTestCase(ExtendedTestCase):
         self.assertRaises(DimensionError, mul, row(range(5)), row(range(5)))
         self.assertRaises(DimensionError, mul, row(range(5)), column(range(6)))
 
+        for dimension in (1, 5, 20):
+            a, b = random_matrix(dimension, dimension + 1), random_matrix(dimension + 1, dimension + 2)
+            u = random_vector(dimension + 1)
+
+            self.assertTrue((a.packed * b.packed).is_packed())
+            self.assertTrue((a.packed * u.packed).is_packed())
+            self.assertIterableAlmostEqual(a.packed * b.packed, a * b)
+            self.assertIterableAlmostEqual(a.packed * u.packed, a * u)
+            self.assertIterableAlmostEqual(a.packed * b, a * b)
+
+        a, b, u = random_matrix(130, 20), random_matrix(20, 30), random_vector(20)
+        c = rows((range(3), range(3, 6)))
+        workers, threshold = get_parallelism()
+        products = []
+
+        try:
+            for workers_ in (1, 3):
+                set_parallelism(workers_, 0)
+                products.append((a * b, a * u, a.packed * b.packed, a.packed * u.packed, a[::2, :] * b, c * c ** 'T'))
+
+            pool = kernels._process_pool
+            d, e = random_matrix(200, 40), random_matrix(40, 30)
+
+            self.assertIsNotNone(pool)
+            self.assertEqual(a * b, products[0][0])
+            self.assertIs(kernels._process_pool, pool)
+            self.assertIterableAlmostEqual(d * e, d.packed * e.packed)
+        finally:
+            set_parallelism(workers, threshold)
+
+        self.assertIsNone(kernels._process_pool)
+
+        self.assertEqual(products[0], products[1])
+        self.assertIterableAlmostEqual(products[0][0], a * b)
+        self.assertIterableAlmostEqual(products[0][2], a * b)
+        self.assertIterableAlmostEqual(products[0][3], a * u)
+        self.assertEqual(products[0][5], rows(((5, 14), (14, 50))))
+        self.assertRaises(ValueError, set_parallelism, 0)
+        self.assertRaises(ValueError, set_parallelism, 1, -1)
+
+        with patch('math2.linear.kernels.STRASSEN_THRESHOLD', 3):
+            for dimension in (6, 7, 12, 13, 25):
+                a, b = random_matrix(dimension).packed, random_matrix(dimension).packed
+
+                self.assertIterableAlmostEqual(a * b, (np.asarray(a) @ np.asarray(b)).flatten())
+
+    def test_lazy(self) -> None:
+        a, b, u = rows(((1, 2), (3, 4))), rows(((5, 6), (7, 8))), vector((1, 1))
+
+        for x in (a, a.packed):
+            self.assertEqual(x.lazy * b, rows(((19, 22), (43, 50))))
+            self.assertEqual(x * b.lazy, rows(((19, 22), (43, 50))))
+            self.assertEqual(x.lazy * b.lazy, rows(((19, 22), (43, 50))))
+            self.assertEqual(x.lazy * u, vector((3, 7)))
+            self.assertIs(type(x.lazy * u), Vec2)
+            self.assertEqual((x.lazy + x) * b, (x + x) * b)
+            self.assertEqual(x.lazy ** 'T', x ** 'T')
+            self.assertEqual(x.lazy ** 2, x * x)
+            self.assertEqual(x.lazy[1, 0], 3)
+            self.assertIsInstance(x.lazy * 2, LazyTensor)
+
     def test_pow(self) -> None:
         self.assertEqual(rows((range(3), range(3, 6))) ** 'T', rows(((0, 3), (1, 4), (2, 5))))
         self.assertEqual(row(range(6)) ** 'T', column(range(6)))
         self.assertEqual(column(range(6)) ** 'T', row(range(6)))
 
-        # TODO: powers and inverses
+        fibonacci = rows(((1, 1), (1, 0)))
+
+        self.assertEqual(fibonacci ** 0, identity_matrix(2))
+        self.assertEqual(fibonacci ** 1, fibonacci)
+        self.assertEqual(fibonacci ** 10, rows(((89, 55), (55, 34))))
+        self.assertEqual(fibonacci.packed ** 10, rows(((89, 55), (55, 34))))
+        self.assertTrue((fibonacci.packed ** 10).is_packed())
+        self.assertIterableAlmostEqual(fibonacci ** -1, rows(((0, 1), (1, -1))))
+        self.assertIterableAlmostEqual(fibonacci ** -3 * fibonacci ** 3, identity_matrix(2))
+        self.assertEqual(pow(fibonacci, 100, 1000000007), rows(tuple(
+            tuple(value % 1000000007 for value in row) for row in (fibonacci ** 100).rows
+        )))
+        self.assertEqual(
+            pow(pow(fibonacci, 10 ** 18, 1000000007) * pow(fibonacci, -10 ** 18, 1000000007), 1, 1000000007),
+            identity_matrix(2),
+        )
+        self.assertEqual(pow(rows(((2, 0), (0, 1))), -1, 7), rows(((4, 0), (0, 1))))
+        self.assertRaises(SingularityError, pow, rows(((2, 0), (0, 1))), -1, 4)
+        self.assertEqual(pow(rows(((2, 3), (3, 2))), -1, 6), rows(((2, 3), (3, 2))))
+        self.assertEqual(
+            pow(pow(rows(((3, 1), (2, 3))), -2, 10) * pow(rows(((3, 1), (2, 3))), 2, 10), 1, 10),
+            identity_matrix(2),
+        )
+        self.assertRaises(SingularityError, pow, rows(((2, 3), (4, 0))), -1, 6)
+        self.assertRaises(DimensionError, pow, row(range(3)), 2)
+        self.assertRaises(TypeError, pow, row(range(3)), 'T', 5)
 
     def test_getitem(self) -> None:
         self.assertIterableEqual(rows((range(3), range(3, 6)))[::-1], reversed(range(6)))
@@ -162,6 +643,582 @@ class MatrixTestCase(ExtendedTestCase):
         self.assertEqual(column(range(6))[:, 0], column(range(6)))
 
 
+class MutableTensorTestCase(ExtendedTestCase):
+    def test_thaw(self) -> None:
+        v = vector(range(5))
+        u = v.thaw()
+
+        self.assertIsInstance(u, MutableVector)
+        self.assertIsInstance(rows(((1, 2), (3, 4))).thaw(), MutableMatrix)
+        self.assertIsInstance(Tensor(range(8), (2, 2, 2)).thaw(), MutableTensor)
+        self.assertIsInstance(sparse_identity_matrix(3).thaw(), MutableMatrix)
+        self.assertEqual(u, v)
+        self.assertRaises(TypeError, hash, u)
+
+        u[0] = 10
+        w = u.freeze()
+        u[1] = 20
+
+        self.assertEqual(v, vector(range(5)))
+        self.assertEqual(w, vector((10, 1, 2, 3, 4)))
+        self.assertEqual(u, vector((10, 20, 2, 3, 4)))
+        self.assertIsInstance(w, Vector)
+        self.assertNotIsInstance(w, MutableTensor)
+
+    def test_iadd(self) -> None:
+        for v in (vector(range(20)), vector(range(20)).packed, vector(range(3)), vector(range(3)).packed):
+            u = v.thaw()
+            u_id = id(u)
+            u += v
+            u -= v * 3
+            u *= 3
+            u /= 2
+
+            self.assertEqual(id(u), u_id)
+            self.assertEqual(u, (v + v - v * 3) * 3 / 2)
+            self.assertEqual(u.is_packed(), v.is_packed())
+            self.assertEqual(v, vector(range(len(v))))
+
+        u = vector(range(3)).thaw()
+
+        self.assertRaises(DimensionError, u.__iadd__, vector(range(4)))
+
+    def test_setitem(self) -> None:
+        m = MutableMatrix(range(12), (3, 4))
+        m[0] = -1
+        m[1, 1] = -2
+        m[-1, ::2] = (-3, -4)
+        m[:, 3] = 0
+        m[10:] = (-5, -6)
+
+        self.assertEqual(m, rows(((-1, 1, 2, 0), (4, -2, 6, 0), (-3, 9, -5, -6))))
+        self.assertRaises(IndexError, m.__setitem__, 12, 0)
+        self.assertRaises(IndexError, m.__setitem__, (3, 0), 0)
+        self.assertRaises(DimensionError, m.__setitem__, (0, slice(None)), (1, 2))
+        self.assertRaises(ValueError, m.__setitem__, (0,), 1)
+
+        t = m ** 'T'
+        m[0, 0] = 100
+
+        self.assertEqual(t[0, 0], -1)
+
+        for n in (MutableMatrix((1, 2, 3, 4), (2, 2)), rows(((1, 2), (3, 4))).packed.thaw()):
+            assert isinstance(n, MutableMatrix)
+            p = n ** 1
+            n[0, 0] = 100
+
+            self.assertIsNot(p, n)
+            self.assertIs(type(p), Matrix)
+            self.assertEqual(p, rows(((1, 2), (3, 4))))
+            self.assertEqual(p.is_packed(), n.is_packed())
+
+        m = MutableMatrix((2, 0, 0, 4), (2, 2))
+
+        self.assertEqual(m.determinant, 8)
+
+        m[0, 0] = 1
+
+        self.assertEqual(m.determinant, 4)
+
+    def test_reads(self) -> None:
+        for m in (MutableMatrix(range(6), (2, 3)), rows((range(3), range(3, 6))).packed.thaw()):
+            assert isinstance(m, MutableMatrix)
+            m[0, 0] = 0
+            values = m._values
+            matrix_rows, matrix_columns, last_row, reshaped = list(m.rows), list(m.columns), m[1, :], m.reshape((3, 2))
+            m[0, 0] = 100
+
+            self.assertIs(m._values, values)
+            self.assertEqual(matrix_rows, [row(range(3)), row(range(3, 6))])
+            self.assertEqual(matrix_columns, [column((0, 3)), column((1, 4)), column((2, 5))])
+            self.assertEqual(last_row, row(range(3, 6)))
+            self.assertEqual(reshaped, rows(((0, 1), (2, 3), (4, 5))))
+            self.assertEqual(m[:, 0], column((100, 3)))
+            self.assertEqual(m.is_packed(), last_row.is_packed())
+
+    def test_lazy(self) -> None:
+        u = vector(range(20)).packed.thaw()
+        expression = u.lazy * 2
+        u *= 0
+
+        self.assertEqual(expression, vector(range(0, 40, 2)))
+
+
+class SparseMatrixTestCase(ExtendedTestCase):
+    def test_init(self) -> None:
+        self.assertEqual(sparse_matrix({(0, 1): 2, (1, 0): 3}, 2), rows(((0, 2), (3, 0))))
+        self.assertEqual(sparse_matrix((((0, 1), 2), ((0, 1), 3)), 2, 3), rows(((0, 5, 0), (0, 0, 0))))
+        self.assertEqual(sparse_matrix({(0, 1): 2, (0, 1 - 1): 0}, 2).entry_count, 1)
+        self.assertRaises(IndexError, sparse_matrix, {(2, 0): 1}, 2)
+        self.assertRaises(DimensionError, SparseMatrix, {}, (2,))
+
+    def test_factories(self) -> None:
+        self.assertEqual(sparse_identity_matrix(4), identity_matrix(4))
+        self.assertEqual(sparse_identity_matrix(4).entry_count, 4)
+        self.assertEqual(sparse_diagonal_matrix((1, 0, 3)), diagonal_matrix((1, 0, 3)))
+        self.assertEqual(sparse_diagonal_matrix((1, 0, 3)).entry_count, 2)
+        self.assertEqual(sparse_zero_matrix(3, 4), zero_matrix(3, 4))
+        self.assertEqual(sparse_zero_matrix(3, 4).entry_count, 0)
+        self.assertEqual(sparse_identity_matrix(50000).entry_count, 50000)
+
+    def test_getitem(self) -> None:
+        m = sparse_matrix({(0, 1): 2, (1, 0): 3, (2, 2): 4}, 3)
+        d = m.dense
+
+        for i in range(3):
+            for j in range(-3, 3):
+                self.assertEqual(m[i, j], d[i, j])
+
+        self.assertEqual(m[5], d[5])
+        self.assertIterableEqual(m[2:7], d[2:7])
+        self.assertEqual(m[1, :], d[1, :])
+        self.assertEqual(m[:, 1], d[:, 1])
+        self.assertEqual(m[::-1, 1:], d[::-1, 1:])
+        self.assertIsInstance(m[::-1, 1:], SparseMatrix)
+        self.assertRaises(IndexError, m.__getitem__, (3, 0))
+        self.assertRaises(IndexError, m.__getitem__, 9)
+
+    def test_rows(self) -> None:
+        m = sparse_matrix({(0, 1): 2, (1, 0): 3, (2, 2): 4}, 3)
+
+        self.assert2DIterableEqual(m.rows, m.dense.rows)
+        self.assert2DIterableEqual(m.columns, m.dense.columns)
+
+    def test_add(self) -> None:
+        m = sparse_matrix({(0, 1): 2, (1, 0): 3, (2, 2): 4}, 3)
+
+        self.assertEqual(m + m, m.dense * 2)
+        self.assertIsInstance(m + m, SparseMatrix)
+        self.assertEqual((m + -m).entry_count, 0)
+        self.assertEqual(m + identity_matrix(3), m.dense + identity_matrix(3))
+        self.assertEqual(identity_matrix(3) + m, m.dense + identity_matrix(3))
+        self.assertEqual(identity_matrix(3) - m, identity_matrix(3) - m.dense)
+        self.assertEqual(m - identity_matrix(3), m.dense - identity_matrix(3))
+        self.assertRaises(DimensionError, add, m, sparse_identity_matrix(2))
+
+    def test_mul(self) -> None:
+        a = sparse_matrix({(0, 1): 2, (1, 0): 3, (2, 2): 4, (2, 0): -1}, 3, 4)
+        b = sparse_matrix({(0, 1): 5, (3, 0): 1, (2, 1): -2}, 4, 2)
+        u = vector(range(4))
+
+        self.assertEqual(a * b, a.dense * b.dense)
+        self.assertIsInstance(a * b, SparseMatrix)
+        self.assertEqual(a * b.dense, a.dense * b.dense)
+        self.assertEqual(a.dense * b, a.dense * b.dense)
+        self.assertEqual(a * u, a.dense * u)
+        self.assertEqual(a * u.packed, a.dense * u)
+        self.assertEqual(a * 3, a.dense * 3)
+        self.assertEqual(3 * a, a.dense * 3)
+        self.assertEqual(a / 2, a.dense / 2)
+        self.assertRaises(DimensionError, mul, a, a)
+        self.assertRaises(DimensionError, mul, a, vector(range(3)))
+
+    def test_pow(self) -> None:
+        a = sparse_matrix({(0, 1): 2, (1, 0): 3, (2, 2): 4, (2, 0): -1}, 3, 4)
+        m = sparse_matrix({(0, 1): 1, (1, 0): 1, (1, 1): 1}, 2)
+
+        self.assertEqual(a ** 'T', a.dense ** 'T')
+        self.assertIsInstance(a ** 'T', SparseMatrix)
+        self.assertEqual(m ** 10, m.dense ** 10)
+        self.assertEqual(m ** 0, identity_matrix(2))
+        self.assertIterableAlmostEqual(m ** -1, m.dense ** -1)
+
+    def test_eq(self) -> None:
+        m = sparse_matrix({(0, 1): 2, (1, 0): 3}, 2)
+
+        self.assertEqual(m, rows(((0, 2), (3, 0))))
+        self.assertEqual(rows(((0, 2), (3, 0))), m)
+        self.assertNotEqual(m, sparse_identity_matrix(2))
+        self.assertEqual(hash(m), hash(rows(((0, 2), (3, 0)))))
+        self.assertAlmostEqual(m.determinant, -6)
+        self.assertIterableAlmostEqual(m.solve(vector((2, 3))), (1, 1))
+
+    def test_generic_operands(self) -> None:
+        m = sparse_matrix({(0, 1): 2.0, (1, 1): 1.0, (2, 0): 3.0}, 3)
+        a = random_matrix(3, seed=0)
+        b = a ** 'T' * a + identity_matrix(3)
+
+        self.assertEqual(m.strides, (3, 1))
+        self.assertIs(type(identity_matrix(3).packed.solve(m)), Matrix)
+        self.assertEqual(identity_matrix(3).packed.solve(m), m)
+        self.assertIterableAlmostEqual(b.packed.cholesky.solve(m), b.packed.solve(m.dense))
+        self.assertIterableAlmostEqual(a.packed.qr.solve(m), a.packed.solve(m.dense))
+        self.assertIs(type((m.lazy + a).evaluate()), Matrix)
+        self.assertEqual((m.lazy + a).evaluate(), m.dense + a)
+        self.assertEqual((-m.lazy).evaluate(), -m.dense)
+
+        with SharedTensor(m) as shared:
+            self.assertIs(type(shared.tensor), Matrix)
+            self.assertEqual(shared.tensor, m)
+
+
+class PersistenceTestCase(ExtendedTestCase):
+    def test_save(self) -> None:
+        m = Matrix(range(6), (2, 3))
+
+        for t in (m, m ** 'T', Tensor(range(24), (2, 3, 4)).packed, vector(())):
+            file = BytesIO()
+            save(t, file)
+            file.seek(0)
+
+            self.assertIterableEqual(np.load(file).flatten(), t)
+
+    def test_load(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'tensor.npy'
+
+            for t in (rows(((1, 2, 3), (4, 5, 6))).packed, Tensor(range(24), (2, 3, 4)), vector(()), Tensor((5,), ())):
+                save(t, path)
+
+                for mmap in (False, True):
+                    u = load(path, mmap)
+
+                    self.assertEqual(u, t)
+                    self.assertIs(type(u), type(t))
+                    self.assertTrue(u.is_packed())
+
+            m = Matrix(range(40), (5, 8)).packed
+            save(m, path)
+            n = load(path, True)
+            assert isinstance(n, Matrix)
+
+            self.assertIsInstance(n._values, memoryview)
+            self.assertEqual(n * vector(range(8)), m * vector(range(8)))
+            self.assertEqual(n[1:3, ::2], m[1:3, ::2])
+            self.assertEqual(n ** 'T', m ** 'T')
+            self.assertEqual(n + n, 2 * m)
+            self.assertEqual(hash(n), hash(m))
+            self.assertAlmostEqual(norm(n), norm(m))
+            self.assertEqual(repr(n), repr(m))
+
+            o = n.thaw()
+            o += m
+
+            self.assertEqual(o, 2 * m)
+            self.assertEqual(n, m)
+
+            np.save(path, np.asfortranarray(np.arange(6.0).reshape(2, 3)))
+
+            self.assertEqual(load(path, True), Matrix(range(6), (2, 3)))
+            self.assertEqual(load(path), Matrix(range(6), (2, 3)))
+
+            np.save(path, np.arange(6, dtype=np.int32))
+
+            self.assertEqual(load(path), vector(range(6)))
+            self.assertRaises(ValueError, load, path, True)
+
+            del n, o
+
+    def test_pickle(self) -> None:
+        m = Matrix(range(6), (2, 3))
+        tensors = (
+            m,
+            m.packed,
+            (m ** 'T').packed,
+            Tensor(range(24), (2, 3, 4)).packed,
+            vector((1, 2, 3)),
+            i.packed,
+            empty_matrix().packed,
+            Tensor((Fraction(1, 3),), ()),  # type: ignore
+            m.packed.thaw(),
+            sparse_matrix({(0, 1): 2.5}, 3),
+            m.lazy + m,
+        )
+
+        for t in tensors:
+            for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+                u = pickle.loads(pickle.dumps(t, protocol))
+
+                self.assertEqual(u, t)
+                self.assertIs(type(u), type(t))
+                self.assertEqual(u.is_packed(), t.is_packed())
+
+        n = random_matrix(100, 100).packed
+        buffers = list[pickle.PickleBuffer]()
+        data = pickle.dumps(n, 5, buffer_callback=buffers.append)
+
+        self.assertLess(len(pickle.dumps(n, 5)), 8 * len(n) + 256)
+        self.assertLess(len(data), 256)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(pickle.loads(data, buffers=buffers), n)
+
+        o = n.thaw()
+        p = pickle.loads(pickle.dumps(o, 5, buffer_callback=buffers.append), buffers=buffers[-1:])
+        o[0, 0] = p[0, 0] = inf
+
+        self.assertEqual(n, pickle.loads(data, buffers=buffers[:1]))
+        self.assertEqual(o, p)
+        self.assertNotEqual(o, n)
+
+    def test_shared_tensor(self) -> None:
+        m = random_matrix(50, 40).packed
+
+        with SharedTensor(m) as shared:
+            self.assertEqual(shared.tensor, m)
+            self.assertIsInstance(shared.tensor._values, memoryview)
+            self.assertIs(type(shared.tensor), Matrix)
+
+            attached = pickle.loads(pickle.dumps(shared))
+
+            self.assertEqual(attached.name, shared.name)
+            self.assertEqual(attached.tensor, m)
+
+            attached.close()
+
+            with ProcessPoolExecutor(1) as executor:
+                self.assertEqual(executor.submit(attrgetter('tensor'), shared).result(), m)
+
+        with SharedTensor(vector((1, 2, 3)).thaw()) as shared:
+            v = shared.tensor
+            assert isinstance(v, MutableVector)
+            v[0] = 5
+
+            self.assertEqual(v, vector((5, 2, 3)))
+            self.assertEqual(shared.tensor, vector((1, 2, 3)))
+
+        with SharedTensor(empty_vector()) as shared:
+            self.assertEqual(shared.tensor, empty_vector())
+
+        with patch('sys.unraisablehook') as unraisablehook:
+            with SharedTensor(m) as shared:
+                n = shared.tensor
+                attached_n = pickle.loads(pickle.dumps(shared)).tensor
+
+            del shared
+            gc.collect()
+
+            self.assertEqual(n, m)
+            self.assertEqual(attached_n, m)
+
+            del n, attached_n
+            gc.collect()
+
+            unraisablehook.assert_not_called()
+
+
+class SolverTestCase(ExtendedTestCase):
+    def laplacian(self, n: int) -> SparseMatrix:
+        return sparse_matrix(
+            {(i_, j_): 2 if i_ == j_ else -1 for i_ in range(n) for j_ in range(max(i_ - 1, 0), min(i_ + 2, n))},
+            n,
+        )
+
+    def test_linear_operator(self) -> None:
+        a = LinearOperator(lambda x: 2 * x, (3, 3))
+
+        self.assertEqual(a * vector((1, 2, 3)), vector((2, 4, 6)))
+        self.assertTrue(a.is_square())
+        self.assertRaises(DimensionError, mul, a, vector((1, 2)))
+        self.assertRaises(DimensionError, LinearOperator, lambda x: x, (3,))
+
+    def test_cg(self) -> None:
+        a = self.laplacian(50)
+        x = vector(tuple(sin(i_) for i_ in range(50)))
+        b = a * x
+
+        for operator in (a, Matrix(a, a.dimensions), LinearOperator(a.__mul__, a.dimensions)):
+            result = cg(operator, b)
+
+            self.assertIterableAlmostEqual(result.solution, x, 6)
+            self.assertLessEqual(result.residual, 1e-8 * norm(b))
+            self.assertEqual(result.iteration_count, len(result.residuals) - 1)
+            self.assertLessEqual(result.iteration_count, 50)
+
+        result = cg(a, b, preconditioner=JacobiPreconditioner(a))
+
+        self.assertIterableAlmostEqual(result.solution, x, 6)
+        self.assertIterableAlmostEqual(cg(a, b, x0=x).solution, x)
+        self.assertEqual(cg(a, b, x0=x).iteration_count, 0)
+        self.assertRaises(ConvergenceError, cg, a, b, max_iterations=5)
+        self.assertRaises(DimensionError, cg, a, vector((1, 2)))
+        self.assertRaises(DimensionError, cg, sparse_zero_matrix(2, 3), vector((1, 2)))
+
+    def test_bicgstab(self) -> None:
+        a = self.laplacian(40) + sparse_matrix({(i_, i_ + 1): 0.5 for i_ in range(39)}, 40)
+        x = vector(tuple(sin(i_ + 1) for i_ in range(40)))
+        b = a * x
+
+        for preconditioner in (None, JacobiPreconditioner(a), ILUPreconditioner(a)):
+            result = bicgstab(a, b, preconditioner=preconditioner)
+
+            self.assertIterableAlmostEqual(result.solution, x, 6)
+            self.assertLessEqual(result.residual, 1e-8 * norm(b))
+
+        self.assertLessEqual(bicgstab(a, b, preconditioner=ILUPreconditioner(a)).iteration_count, 2)
+        self.assertRaises(ConvergenceError, bicgstab, a, b, max_iterations=2)
+
+    def test_gmres(self) -> None:
+        a = self.laplacian(40) + sparse_matrix({(i_ + 1, i_): 0.7 for i_ in range(39)}, 40)
+        x = vector(tuple(sin(i_ + 1) for i_ in range(40)))
+        b = a * x
+
+        for operator in (a, Matrix(a, a.dimensions), LinearOperator(a.__mul__, a.dimensions)):
+            for restart in (5, 30, 100):
+                result = gmres(operator, b, restart=restart)
+
+                self.assertIterableAlmostEqual(result.solution, x, 6)
+                self.assertLessEqual(result.residual, 1e-8 * norm(b))
+
+        result = gmres(a, b, preconditioner=ILUPreconditioner(a))
+
+        self.assertIterableAlmostEqual(result.solution, x, 6)
+        self.assertLessEqual(result.iteration_count, 2)
+        self.assertEqual(gmres(a, zero_vector(40)).solution, zero_vector(40))
+        self.assertRaises(ConvergenceError, gmres, a, b, max_iterations=3)
+        self.assertRaises(ValueError, gmres, a, b, restart=0)
+
+    def test_preconditioners(self) -> None:
+        a = self.laplacian(4)
+        r = vector((1, 2, 3, 4))
+
+        self.assertIterableAlmostEqual(JacobiPreconditioner(a).solve(r), (0.5, 1, 1.5, 2))
+        self.assertIterableAlmostEqual(JacobiPreconditioner((1, 2, 4, 8)).solve(r), (1, 1, 0.75, 0.5))
+        self.assertIterableAlmostEqual(a * ILUPreconditioner(a).solve(r), r)
+        self.assertRaises(SingularityError, JacobiPreconditioner, (1, 0))
+        self.assertRaises(SingularityError, ILUPreconditioner, sparse_zero_matrix(2))
+        self.assertRaises(DimensionError, ILUPreconditioner, sparse_zero_matrix(2, 3))
+
+
+class MatrixBatchTestCase(ExtendedTestCase):
+    def test_init(self) -> None:
+        batch = MatrixBatch((rows(((1, 2, 3), (4, 5, 6))), rows(((7, 8, 9), (0, 1, 2)))))
+
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.dimensions, (2, 3))
+        self.assertEqual(np.asarray(batch).shape, (2, 2, 3))
+        self.assertEqual(batch[1], rows(((7, 8, 9), (0, 1, 2))))
+        self.assertEqual(batch[::-1][0], batch[1])
+        self.assertEqual(MatrixBatch(np.asarray(batch)), batch)
+        self.assertEqual(MatrixBatch((), (2, 3)).dimensions, (2, 3))
+        self.assertRaises(DimensionError, MatrixBatch, (((1, 2),), ((1, 2), (3, 4))))
+        self.assertRaises(DimensionError, MatrixBatch, (((1, 2),),), (2, 2))
+
+    def test_mul(self) -> None:
+        random = np.random.default_rng(0)
+
+        for n in range(1, 6):
+            a, b, x = random.normal(size=(7, n, n)), random.normal(size=(7, n, n)), random.normal(size=(7, n))
+            batch = MatrixBatch(a)
+            matrix = MatrixBatch(b)[0]
+
+            self.assertTrue(np.allclose(np.asarray(batch * MatrixBatch(b)), a @ b))
+            self.assertTrue(np.allclose(np.asarray(batch * matrix), a @ b[0]))
+            self.assertTrue(np.allclose(np.asarray(matrix * batch), b[0] @ a))
+            self.assertTrue(np.allclose(np.asarray(batch * VectorBatch(x)).T, np.einsum('kij,kj->ki', a, x)))
+            self.assertTrue(np.allclose(np.asarray(batch * VectorBatch(x)[0]).T, a @ x[0]))
+            self.assertTrue(np.allclose(np.asarray(2 * batch - batch / 2), 1.5 * a))
+
+        batch = MatrixBatch((rows(((1, 2, 3), (4, 5, 6))),))
+
+        self.assertEqual(batch * vector((1, 0, 1)), VectorBatch((vector((4, 10)),)))
+        self.assertEqual(batch ** 'T', MatrixBatch((rows(((1, 4), (2, 5), (3, 6))),)))
+        self.assertRaises(DimensionError, mul, batch, batch)
+        self.assertRaises(DimensionError, mul, batch, MatrixBatch((), (3, 2)))
+        self.assertEqual(
+            MatrixBatch(np.ones((4, 2, 0))) * MatrixBatch(np.ones((4, 0, 3))),
+            MatrixBatch(np.zeros((4, 2, 3))),
+        )
+        self.assertEqual(
+            MatrixBatch(np.ones((4, 0, 2))) * MatrixBatch(np.ones((4, 2, 3))),
+            MatrixBatch(np.zeros((4, 0, 3))),
+        )
+        self.assertEqual(MatrixBatch(np.ones((4, 2, 0))) * empty_matrix(), MatrixBatch(np.zeros((4, 2, 0))))
+        self.assertEqual(MatrixBatch(np.ones((4, 2, 0))) * empty_vector(), VectorBatch(np.zeros((4, 2))))
+        self.assertEqual(MatrixBatch((), (2, 0)) * MatrixBatch((), (0, 3)), MatrixBatch((), (2, 3)))
+
+    def test_determinants(self) -> None:
+        random = np.random.default_rng(0)
+
+        for n in range(1, 6):
+            a = random.normal(size=(9, n, n))
+
+            self.assertIterableAlmostEqual(MatrixBatch(a).determinants, np.linalg.det(a))
+            self.assertTrue(np.allclose(np.asarray(MatrixBatch(a).inverse), np.linalg.inv(a)))
+
+        for n in range(2, 6):
+            a = np.ones((2, n, n))
+
+            self.assertRaises(SingularityError, getattr, MatrixBatch(a), 'inverse')
+
+        self.assertRaises(DimensionError, getattr, MatrixBatch(np.ones((2, 2, 3))), 'determinants')
+        self.assertRaises(DimensionError, getattr, MatrixBatch(np.ones((2, 2, 3))), 'inverse')
+
+
+class VectorBatchTestCase(ExtendedTestCase):
+    def test_init(self) -> None:
+        batch = VectorBatch((vector((1, 2, 3)), vector((4, 5, 6))))
+
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.dimension, 3)
+        self.assertEqual(np.asarray(batch).shape, (3, 2))
+        self.assertEqual(VectorBatch(np.arange(6).reshape(2, 3)), batch - vector((1, 1, 1)))
+        self.assertEqual(len(VectorBatch((), 3)), 0)
+        self.assertEqual(VectorBatch((), 3).dimension, 3)
+        self.assertRaises(DimensionError, VectorBatch, ((1, 2), (3, 4, 5)))
+        self.assertRaises(DimensionError, VectorBatch, ((1, 2),), 3)
+
+    def test_getitem(self) -> None:
+        vectors = vector((1, 2, 3)), vector((4, 5, 6)), vector((7, 8, 9))
+        batch = VectorBatch(vectors)
+
+        self.assertEqual(batch[1], vectors[1])
+        self.assertEqual(batch[-1], vectors[2])
+        self.assertEqual(batch[::2], VectorBatch(vectors[::2]))
+        self.assertIterableEqual(batch, vectors)
+        self.assertEqual(batch.x, vector((1, 4, 7)))
+        self.assertEqual(batch.z, vector((3, 6, 9)))
+        self.assertEqual(batch.w, vector((0, 0, 0)))
+
+    def test_arithmetic(self) -> None:
+        vectors = vector((1, 2, 3)), vector((4, -5, 6))
+        others = vector((0, 1, 0)), vector((2, 2, -1))
+        batch, other_batch = VectorBatch(vectors), VectorBatch(others)
+
+        self.assertEqual(batch + other_batch, VectorBatch(map(add, vectors, others)))
+        self.assertEqual(batch - other_batch, VectorBatch(u - v for u, v in zip(vectors, others)))
+        self.assertEqual(batch + i, VectorBatch(u + i for u in vectors))
+        self.assertEqual(i + batch, VectorBatch(i + u for u in vectors))
+        self.assertEqual(i - batch, VectorBatch(i - u for u in vectors))
+        self.assertEqual(-batch, VectorBatch(-u for u in vectors))
+        self.assertEqual(2 * batch, VectorBatch(2 * u for u in vectors))
+        self.assertEqual(batch / 2, VectorBatch(u / 2 for u in vectors))
+        self.assertEqual(batch * vector((2, 3)), VectorBatch((2 * vectors[0], 3 * vectors[1])))
+        self.assertRaises(DimensionError, add, batch, VectorBatch(vectors[:1]))
+        self.assertRaises(DimensionError, add, batch, vector((1, 2)))
+
+    def test_dot(self) -> None:
+        vectors = vector((1, 2, 3)), vector((4, -5, 6))
+        others = vector((0, 1, 0)), vector((2, 2, -1))
+        batch = VectorBatch(vectors)
+
+        self.assertEqual(batch @ VectorBatch(others), vector(tuple(map(matmul, vectors, others))))
+        self.assertEqual(batch @ j, vector((2, -5)))
+        self.assertEqual(j @ batch, vector((2, -5)))
+        self.assertTrue(batch.dot(j).is_packed())
+        self.assertIterableAlmostEqual(batch.norms, tuple(map(abs, vectors)))
+        self.assertIterableAlmostEqual(batch.unit.norms, (1, 1))
+        self.assertEqual(VectorBatch((i, j, i + j)).orthogonal_to(k), (True, True, True))
+        self.assertEqual(VectorBatch((i, 2 * i, j)).parallel_to(-i), (True, True, False))
+        self.assertIterableAlmostEqual(VectorBatch((i, j, -i)).angle_between(i), (0, pi / 2, pi))
+
+    def test_cross(self) -> None:
+        vectors = vector((1, 2, 3)), vector((4, -5, 6))
+        others = vector((0, 1, 0)), vector((2, 2, -1))
+
+        self.assertEqual(
+            VectorBatch(vectors).cross(VectorBatch(others)),
+            VectorBatch(map(Vector.cross, vectors, others)),
+        )
+        self.assertEqual(VectorBatch(vectors).cross(k), VectorBatch(u.cross(k) for u in vectors))
+        self.assertEqual(VectorBatch((vector((1, 2)),)).cross(vector((3, 4))), VectorBatch((vector((0, 0, -2)),)))
+        self.assertRaises(DimensionError, VectorBatch((vector((1, 2, 3, 4)),)).cross, vector((1, 2, 3, 4)))
+
+    def test_projection_on(self) -> None:
+        vectors = vector((1, 2, 3)), vector((4, -5, 6))
+
+        self.assertEqual(VectorBatch(vectors).projection_on(j), VectorBatch(u.projection_on(j) for u in vectors))
+
+
 class VectorTestCase(ExtendedTestCase):
     def test_dimension(self) -> None:
         self.assertEqual(empty_vector().dimension, 0)
@@ -257,6 +1314,77 @@ class VectorTestCase(ExtendedTestCase):
         self.assertIterableAlmostEqual(vector((100, 100, 100)).projection_on(j), vector((0, 100, 0)))
         self.assertIterableAlmostEqual(vector((100, 100, 100)).projection_on(k), vector((0, 0, 100)))
 
+    def test_fixed_dimensions(self) -> None:
+        self.assertIs(type(vector((1, 2))), Vec2)
+        self.assertIs(type(vector((1, 2, 3))), Vec3)
+        self.assertIs(type(vector((1, 2, 3, 4))), Vec4)
+        self.assertIs(type(vector((1,))), Vector)
+        self.assertIs(type(vector(range(5))), Vector)
+        self.assertIs(type(random_vector(3)), Vec3)
+        self.assertIs(type(identity_matrix(3) * i), Vec3)
+        self.assertIs(type(i.thaw().freeze()), Vec3)
+        self.assertIs(type(vector((1, 2)).cross(vector((3, 4)))), Vec3)
+
+        for m in (rows(((2, 1, 0), (1, 3, 1), (0, 1, 4))), random_matrix(4, 3)):
+            for n in (m, m.packed):
+                for b in (vector(range(m.row_dimension)), Vector(range(m.row_dimension), (m.row_dimension,))):
+                    if n.is_square():
+                        self.assertIs(type(n.lu.solve(b)), Vec3)
+                        self.assertIs(type(n.cholesky.solve(b)), Vec3)
+
+                    self.assertIs(type(n.qr.solve(b)), Vec3)
+                    self.assertIs(type(n.qr.solve(b.packed)), Vec3)
+                    self.assertIs(type(n.qr.solve(MutableVector(b, b.dimensions))), Vec3)
+
+        u = vector((1, 2, 3))
+
+        for m in (rows(((2, 1, 0), (1, 3, 1), (0, 1, 4))), rows(((1, 2, 3), (0, 4, 5), (0, 0, 6)))):
+            for n in (m, m.packed):
+                self.assertTrue(all(type(eigenvector) is Vec3 for eigenvector in n.eigenvectors))
+                self.assertIs(type(next(n.power_iteration())[1]), Vec3)
+                self.assertIs(type(chain_multiply(n, n, u)), Vec3)
+
+        for solve in (cg, bicgstab, gmres):
+            self.assertIs(type(solve(rows(((2, 1, 0), (1, 3, 1), (0, 1, 4))), u).solution), Vec3)
+
+        self.assertIs(type(sparse_identity_matrix(3) * u), Vec3)
+        self.assertIs(type(sparse_identity_matrix(3) * u.packed), Vec3)
+        self.assertIs(type(VectorBatch((u, u)).norms), Vec2)
+        self.assertIs(type(norms(VectorBatch((u, u, u)))), Vec3)
+        self.assertIs(type(MatrixBatch((identity_matrix(2),) * 4).determinants), Vec4)
+
+        self.assertEqual(Vec3((1, 2, 3)), vector((1, 2, 3)))
+        self.assertEqual(vector((1, 2, 3, 4)).w, 4)
+        self.assertEqual(vector((1, 2)).z, 0)
+        self.assertRaises(DimensionError, Vec3, (1, 2))
+        self.assertRaises(DimensionError, Vec2, (1, 2), (1, 2))
+
+        for dimension in range(2, 5):
+            for packed in (False, True):
+                u, v = random_vector(dimension), random_vector(dimension)
+                generic_u, generic_v = Vector(u, (dimension,)), Vector(v, (dimension,))
+
+                if packed:
+                    u, v, generic_u, generic_v = u.packed, v.packed, generic_u.packed, generic_v.packed
+
+                self.assertEqual(u + v, generic_u + generic_v)
+                self.assertEqual(u - v, generic_u - generic_v)
+                self.assertEqual(u * v, generic_u * generic_v)
+                self.assertEqual(2 * u, 2 * generic_u)
+                self.assertEqual(u / 2, generic_u / 2)
+                self.assertEqual(-u, -generic_u)
+                self.assertEqual(u @ v, generic_u @ generic_v)
+                self.assertEqual(abs(u), abs(generic_u))
+                self.assertIterableAlmostEqual(u.unit, generic_u.unit)
+                self.assertAlmostEqual(u.angle_between(v), generic_u.angle_between(generic_v))
+                self.assertEqual((u + v).is_packed(), packed)
+                self.assertEqual((u * 2.0).is_packed(), packed)
+                self.assertIs(type(u + generic_v), type(u))
+
+                if dimension == 3:
+                    self.assertEqual(u.cross(v), generic_u.cross(generic_v))
+                    self.assertEqual(u.cross(v).is_packed(), packed)
+
 
 class FactoryTestCase(ExtendedTestCase):
     def test_row(self) -> None:
@@ -333,9 +1461,19 @@ class FactoryTestCase(ExtendedTestCase):
         self.assertEqual(random_matrix(5).dimensions, (5, 5))
         self.assertEqual(random_matrix(5, 1).dimensions, (5, 1))
         self.assertEqual(random_matrix(1, 5).dimensions, (1, 5))
+        self.assertEqual(random_matrix(4, 3, seed=0), random_matrix(4, 3, seed=0))
+        self.assertNotEqual(random_matrix(4, 3, seed=0), random_matrix(4, 3, seed=1))
+        self.assertTrue(all(0 <= value < 1 for value in random_matrix(20, seed=0)))
+        self.assertTrue(any(value < 0 for value in random_matrix(20, seed=0, distribution='normal')))
+        self.assertAlmostEqual(random_matrix(200, seed=0, distribution='normal').mean(), 0, 1)
+        self.assertFalse(random_matrix(3).is_packed())
+        self.assertRaises(ValueError, random_matrix, 3, distribution='exponential')
 
     def test_random_vector(self) -> None:
         self.assertEqual(random_vector(5).dimensions, (5,))
+        self.assertEqual(random_vector(5, seed=2), random_vector(5, seed=2))
+        self.assertTrue(any(value < 0 for value in random_vector(20, seed=2, distribution='normal')))
+        self.assertIterableEqual(random_vector(6, seed=3), random_matrix(2, 3, seed=3))
 
     def test_diagonal_matrix(self) -> None:
         self.assertEqual(diagonal_matrix(()), empty_matrix())
@@ -358,6 +1496,52 @@ class FactoryTestCase(ExtendedTestCase):
             (0, 0, 0, 0, 1),
         )))
         self.assertEqual(identity_matrix(1), singleton_matrix(1))
+        self.assertIsInstance(identity_matrix(3)[1, 1], int)
+        self.assertEqual(identity_matrix(3).determinant, 1)
+
+    def test_outer(self) -> None:
+        u, v = vector((1, 2, 3)), vector((4, 5))
+
+        self.assertEqual(outer(u, v), rows(((4, 5), (8, 10), (12, 15))))
+        self.assertEqual(outer(u.packed, v.packed), outer(u, v))
+        self.assertTrue(outer(u.packed, v.packed).is_packed())
+        self.assertEqual(outer(u, empty_vector()).dimensions, (3, 0))
+
+    def test_kron(self) -> None:
+        a, b = random_matrix(3, 2, seed=0), random_matrix(2, 4, seed=1)
+
+        for c, d in ((a, b), (a.packed, b.packed), ((a ** 'T').packed, b.packed ** 'T')):
+            self.assertIterableAlmostEqual(kron(c, d), np.kron(np.asarray(c), np.asarray(d)).flatten())
+
+        self.assertEqual(kron(a, b).dimensions, (6, 8))
+        self.assertEqual(kron(identity_matrix(2), rows(((1, 2),))), rows(((1, 2, 0, 0), (0, 0, 1, 2))))
+        self.assertEqual(kron(a, empty_matrix()).dimensions, (0, 0))
+
+    def test_block(self) -> None:
+        a, b = rows(((1, 2), (3, 4))), column((5, 6))
+        c, d = row((7, 8)), singleton_matrix(9)
+        expected = rows(((1, 2, 5), (3, 4, 6), (7, 8, 9)))
+
+        self.assertEqual(block(((a, b), (c, d))), expected)
+        self.assertEqual(block(((a.packed, b.packed), (c.packed, d.packed))), expected)
+        self.assertTrue(block(((a.packed, b.packed), (c.packed, d.packed))).is_packed())
+        self.assertEqual(block(((a.packed, b), (c, d.packed))), expected)
+        self.assertEqual(block(((a ** 'T', b), (c, d))), rows(((1, 3, 5), (2, 4, 6), (7, 8, 9))))
+        self.assertEqual(block(((expected[1:, ::2].packed, b), (c, d))), rows(((3, 6, 5), (7, 9, 6), (7, 8, 9))))
+        self.assertEqual(block(((a, sparse_identity_matrix(2)),)), rows(((1, 2, 1, 0), (3, 4, 0, 1))))
+        self.assertEqual(block(()), empty_matrix())
+        self.assertRaises(DimensionError, block, ((a, c),))
+        self.assertRaises(DimensionError, block, ((a, b), (c,)))
+
+    def test_hstack(self) -> None:
+        self.assertEqual(hstack((column((1, 2)), rows(((3, 4), (5, 6))))), rows(((1, 3, 4), (2, 5, 6))))
+        self.assertEqual(hstack((row(()), row((1,)))), row((1,)))
+        self.assertRaises(DimensionError, hstack, (column((1, 2)), column((3,))))
+
+    def test_vstack(self) -> None:
+        self.assertEqual(vstack((row((1, 2)), rows(((3, 4), (5, 6))))), rows(((1, 2), (3, 4), (5, 6))))
+        self.assertEqual(vstack((random_matrix(3, 2).packed,) * 2).dimensions, (6, 2))
+        self.assertRaises(DimensionError, vstack, (row((1, 2)), row((3,))))
 
 
 class UtilTestCase(ExtendedTestCase):
@@ -367,6 +1551,87 @@ class UtilTestCase(ExtendedTestCase):
         self.assertAlmostEqual(norm(vector(range(5))), abs(vector(range(5))))
         self.assertAlmostEqual(norm(identity_matrix(2)), sqrt(2))
 
+        for u in (vector((3, -4, 12) * 7), vector((3, -4, 12) * 7).packed, vector((3, -4)), vector((3, -4)).packed):
+            a = np.asarray(u)
+
+            for p in (1, 2, 3, 0.5, inf):
+                self.assertAlmostEqual(norm(u, p), float(np.linalg.norm(a, p)))
+
+        self.assertEqual(norm(vector((1e200, 1e200))), sqrt(2) * 1e200)
+        self.assertAlmostEqual(norm(vector((1e200,) * 20).packed), sqrt(20) * 1e200, delta=1e186)
+        self.assertAlmostEqual(norm(vector((1e-200,) * 20).packed), sqrt(20) * 1e-200, delta=1e-214)
+        self.assertAlmostEqual(norm(vector((1e200, -1e200)), 3), 2 ** (1 / 3) * 1e200, delta=1e186)
+        self.assertEqual(norm(vector((inf, 1)), 3), inf)
+        self.assertEqual(norm(empty_vector(), inf), 0)
+        self.assertEqual(norm(zero_vector(20).packed, 3), 0)
+        self.assertRaises(ValueError, norm, vector((1, 2)), 0)
+
+    def test_norms(self) -> None:
+        m = Matrix(range(-10, 30), (5, 8))
+
+        for n in (m, m.packed, m[:, ::-1]):
+            a = np.asarray(n)
+
+            for p in (1, 2, 3, inf):
+                for axis in (0, 1, -1):
+                    self.assertIterableAlmostEqual(norms(n, p, axis), np.linalg.norm(a, p, axis))
+
+        self.assertIsInstance(norms(m), Vector)
+        self.assertTrue(norms(m.packed).is_packed())
+        self.assertIterableAlmostEqual(norms(Matrix((1e200,) * 40, (2, 20)).packed), (sqrt(20) * 1e200,) * 2)
+        self.assertIterableAlmostEqual(norms(Tensor(range(24), (2, 3, 4)), 1, 1), (12, 15, 18, 21, 48, 51, 54, 57))
+        self.assertRaises(DimensionError, norms, vector((3, 4)))
+        self.assertRaises(DimensionError, norms, Tensor(range(3), (3,)))
+
+        batch = VectorBatch((vector((3, 4)), vector((-5, 12)), vector((0, 0))))
+
+        self.assertIterableAlmostEqual(norms(batch), (5, 13, 0))
+        self.assertIterableAlmostEqual(norms(batch, 1), (7, 17, 0))
+        self.assertIterableAlmostEqual(norms(batch, inf), (4, 12, 0))
+
+    def test_chain_multiply(self) -> None:
+        a, b, c, d = random_matrix(30, 35), random_matrix(35, 15), random_matrix(15, 5), random_matrix(5, 10)
+        u, v = random_vector(30), random_vector(10)
+
+        self.assertEqual(_chain_plan((30, 35, 15, 5, 10, 20, 25)), ((0, (1, 2)), ((3, 4), 5)))
+
+        product = chain_multiply(a, b, c.packed, d)
+        assert isinstance(product, Matrix)
+
+        self.assertIterableAlmostEqual(product, a * b * c * d)
+
+        product = chain_multiply(a.packed, b, c, d, v)
+        assert isinstance(product, Vector)
+
+        self.assertIterableAlmostEqual(product, a * (b * (c * (d * v))))
+
+        product = chain_multiply(u, a, b)
+        assert isinstance(product, Vector)
+
+        self.assertIterableAlmostEqual(product, row(u) * a * b)
+
+        product = chain_multiply(u, a, b, c, d, v)
+        assert isinstance(product, float)
+
+        self.assertAlmostEqual(product, u @ (a * b * c * d * v))
+        self.assertEqual(chain_multiply(a), a)
+        self.assertEqual(chain_multiply(v), v)
+        self.assertRaises(DimensionError, chain_multiply, a, c)
+        self.assertRaises(DimensionError, chain_multiply, a, v)
+        self.assertRaises(ValueError, chain_multiply)
+        self.assertRaises(ValueError, chain_multiply, a, 2)
+
+    def test_normalized(self) -> None:
+        m = rows(((3, 4), (0, 0), (-5, 12)))
+
+        for n in (m, m.packed):
+            self.assertIterableAlmostEqual(normalized(n), (0.6, 0.8, 0, 0, -5 / 13, 12 / 13))
+            self.assertIterableAlmostEqual(normalized(n, 1, 0), (3 / 8, 0.25, 0, 0, -5 / 8, 0.75))
+            self.assertIsInstance(normalized(n), Matrix)
+            self.assertEqual(normalized(n).is_packed(), n.is_packed())
+
+        self.assertIterableAlmostEqual(normalized(vector((3, 4))), (0.6, 0.8))
+
 
 if __name__ == '__main__':
     main()
@@ -36,6 +36,11 @@ class PS1TestCase(ExtendedTestCase):
         self.assertIterableAlmostEqual(field.intensity(zero_vector(3)), repeat(8.987551792261172, 3))
         self.assertIterableAlmostEqual(field.intensity(vector((0, 0, 100))), (0, 0, -0.0027142443154663546), 4)
 
+    def test_empty_field(self) -> None:
+        field = ElectrostaticField()
+        self.assertEqual(field.intensity(vector((1, 2, 3))), zero_vector(3))
+        self.assertEqual(field.force(DiscreteCharge(vector((1, 0)), 1)), zero_vector(2))
+
 
 if __name__ == '__main__':
     main()